@@ -0,0 +1,48 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Fixtures for the micro-benchmarks.
+
+The micro-benchmarks use ``pytest-benchmark``. They are not collected when
+running the unit tests, and are run with ``tox -e benchmark``.
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+from ansys.tools.local_product_launcher import config
+
+# Make the test launcher and the mock plugin fixtures from the unit tests,
+# and the helpers of the transport benchmark importable.
+sys.path.insert(0, str(pathlib.Path(__file__).parents[2] / "tests"))
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+
+from mock_plugins import monkeypatch_entrypoints_from_plugins  # noqa: E402, F401
+
+
+@pytest.fixture(autouse=True)
+def reset_config(monkeypatch, tmp_path):
+    """Use an empty configuration file for each benchmark."""
+    monkeypatch.setenv("ANSYS_LAUNCHER_CONFIG_PATH", str(tmp_path / "config.json"))
+    config._reset_config()
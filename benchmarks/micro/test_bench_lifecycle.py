@@ -0,0 +1,89 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarks of channel creation and the product instance lifecycle."""
+
+import pathlib
+import shutil
+import tempfile
+
+import pytest
+from transport_benchmark import generate_certificates
+
+from ansys.tools.local_product_launcher import launch_product
+from ansys.tools.local_product_launcher.grpc_transport import (
+    InsecureOptions,
+    MTLSOptions,
+    UDSOptions,
+)
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+PRODUCT_NAME = "BenchmarkProduct"
+LAUNCH_MODE = "direct"
+
+
+@pytest.mark.parametrize(
+    "transport_options",
+    [
+        pytest.param(UDSOptions(uds_service="benchmark", uds_dir=tempfile.gettempdir()), id="uds"),
+        pytest.param(InsecureOptions(port=50051), id="insecure"),
+    ],
+)
+@pytest.mark.filterwarnings("ignore:Starting gRPC client without TLS")
+def test_create_channel(benchmark, transport_options):
+    def create_and_close_channel():
+        transport_options.create_channel().close()
+
+    benchmark(create_and_close_channel)
+
+
+@pytest.fixture(scope="module")
+def certs_dir(tmp_path_factory):
+    if shutil.which("openssl") is None:
+        pytest.skip("The 'openssl' command is not available.")
+    res = tmp_path_factory.mktemp("certs")
+    generate_certificates(res)
+    return res
+
+
+def test_create_mtls_channel(benchmark, certs_dir):
+    transport_options = MTLSOptions(port=50051, certs_dir=certs_dir)
+
+    def create_and_close_channel():
+        transport_options.create_channel().close()
+
+    benchmark(create_and_close_channel)
+
+
+def test_launch_wait_stop(benchmark, monkeypatch_entrypoints_from_plugins, tmp_path):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    launcher_config = SimpleLauncherConfig()
+    launcher_config.transport_options = UDSOptions(
+        uds_service="simple_test_service", uds_dir=pathlib.Path(tmp_path)
+    )
+
+    def launch_wait_stop():
+        server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=launcher_config)
+        server.wait(timeout=30)
+        server.stop()
+
+    benchmark.pedantic(launch_wait_stop, rounds=5, warmup_rounds=1)
@@ -0,0 +1,74 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmarks of plugin discovery and configuration handling."""
+
+import dataclasses
+
+import pytest
+
+from ansys.tools.local_product_launcher import _plugins, config
+from ansys.tools.local_product_launcher.interface import ServerType
+
+
+@dataclasses.dataclass
+class MockConfig:
+    int_value: int = 1
+    str_value: str = "value"
+
+
+class MockLauncher:
+    CONFIG_MODEL = MockConfig
+    SERVER_SPEC = {"main": ServerType.GENERIC}
+
+
+def _get_plugins(num_products: int):
+    return {f"product{i}": {"direct": MockLauncher} for i in range(num_products)}
+
+
+@pytest.mark.parametrize("num_entry_points", [1, 50, 500])
+def test_get_all_plugins(benchmark, monkeypatch_entrypoints_from_plugins, num_entry_points):
+    monkeypatch_entrypoints_from_plugins(_get_plugins(num_entry_points))
+    res = benchmark(_plugins.get_all_plugins)
+    assert len(res) == num_entry_points
+
+
+@pytest.mark.parametrize("num_products", [1, 50, 500])
+def test_save_config(benchmark, monkeypatch_entrypoints_from_plugins, num_products):
+    monkeypatch_entrypoints_from_plugins(_get_plugins(num_products))
+    for product_name in _get_plugins(num_products):
+        config.set_config_for(product_name=product_name, launch_mode="direct", config=MockConfig())
+    benchmark(config.save_config)
+
+
+@pytest.mark.parametrize("num_products", [1, 50, 500])
+def test_load_config(benchmark, monkeypatch_entrypoints_from_plugins, num_products):
+    monkeypatch_entrypoints_from_plugins(_get_plugins(num_products))
+    for product_name in _get_plugins(num_products):
+        config.set_config_for(product_name=product_name, launch_mode="direct", config=MockConfig())
+    config.save_config()
+
+    def load_config():
+        config._reset_config()
+        return config.get_config_for(product_name=f"product{num_products - 1}", launch_mode=None)
+
+    assert benchmark(load_config) == MockConfig()
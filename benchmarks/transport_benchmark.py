@@ -0,0 +1,305 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark of the gRPC transport modes.
+
+This script starts a stand-in gRPC server (``transport_benchmark_server.py``)
+for each transport mode, and measures the latency of unary calls and the
+throughput of server-streaming calls for several message sizes and channel
+options. The channels are created with the same transport options classes
+the launchers use, such that regressions in channel creation are covered.
+
+The results are written as JSON, to standard output or the file given
+with ``--output``.
+
+The mTLS transport uses certificates from a local CA, generated with the
+``openssl`` command line tool. If it is not available, the mTLS transport
+is skipped.
+
+Usage::
+
+    python benchmarks/transport_benchmark.py --output results.json
+"""
+
+import argparse
+from collections.abc import Iterator
+import contextlib
+import datetime
+import json
+import os
+import pathlib
+import platform
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+import grpc
+
+from ansys.tools.local_product_launcher.grpc_transport import (
+    InsecureOptions,
+    MTLSOptions,
+    TransportOptionsType,
+    UDSOptions,
+    get_transport_capabilities,
+)
+from ansys.tools.local_product_launcher.helpers.notify import NotifySocket
+from ansys.tools.local_product_launcher.helpers.ports import find_free_ports
+
+SERVER_SCRIPT = pathlib.Path(__file__).parent / "transport_benchmark_server.py"
+SERVICE_NAME = "benchmark.Benchmark"
+STREAM_REQUEST_FORMAT = ">QQ"
+
+TRANSPORT_MODES = ("uds", "insecure", "mtls")
+MESSAGE_SIZES = (64, 4 * 1024, 64 * 1024, 1024 * 1024)
+
+_BASE_CHANNEL_OPTIONS = [("grpc.max_receive_message_length", -1)]
+CHANNEL_OPTIONS: dict[str, list[tuple[str, Any]]] = {
+    "default": [],
+    "no-bdp-probe": [("grpc.http2.bdp_probe", 0)],
+    "write-buffer-1MiB": [("grpc.http2.write_buffer_size", 1024 * 1024)],
+}
+
+
+def generate_certificates(certs_dir: pathlib.Path) -> None:
+    """Generate a local CA, and server and client certificates signed by it.
+
+    The file names match those expected by :class:`.MTLSOptions`.
+    """
+
+    def openssl(*args: str) -> None:
+        subprocess.run(["openssl", *args], cwd=certs_dir, check=True, capture_output=True)
+
+    openssl(
+        "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+        "-keyout", "ca.key", "-out", "ca.crt", "-subj", "/CN=Benchmark CA",
+    )  # fmt: skip
+    for name in ("server", "client"):
+        openssl(
+            "req", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", f"{name}.key", "-out", f"{name}.csr", "-subj", "/CN=localhost",
+        )  # fmt: skip
+        (certs_dir / f"{name}.ext").write_text("subjectAltName=DNS:localhost,IP:127.0.0.1\n")
+        openssl(
+            "x509", "-req", "-in", f"{name}.csr", "-CA", "ca.crt", "-CAkey", "ca.key",
+            "-CAcreateserial", "-days", "1", "-out", f"{name}.crt", "-extfile", f"{name}.ext",
+        )  # fmt: skip
+
+
+@contextlib.contextmanager
+def run_server(transport_mode: str, work_dir: pathlib.Path) -> Iterator[TransportOptionsType]:
+    """Start the stand-in server, and yield the transport options to connect to it."""
+    transport_options: TransportOptionsType
+    if transport_mode == "uds":
+        transport_options = UDSOptions(uds_service="benchmark", uds_dir=work_dir)
+        server_args = [str(work_dir / "benchmark.sock")]
+    elif transport_mode == "insecure":
+        port = find_free_ports()[0]
+        transport_options = InsecureOptions(port=port)
+        server_args = [str(port)]
+    elif transport_mode == "mtls":
+        port = find_free_ports()[0]
+        transport_options = MTLSOptions(port=port, certs_dir=work_dir)
+        server_args = [str(port), str(work_dir)]
+    else:
+        raise ValueError(f"Unsupported transport mode '{transport_mode}'.")
+
+    with NotifySocket() as notify_socket:
+        process = subprocess.Popen(
+            [sys.executable, str(SERVER_SCRIPT), transport_mode, *server_args],
+            env=os.environ | notify_socket.env,
+        )
+        try:
+            if not notify_socket.wait_ready(timeout=30, process=process):
+                raise RuntimeError(f"The benchmark server for '{transport_mode}' did not start.")
+            yield transport_options
+        finally:
+            process.terminate()
+            process.wait()
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def measure_unary(channel: grpc.Channel, message_size: int, iterations: int) -> dict[str, Any]:
+    """Measure the latency of unary calls, in microseconds."""
+    echo = channel.unary_unary(f"/{SERVICE_NAME}/Echo")
+    payload = b"x" * message_size
+    for _ in range(min(iterations, 100)):
+        echo(payload)
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter_ns()
+        echo(payload)
+        latencies.append((time.perf_counter_ns() - start) / 1000)
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "mean_us": statistics.fmean(latencies),
+        "p50_us": _percentile(latencies, 0.5),
+        "p90_us": _percentile(latencies, 0.9),
+        "p99_us": _percentile(latencies, 0.99),
+        "max_us": latencies[-1],
+    }
+
+
+def measure_streaming(
+    channel: grpc.Channel, message_size: int, total_bytes: int, max_messages: int
+) -> dict[str, Any]:
+    """Measure the throughput of a server-streaming call."""
+    stream = channel.unary_stream(f"/{SERVICE_NAME}/Stream")
+    num_messages = min(max(total_bytes // message_size, 1), max_messages)
+    request = struct.pack(STREAM_REQUEST_FORMAT, num_messages, message_size)
+    for _ in stream(struct.pack(STREAM_REQUEST_FORMAT, min(num_messages, 100), message_size)):
+        pass
+    received_bytes = 0
+    start = time.perf_counter()
+    for message in stream(request):
+        received_bytes += len(message)
+    duration = time.perf_counter() - start
+    return {
+        "messages": num_messages,
+        "bytes": received_bytes,
+        "seconds": duration,
+        "messages_per_second": num_messages / duration,
+        "mebibytes_per_second": received_bytes / duration / 1024**2,
+    }
+
+
+def run_benchmarks(
+    *,
+    transport_modes: list[str],
+    message_sizes: list[int],
+    channel_options: list[str],
+    iterations: int,
+    stream_bytes: int,
+    stream_max_messages: int,
+) -> dict[str, Any]:
+    """Run the benchmarks, and return the results in a JSON-serializable form."""
+    results: list[dict[str, Any]] = []
+    skipped: dict[str, str] = {}
+    capabilities = get_transport_capabilities()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = pathlib.Path(tmp_dir)
+        for transport_mode in transport_modes:
+            if transport_mode == "uds" and not capabilities.uds_supported:
+                skipped[transport_mode] = "UDS is not supported on this platform."
+                continue
+            if transport_mode == "mtls":
+                if shutil.which("openssl") is None:
+                    skipped[transport_mode] = "The 'openssl' command is not available."
+                    continue
+                generate_certificates(work_dir)
+            with run_server(transport_mode, work_dir) as transport_options:
+                for options_name in channel_options:
+                    channel = transport_options.create_channel(
+                        grpc_options=_BASE_CHANNEL_OPTIONS + CHANNEL_OPTIONS[options_name]
+                    )
+                    with channel:
+                        grpc.channel_ready_future(channel).result(timeout=30)
+                        for message_size in message_sizes:
+                            results.append(
+                                {
+                                    "transport_mode": transport_mode,
+                                    "channel_options": options_name,
+                                    "message_size": message_size,
+                                    "unary": measure_unary(channel, message_size, iterations),
+                                    "streaming": measure_streaming(
+                                        channel, message_size, stream_bytes, stream_max_messages
+                                    ),
+                                }
+                            )
+    return {
+        "metadata": {
+            "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "platform": platform.platform(),
+            "python_version": platform.python_version(),
+            "grpc_version": grpc.__version__,
+        },
+        "skipped": skipped,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transport-mode",
+        action="append",
+        choices=TRANSPORT_MODES,
+        help="Transport mode to benchmark. Can be given multiple times. Default: all.",
+    )
+    parser.add_argument(
+        "--message-size",
+        action="append",
+        type=int,
+        help="Message size in bytes. Can be given multiple times. "
+        f"Default: {', '.join(str(size) for size in MESSAGE_SIZES)}.",
+    )
+    parser.add_argument(
+        "--channel-options",
+        action="append",
+        choices=list(CHANNEL_OPTIONS),
+        help="Named set of channel options. Can be given multiple times. Default: all.",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=2000, help="Number of unary calls per measurement."
+    )
+    parser.add_argument(
+        "--stream-bytes",
+        type=int,
+        default=64 * 1024**2,
+        help="Total number of bytes streamed per measurement.",
+    )
+    parser.add_argument(
+        "--stream-max-messages",
+        type=int,
+        default=20000,
+        help="Maximum number of messages streamed per measurement.",
+    )
+    parser.add_argument("--output", type=pathlib.Path, help="File to write the JSON results to.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        transport_modes=args.transport_mode or list(TRANSPORT_MODES),
+        message_sizes=args.message_size or list(MESSAGE_SIZES),
+        channel_options=args.channel_options or list(CHANNEL_OPTIONS),
+        iterations=args.iterations,
+        stream_bytes=args.stream_bytes,
+        stream_max_messages=args.stream_max_messages,
+    )
+    output = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.write_text(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Stand-in gRPC server for the transport benchmark.
+
+The server implements two methods on raw bytes, without protobuf
+serialization, such that only the cost of the transport is measured:
+
+- ``/benchmark.Benchmark/Echo``: Unary call returning the request payload.
+- ``/benchmark.Benchmark/Stream``: Server-streaming call. The request is
+  two 8-byte big-endian integers: the number of messages and their size.
+
+Usage::
+
+    python transport_benchmark_server.py uds <uds_file>
+    python transport_benchmark_server.py insecure <port>
+    python transport_benchmark_server.py mtls <port> <certs_dir>
+"""
+
+from concurrent import futures
+import pathlib
+import struct
+import sys
+
+import grpc
+
+from ansys.tools.local_product_launcher.helpers.notify import notify
+
+SERVICE_NAME = "benchmark.Benchmark"
+STREAM_REQUEST_FORMAT = ">QQ"
+
+
+def _echo(request: bytes, context: grpc.ServicerContext) -> bytes:
+    return request
+
+
+def _stream(request: bytes, context: grpc.ServicerContext):
+    num_messages, message_size = struct.unpack(STREAM_REQUEST_FORMAT, request)
+    payload = b"x" * message_size
+    for _ in range(num_messages):
+        yield payload
+
+
+def main(mode: str, *args: str) -> None:
+    """Start the server with the given transport mode, and serve until terminated."""
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        options=[
+            ("grpc.max_receive_message_length", -1),
+            ("grpc.max_send_message_length", -1),
+        ],
+    )
+    server.add_generic_rpc_handlers(
+        [
+            grpc.method_handlers_generic_handler(
+                SERVICE_NAME,
+                {
+                    "Echo": grpc.unary_unary_rpc_method_handler(_echo),
+                    "Stream": grpc.unary_stream_rpc_method_handler(_stream),
+                },
+            )
+        ]
+    )
+    if mode == "uds":
+        server.add_insecure_port(f"unix:{args[0]}")
+    elif mode == "insecure":
+        server.add_insecure_port(f"localhost:{args[0]}")
+    elif mode == "mtls":
+        certs_dir = pathlib.Path(args[1])
+        credentials = grpc.ssl_server_credentials(
+            [((certs_dir / "server.key").read_bytes(), (certs_dir / "server.crt").read_bytes())],
+            root_certificates=(certs_dir / "ca.crt").read_bytes(),
+            require_client_auth=True,
+        )
+        server.add_secure_port(f"localhost:{args[0]}", credentials)
+    else:
+        raise ValueError(f"Unsupported transport mode '{mode}'.")
+    server.start()
+    notify("READY=1")
+    server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -29,8 +29,12 @@ import os
 import subprocess
 import sys
 
-import requests
-
+from ansys.tools.local_product_launcher import events
+from ansys.tools.local_product_launcher.helpers.http import (
+    check_http_health,
+    close_http_connections,
+)
+from ansys.tools.local_product_launcher.helpers.output import OutputCapture
 from ansys.tools.local_product_launcher.helpers.ports import find_free_ports
 from ansys.tools.local_product_launcher.interface import LauncherProtocol, ServerType
 
@@ -61,19 +65,24 @@ class Launcher(LauncherProtocol[LauncherConfig]):
         """Start the HTTP server."""
         port = find_free_ports()[0]
         self._url = f"localhost:{port}"
+        # The server prints this message once it is listening.
+        self._output = OutputCapture(ready_pattern=r"^Serving HTTP on")
         self._process = subprocess.Popen(
             [
                 sys.executable,
+                "-u",
                 "-m",
                 "http.server",
                 "--directory",
                 self._config.directory,
                 str(port),
             ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
+            env=events.child_environment(),
         )
+        self._output.attach(self._process)
 
     def stop(self, *, timeout: float | None = None) -> None:
         """Stop the HTTP server."""
@@ -81,19 +90,27 @@ class Launcher(LauncherProtocol[LauncherConfig]):
         try:
             self._process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
+            events.emit("kill-escalation", timeout=timeout)
             self._process.kill()
             self._process.wait()
+        self._output.close()
+        # The kept-alive connections cannot be reused by the next server.
+        close_http_connections(f"http://{self._url}")
+
+    def wait_ready(self, *, timeout: float) -> bool | None:
+        """Wait until the server reports that it is listening."""
+        return self._output.wait_ready(timeout=timeout)
 
     def check(self, timeout: float | None = None) -> bool:
         """Check if the server is running."""
-        try:
-            # As a simple check, we try to get the main page from the
-            # server. If it is accessible, we the server is running.
-            # If not, we assume it is not running.
-            requests.get(f"http://{self._url}")
-            return True
-        except requests.RequestException:
-            return False
+        # As a simple check, we try to get the main page from the
+        # server. If it is accessible, the server is running.
+        return check_http_health(f"http://{self._url}", timeout=timeout)
+
+    @property
+    def pid(self) -> int | None:
+        """Process ID of the HTTP server."""
+        return self._process.pid
 
     @property
     def urls(self) -> dict[str, str]:
@@ -38,8 +38,10 @@ warnings.warn(
 
 import importlib.metadata
 
-from ansys.tools.common.launcher import config, grpc_transport, helpers, interface, product_instance
-from ansys.tools.common.launcher.launch import launch_product
+from ansys.tools.common.launcher import config
+
+from . import grpc_transport, helpers, interface, product_instance
+from .launch import launch_product, launch_product_async
 
 __version__ = importlib.metadata.version(__name__.replace(".", "-"))
 
@@ -49,5 +51,6 @@ __all__ = [
     "config",
     "product_instance",
     "launch_product",
+    "launch_product_async",
     "grpc_transport",
 ]
@@ -0,0 +1,205 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Benchmark of the launch latency of a product, used by the ``bench`` CLI command."""
+
+from collections.abc import Sequence
+import dataclasses
+import math
+import sys
+import time
+from typing import Any
+
+from ansys.tools.common.exceptions import ProductInstanceError
+from ansys.tools.common.launcher.config import get_launch_mode_for
+
+from . import resources
+from .launch import launch_product
+from .product_instance import ProductInstance
+
+__all__ = ["run_launch_benchmark", "format_benchmark_result"]
+
+PHASES = ("start", "first_healthy", "stop")
+
+_POLL_INTERVAL = 0.01
+
+_PHASE_LABELS = {
+    "start": "start",
+    "first_healthy": "first healthy",
+    "stop": "stop",
+}
+
+
+@dataclasses.dataclass
+class _Run:
+    start: float
+    first_healthy: float
+    stop: float
+    peak_rss_bytes: int | None
+
+
+def run_launch_benchmark(
+    product_name: str,
+    *,
+    launch_mode: str | None,
+    num_cold: int,
+    num_warm: int,
+    timeout: float,
+    sample_interval: float = 0.1,
+) -> dict[str, Any]:
+    """Measure the latency of launching, and optionally relaunching, a product.
+
+    Each cold launch creates a new launcher with :func:`.launch_product`.
+    The warm relaunches restart a single product instance, reusing its launcher.
+
+    Parameters
+    ----------
+    product_name :
+        Name of the product to launch.
+    launch_mode :
+        Launch mode to use. If ``None``, the configured default is used.
+    num_cold :
+        Number of cold launches.
+    num_warm :
+        Number of warm relaunches.
+    timeout :
+        Maximum time in seconds to wait for each launch to become healthy.
+    sample_interval :
+        Time in seconds between samples of the resource usage.
+
+    Returns
+    -------
+    :
+        JSON-serializable benchmark result.
+    """
+    launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
+    previous_sampler = resources.get_resource_sampler()
+    if sys.platform == "linux":
+        resources.enable_resource_sampling(interval=sample_interval)
+    try:
+        cold_runs = []
+        for _ in range(num_cold):
+            start_time = time.monotonic()
+            instance = launch_product(product_name, launch_mode=launch_mode)
+            cold_runs.append(_measure_run(instance, start_time=start_time, timeout=timeout))
+
+        warm_runs = []
+        if num_warm:
+            instance = launch_product(product_name, launch_mode=launch_mode)
+            try:
+                instance.wait(timeout=timeout)
+            finally:
+                instance.stop()
+            for _ in range(num_warm):
+                start_time = time.monotonic()
+                instance.start()
+                warm_runs.append(_measure_run(instance, start_time=start_time, timeout=timeout))
+    finally:
+        resources.set_resource_sampler(previous_sampler)
+
+    return {
+        "product_name": product_name,
+        "launch_mode": launch_mode,
+        "cold": _summarize(cold_runs),
+        "warm": _summarize(warm_runs),
+    }
+
+
+def _measure_run(instance: ProductInstance, *, start_time: float, timeout: float) -> _Run:
+    started_time = time.monotonic()
+    try:
+        _wait_healthy(instance, timeout=timeout)
+        healthy_time = time.monotonic()
+    finally:
+        stop_start_time = time.monotonic()
+        instance.stop()
+    stop_duration = time.monotonic() - stop_start_time
+    summary = instance.resource_summary
+    return _Run(
+        start=started_time - start_time,
+        first_healthy=healthy_time - start_time,
+        stop=stop_duration,
+        peak_rss_bytes=summary.peak_rss_bytes if summary is not None else None,
+    )
+
+
+def _wait_healthy(instance: ProductInstance, *, timeout: float) -> None:
+    # 'ProductInstance.wait' spaces its checks by a fraction of the timeout,
+    # which would dominate the measured time. Poll at a fixed interval instead.
+    deadline = time.monotonic() + timeout
+    while True:
+        remaining = deadline - time.monotonic()
+        if instance.check(timeout=max(remaining, _POLL_INTERVAL), force=True):
+            return
+        if time.monotonic() >= deadline:
+            raise ProductInstanceError(f"The product is not running after {timeout}s.")
+        time.sleep(_POLL_INTERVAL)
+
+
+def _summarize(runs: Sequence[_Run]) -> dict[str, Any]:
+    res: dict[str, Any] = {"runs": len(runs)}
+    if not runs:
+        return res
+    for phase in PHASES:
+        res[phase] = _get_stats([getattr(run, phase) for run in runs])
+    peak_rss = [run.peak_rss_bytes for run in runs if run.peak_rss_bytes is not None]
+    res["peak_rss_bytes"] = _get_stats(peak_rss) if peak_rss else None
+    return res
+
+
+def _get_stats(values: Sequence[float]) -> dict[str, float]:
+    sorted_values = sorted(values)
+    return {
+        "p50": _percentile(sorted_values, 50),
+        "p95": _percentile(sorted_values, 95),
+        "max": sorted_values[-1],
+    }
+
+
+def _percentile(sorted_values: Sequence[float], percent: float) -> float:
+    # Nearest-rank percentile, which is always one of the measured values.
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def format_benchmark_result(result: dict[str, Any]) -> str:
+    """Format the result of :func:`run_launch_benchmark` as a table."""
+    lines = [f"Product: {result['product_name']} (launch mode: {result['launch_mode']})"]
+    for key, title in (("cold", "Cold launches"), ("warm", "Warm relaunches")):
+        summary = result[key]
+        if not summary["runs"]:
+            continue
+        lines.append("")
+        lines.append(f"{title}: {summary['runs']}")
+        lines.append(f"    {'phase':<16}{'p50':>12}{'p95':>12}{'max':>12}")
+        for phase in PHASES:
+            stats = summary[phase]
+            lines.append(
+                f"    {_PHASE_LABELS[phase]:<16}"
+                + "".join(f"{stats[name]:>10.3f} s" for name in ("p50", "p95", "max"))
+            )
+        if summary["peak_rss_bytes"] is not None:
+            stats = summary["peak_rss_bytes"]
+            lines.append(
+                f"    {'peak RSS':<16}"
+                + "".join(f"{stats[name] / 1024**2:>8.1f} MiB" for name in ("p50", "p95", "max"))
+            )
+    return "\n".join(lines)
@@ -31,8 +31,267 @@ warnings.warn(
     DeprecationWarning,
 )
 
-from ansys.tools.common.launcher._cli import build_cli
+import json
+import pathlib
+import sys
+from typing import Any
+
+from ansys.tools.common.launcher._cli import build_cli as _build_common_cli
 from ansys.tools.common.launcher._plugins import get_all_plugins
+import click
+
+from . import _config_transfer, _detached
+from ._bench import format_benchmark_result, run_launch_benchmark
+from ._doctor import format_diagnostics, run_diagnostics
+
+
+def build_cli(plugins: dict[str, dict[str, Any]]) -> click.Group:
+    """Build the CLI from the plugins."""
+    _cli = _build_common_cli(plugins)
+
+    @_cli.command()
+    @click.argument("product_name", type=click.Choice(sorted(plugins)))
+    @click.option(
+        "--launch-mode", default=None, help="Launch mode to use. Defaults to the configured one."
+    )
+    @click.option(
+        "--cold", "num_cold", default=5, show_default=True, help="Number of cold launches."
+    )
+    @click.option(
+        "--warm",
+        "num_warm",
+        default=0,
+        show_default=True,
+        help="Number of warm relaunches of a single instance.",
+    )
+    @click.option(
+        "--timeout",
+        default=60.0,
+        show_default=True,
+        help="Time in seconds to wait for each launch to become healthy.",
+    )
+    @click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["text", "json"]),
+        default="text",
+        show_default=True,
+        help="Output format.",
+    )
+    def bench(
+        product_name: str,
+        launch_mode: str | None,
+        num_cold: int,
+        num_warm: int,
+        timeout: float,
+        output_format: str,
+    ) -> None:
+        """Measure the launch latency of a product.
+
+        The product is launched with its configured options. For each launch,
+        the time to start the product, the time until it is first healthy
+        (measured from the start of the launch), and the time to stop it are
+        recorded. On Linux, the peak memory usage of the product is also
+        recorded.
+
+        Cold launches each create a new launcher instance. Warm relaunches
+        restart a single product instance.
+        """
+        try:
+            result = run_launch_benchmark(
+                product_name,
+                launch_mode=launch_mode,
+                num_cold=num_cold,
+                num_warm=num_warm,
+                timeout=timeout,
+            )
+        except Exception as exc:
+            raise click.ClickException(f"Launching '{product_name}' failed: {exc}") from exc
+        if output_format == "json":
+            click.echo(json.dumps(result, indent=2))
+        else:
+            click.echo(format_benchmark_result(result))
+
+    @_cli.group()
+    def config() -> None:
+        """Export or import the configuration of all products at once.
+
+        The configuration is written and read as JSON or TOML, with the
+        same structure as the configuration file. This allows provisioning
+        many machines with a single command, instead of configuring each
+        product and launch mode separately.
+        """
+
+    @config.command("export")
+    @click.option(
+        "--output",
+        "-o",
+        type=click.Path(dir_okay=False, path_type=pathlib.Path),
+        default=None,
+        help="File to write the configuration to. Defaults to the standard output.",
+    )
+    @click.option(
+        "--format",
+        "file_format",
+        type=click.Choice(_config_transfer.FORMATS),
+        default=None,
+        help="File format. Defaults to the file extension of the output, or JSON.",
+    )
+    def config_export(output: pathlib.Path | None, file_format: str | None) -> None:
+        """Export the configuration of all products.
+
+        Options which are not set (``None``) are omitted from TOML output.
+        """
+        text = _config_transfer.dump_config(
+            _config_transfer.export_config(), file_format=_get_file_format(output, file_format)
+        )
+        if output is None:
+            click.echo(text, nl=False)
+        else:
+            output.write_text(text)
+
+    @config.command("import")
+    @click.argument(
+        "input_file", type=click.Path(dir_okay=False, allow_dash=True, path_type=pathlib.Path)
+    )
+    @click.option(
+        "--format",
+        "file_format",
+        type=click.Choice(_config_transfer.FORMATS),
+        default=None,
+        help="File format. Defaults to the file extension of the input, or JSON.",
+    )
+    @click.option(
+        "--replace",
+        is_flag=True,
+        help="Discard the existing configuration instead of merging into it.",
+    )
+    def config_import(input_file: pathlib.Path, file_format: str | None, replace: bool) -> None:
+        """Import the configuration of products from INPUT_FILE.
+
+        Use ``-`` to read from the standard input. All entries are validated
+        against the configuration models of the installed plugins, and the
+        configuration file is only written if all of them are valid.
+
+        By default, the imported launch modes are merged into the existing
+        configuration, and the default launch mode of each imported product
+        is updated.
+        """
+        if str(input_file) == "-":
+            text = sys.stdin.read()
+            input_path = None
+        else:
+            text = input_file.read_text()
+            input_path = input_file
+        try:
+            data = _config_transfer.load_config_data(
+                text, file_format=_get_file_format(input_path, file_format)
+            )
+            _config_transfer.import_config(data, plugins=plugins, replace=replace)
+        except (ValueError, RuntimeError) as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    @_cli.command()
+    @click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(["text", "json"]),
+        default="text",
+        show_default=True,
+        help="Output format.",
+    )
+    def doctor(output_format: str) -> None:
+        """Diagnose the causes of slow launches on this machine.
+
+        The command reports the filesystem type and latency of the UDS and
+        configuration directories, the transport features supported by
+        the platform and gRPC version, the time and collision rate of port
+        allocation, and the import time of the package and of each plugin.
+        Likely causes of slow launches are listed as findings.
+        """
+        result = run_diagnostics()
+        if output_format == "json":
+            click.echo(json.dumps(result, indent=2))
+        else:
+            click.echo(format_diagnostics(result))
+
+    @_cli.command()
+    @click.argument("product_name", type=click.Choice(sorted(plugins)))
+    @click.option(
+        "--launch-mode", default=None, help="Launch mode to use. Defaults to the configured one."
+    )
+    @click.option(
+        "--count",
+        default=1,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="Number of instances to launch in parallel.",
+    )
+    @click.option(
+        "--timeout",
+        default=60.0,
+        show_default=True,
+        help="Time in seconds to wait for each instance to become ready.",
+    )
+    def launch(product_name: str, launch_mode: str | None, count: int, timeout: float) -> None:
+        """Launch product instances which keep running in the background.
+
+        The state of the instances, including their IDs, URLs, and transport
+        options, is printed as JSON. Use the ``stop`` command to stop them.
+        The command fails if any of the instances could not be launched.
+        """
+        states = _detached.launch_detached(
+            product_name, launch_mode=launch_mode, count=count, timeout=timeout
+        )
+        click.echo(json.dumps(states, indent=2))
+        if any(state["status"] != _detached.STATUS_RUNNING for state in states):
+            raise SystemExit(1)
+
+    @_cli.command()
+    @click.argument("instance_ids", nargs=-1)
+    @click.option(
+        "--check", is_flag=True, help="Check the health of the gRPC servers of each instance."
+    )
+    def status(instance_ids: tuple[str, ...], check: bool) -> None:
+        """Show the state of instances started with the ``launch`` command.
+
+        The state is printed as JSON. If no instance IDs are given, all
+        instances are shown.
+        """
+        click.echo(json.dumps(_detached.get_status(list(instance_ids), check=check), indent=2))
+
+    @_cli.command()
+    @click.argument("instance_ids", nargs=-1)
+    @click.option("--all", "stop_all", is_flag=True, help="Stop all instances.")
+    @click.option(
+        "--timeout",
+        default=60.0,
+        show_default=True,
+        help="Time in seconds to wait for the instances to stop.",
+    )
+    def stop(instance_ids: tuple[str, ...], stop_all: bool, timeout: float) -> None:
+        """Stop instances started with the ``launch`` command.
+
+        The final state of the instances is printed as JSON. The command
+        fails if any of the instances did not stop in time.
+        """
+        if not instance_ids and not stop_all:
+            raise click.UsageError("Specify the IDs of the instances to stop, or '--all'.")
+        states = _detached.stop_detached(list(instance_ids) or None, timeout=timeout)
+        click.echo(json.dumps(states, indent=2))
+        if any(state["status"] == _detached.STATUS_RUNNING for state in states):
+            raise SystemExit(1)
+
+    return _cli
+
+
+def _get_file_format(path: pathlib.Path | None, file_format: str | None) -> str:
+    if file_format is not None:
+        return file_format
+    if path is not None and path.suffix == ".toml":
+        return "toml"
+    return "json"
+
 
 cli = build_cli(plugins=get_all_plugins())  # noqa
 if __name__ == "__main__":
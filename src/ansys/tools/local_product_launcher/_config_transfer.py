@@ -0,0 +1,268 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Bulk export and import of the launch configuration, used by the ``config`` CLI commands.
+
+The exported data has the same structure as the ``config.json`` file:
+
+.. code:: json
+
+    {
+        "<product_name>": {
+            "launch_mode": "<default launch mode>",
+            "configs": {"<launch_mode>": {"<option>": "<value>"}}
+        }
+    }
+"""
+
+import dataclasses
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+from typing import Any, get_type_hints
+
+# The public API of the configuration module only handles one product at a
+# time, so its private functions are used to read and replace the whole
+# configuration. The supported versions of ansys-tools-common are pinned
+# in 'pyproject.toml' accordingly.
+from ansys.tools.common.launcher import config
+
+__all__ = ["FORMATS", "export_config", "dump_config", "load_config_data", "import_config"]
+
+FORMATS = ("json", "toml")
+
+_BARE_KEY_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+_PRODUCT_KEYS = {"launch_mode", "configs"}
+
+
+def export_config() -> dict[str, Any]:
+    """Get the current configuration of all products as JSON-serializable data."""
+    return {
+        product_name: dataclasses.asdict(product_config)
+        for product_name, product_config in config._get_config().items()
+    }
+
+
+def dump_config(data: dict[str, Any], *, file_format: str) -> str:
+    """Serialize configuration data to JSON or TOML.
+
+    Since TOML has no null value, options which are ``None`` are
+    omitted from TOML output.
+    """
+    if file_format == "json":
+        return json.dumps(data, indent=2) + "\n"
+    if file_format == "toml":
+        return _dump_toml(data)
+    raise ValueError(f"Unknown format '{file_format}', must be one of {FORMATS}.")
+
+
+def load_config_data(text: str, *, file_format: str) -> dict[str, Any]:
+    """Parse configuration data from JSON or TOML.
+
+    Parsing TOML requires Python 3.11 or newer, or the ``tomli`` package.
+    """
+    if file_format == "json":
+        data = json.loads(text)
+    elif file_format == "toml":
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            try:
+                import tomli as tomllib
+            except ImportError as exc:
+                raise RuntimeError(
+                    "Reading TOML requires Python 3.11 or newer, or the 'tomli' package."
+                ) from exc
+        data = tomllib.loads(text)
+    else:
+        raise ValueError(f"Unknown format '{file_format}', must be one of {FORMATS}.")
+    if not isinstance(data, dict):
+        raise ValueError("The configuration must be a mapping of product names.")
+    return data
+
+
+def import_config(
+    data: dict[str, Any], *, plugins: dict[str, dict[str, Any]], replace: bool = False
+) -> None:
+    """Validate configuration data and write it to the configuration file.
+
+    All entries are validated against the ``CONFIG_MODEL`` of the
+    corresponding launcher plugin before anything is written. If any entry
+    is invalid, the configuration file is left unchanged. The file is
+    replaced atomically, so that concurrent readers never observe a
+    partially written configuration.
+
+    Parameters
+    ----------
+    data :
+        Configuration data, as returned by :func:`export_config`.
+    plugins :
+        Mapping ``{"<product_name>": {"<launch_mode>": LauncherClass}}`` of
+        the available launcher plugins.
+    replace :
+        Whether to discard the existing configuration. By default, the
+        imported launch modes are merged into the existing configuration,
+        and the default launch mode of each imported product is updated.
+
+    Raises
+    ------
+    ValueError
+        If any entry of the configuration data is invalid. The message
+        lists all invalid entries.
+    """
+    errors: list[str] = []
+    validated = {}
+    for product_name, product_data in data.items():
+        product_config = _validate_product(product_name, product_data, plugins, errors)
+        if product_config is not None:
+            validated[product_name] = product_config
+    if errors:
+        raise ValueError("Invalid configuration:\n" + "\n".join(f"- {err}" for err in errors))
+
+    current = {} if replace else config._get_config()
+    for product_name, product_config in validated.items():
+        if product_name in current:
+            current[product_name].launch_mode = product_config.launch_mode
+            current[product_name].configs.update(product_config.configs)
+        else:
+            current[product_name] = product_config
+    _write_config_atomically(current)
+
+
+def _validate_product(
+    product_name: str, product_data: Any, plugins: dict[str, dict[str, Any]], errors: list[str]
+) -> "config._ProductConfig | None":
+    if product_name not in plugins:
+        errors.append(f"'{product_name}': no plugin is installed for this product.")
+        return None
+    if not isinstance(product_data, dict) or set(product_data) != _PRODUCT_KEYS:
+        errors.append(f"'{product_name}': must contain exactly the keys {sorted(_PRODUCT_KEYS)}.")
+        return None
+    num_errors = len(errors)
+    launch_mode = product_data["launch_mode"]
+    if not isinstance(launch_mode, str):
+        errors.append(f"'{product_name}': the default launch mode must be a string.")
+    elif launch_mode not in plugins[product_name]:
+        errors.append(f"'{product_name}': unknown default launch mode '{launch_mode}'.")
+    if not isinstance(product_data["configs"], dict):
+        errors.append(f"'{product_name}': 'configs' must be a mapping of launch modes.")
+        return None
+    configs = {}
+    for mode, values in product_data["configs"].items():
+        try:
+            configs[mode] = _validate_launch_mode_config(plugins[product_name], mode, values)
+        except (TypeError, ValueError) as exc:
+            errors.append(f"'{product_name}.{mode}': {exc}")
+    if len(errors) > num_errors:
+        return None
+    return config._ProductConfig(launch_mode=launch_mode, configs=configs)
+
+
+def _validate_launch_mode_config(launchers: dict[str, Any], launch_mode: str, values: Any) -> Any:
+    if launch_mode not in launchers:
+        raise ValueError("no plugin is installed for this launch mode.")
+    if not isinstance(values, dict):
+        raise ValueError("the configuration must be a mapping of option names.")
+    config_model = launchers[launch_mode].CONFIG_MODEL
+    type_hints = get_type_hints(config_model)
+    for name, value in values.items():
+        expected_type = type_hints.get(name)
+        # Only simple types are checked, since the configuration models
+        # do not validate their fields themselves.
+        if expected_type in (str, int, float, bool) and not _is_instance(value, expected_type):
+            raise TypeError(
+                f"option '{name}' must be of type '{expected_type.__name__}', got {value!r}."
+            )
+    # Constructing the model checks for unknown and missing options.
+    return config_model(**values)
+
+
+def _is_instance(value: Any, expected_type: type) -> bool:
+    if isinstance(value, bool) and expected_type is not bool:
+        return False
+    if expected_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected_type)
+
+
+def _write_config_atomically(product_configs: dict[str, "config._ProductConfig"]) -> None:
+    file_path = config._get_config_path()
+    config_json = json.dumps(
+        {
+            name: dataclasses.asdict(product_config)
+            for name, product_config in product_configs.items()
+        },
+        indent=2,
+    )
+    with tempfile.NamedTemporaryFile(
+        "w", dir=file_path.parent, prefix=file_path.name, suffix=".tmp", delete=False
+    ) as out_f:
+        out_f.write(config_json)
+        out_f.flush()
+        os.fsync(out_f.fileno())
+    os.replace(out_f.name, file_path)
+    # The in-memory configuration is reloaded from the new file when next needed.
+    config._reset_config()
+
+
+def _dump_toml(data: dict[str, Any]) -> str:
+    lines: list[str] = []
+    _dump_toml_table(data, [], lines)
+    return "\n".join(lines).lstrip("\n") + "\n"
+
+
+def _dump_toml_table(table: dict[str, Any], path: list[str], lines: list[str]) -> None:
+    values = {key: value for key, value in table.items() if not isinstance(value, dict)}
+    subtables = {key: value for key, value in table.items() if isinstance(value, dict)}
+    if path and (values or not subtables):
+        lines.append("")
+        lines.append("[" + ".".join(_toml_key(key) for key in path) + "]")
+    for key, value in values.items():
+        if value is not None:
+            lines.append(f"{_toml_key(key)} = {_toml_value(value)}")
+    for key, value in subtables.items():
+        _dump_toml_table(value, [*path, key], lines)
+
+
+def _toml_key(key: str) -> str:
+    return key if _BARE_KEY_PATTERN.match(key) else json.dumps(key)
+
+
+def _toml_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "nan"
+        if math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+    if isinstance(value, str):
+        # JSON strings are valid TOML basic strings.
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(_toml_value(item) for item in value if item is not None) + "]"
+    raise TypeError(f"Values of type '{type(value).__name__}' cannot be written to TOML.")
@@ -0,0 +1,342 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Management of product instances which outlive the launching process.
+
+Each detached instance is owned by a supervisor process (see ``_supervisor.py``),
+which launches the product and keeps it running until it is asked to stop.
+The supervisor writes the state of the instance to a ``state.json`` file in
+its own directory, which is used by the ``status`` and ``stop`` CLI commands.
+
+While it runs, the supervisor holds a lock on the ``supervisor.lock`` file in
+its directory. The lock is released by the operating system when the
+supervisor exits, so it identifies a live supervisor reliably, unlike its PID,
+which may be reused by an unrelated process.
+"""
+
+import json
+import os
+import pathlib
+import shutil
+import signal
+import subprocess
+import sys
+import time
+from typing import Any
+import uuid
+
+import platformdirs
+
+from ._file_lock import _is_locked
+from .grpc_transport import transport_options_from_dict
+from .helpers.grpc import check_grpc_health
+
+__all__ = [
+    "STATE_DIR_ENV_VAR",
+    "launch_detached",
+    "get_status",
+    "stop_detached",
+]
+
+STATE_DIR_ENV_VAR = "ANSYS_LAUNCHER_STATE_DIR"
+
+STATE_FILENAME = "state.json"
+STOP_FILENAME = "stop"
+LOG_FILENAME = "supervisor.log"
+LOCK_FILENAME = "supervisor.lock"
+
+STATUS_STARTING = "starting"
+STATUS_RUNNING = "running"
+STATUS_FAILED = "failed"
+STATUS_STOPPED = "stopped"
+STATUS_DEAD = "dead"
+STATUS_UNKNOWN = "unknown"
+
+_POLL_INTERVAL = 0.05
+
+_SUPERVISOR_COMMAND = [sys.executable, "-m", "ansys.tools.local_product_launcher._supervisor"]
+
+
+def get_instances_dir() -> pathlib.Path:
+    """Get the directory containing the state of all detached instances."""
+    if STATE_DIR_ENV_VAR in os.environ:
+        return pathlib.Path(os.environ[STATE_DIR_ENV_VAR])
+    return pathlib.Path(platformdirs.user_state_dir("ansys_tools_local_product_launcher")) / (
+        "instances"
+    )
+
+
+def read_state(instance_dir: pathlib.Path) -> dict[str, Any] | None:
+    """Read the state file of an instance, or return ``None`` if it does not exist."""
+    try:
+        state: dict[str, Any] = json.loads((instance_dir / STATE_FILENAME).read_text())
+    except FileNotFoundError:
+        return None
+    return state
+
+
+def write_state(instance_dir: pathlib.Path, state: dict[str, Any]) -> None:
+    """Write the state file of an instance atomically."""
+    tmp_path = instance_dir / (STATE_FILENAME + ".tmp")
+    tmp_path.write_text(json.dumps(state, indent=2))
+    os.replace(tmp_path, instance_dir / STATE_FILENAME)
+
+
+def launch_detached(
+    product_name: str, *, launch_mode: str | None, count: int, timeout: float
+) -> list[dict[str, Any]]:
+    """Launch product instances, each owned by a detached supervisor process.
+
+    The instances are launched in parallel.
+
+    Parameters
+    ----------
+    product_name :
+        Name of the product to launch.
+    launch_mode :
+        Launch mode to use. If ``None``, the configured default is used.
+    count :
+        Number of instances to launch.
+    timeout :
+        Time in seconds to wait for each instance to become ready.
+
+    Returns
+    -------
+    :
+        State of each instance. The ``status`` is ``"running"`` if the instance
+        was launched successfully, and ``"failed"`` otherwise.
+    """
+    instances_dir = get_instances_dir()
+    instances_dir.mkdir(parents=True, exist_ok=True)
+    supervisors = []
+    for _ in range(count):
+        instance_id = uuid.uuid4().hex[:12]
+        instance_dir = instances_dir / instance_id
+        instance_dir.mkdir()
+        supervisors.append(
+            (instance_dir, _start_supervisor(instance_dir, product_name, launch_mode, timeout))
+        )
+
+    # The supervisor enforces the launch timeout itself. The additional time
+    # allows for the start of the supervisor process.
+    deadline = time.monotonic() + timeout + 30
+    res = []
+    for instance_dir, process in supervisors:
+        res.append(_wait_for_supervisor(instance_dir, process, deadline=deadline))
+    return res
+
+
+def _start_supervisor(
+    instance_dir: pathlib.Path, product_name: str, launch_mode: str | None, timeout: float
+) -> subprocess.Popen[bytes]:
+    args = [*_SUPERVISOR_COMMAND, str(instance_dir), product_name, "--timeout", str(timeout)]
+    if launch_mode is not None:
+        args += ["--launch-mode", launch_mode]
+    popen_kwargs: dict[str, Any] = {}
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = (
+            subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS
+        )
+    else:
+        popen_kwargs["start_new_session"] = True
+    with open(instance_dir / LOG_FILENAME, "wb") as log_file:
+        return subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            **popen_kwargs,
+        )
+
+
+def _wait_for_supervisor(
+    instance_dir: pathlib.Path, process: subprocess.Popen[bytes], *, deadline: float
+) -> dict[str, Any]:
+    while True:
+        state = read_state(instance_dir)
+        if state is not None and state["status"] in (STATUS_RUNNING, STATUS_FAILED):
+            if state["status"] == STATUS_FAILED:
+                process.wait()
+                shutil.rmtree(instance_dir, ignore_errors=True)
+            return state
+        if process.poll() is not None:
+            error = f"The supervisor exited with code {process.returncode}."
+            break
+        if time.monotonic() > deadline:
+            process.kill()
+            process.wait()
+            error = "The supervisor did not report the instance state in time."
+            break
+        time.sleep(_POLL_INTERVAL)
+    log = (instance_dir / LOG_FILENAME).read_text(errors="replace")
+    shutil.rmtree(instance_dir, ignore_errors=True)
+    return {
+        "id": instance_dir.name,
+        "status": STATUS_FAILED,
+        "error": error,
+        "log": log,
+    }
+
+
+def get_status(
+    instance_ids: list[str] | None = None, *, check: bool = False
+) -> list[dict[str, Any]]:
+    """Get the state of detached instances.
+
+    Parameters
+    ----------
+    instance_ids :
+        IDs of the instances. If ``None``, all instances are returned.
+    check :
+        Whether to check the health of the gRPC servers of each running instance.
+
+    Returns
+    -------
+    :
+        State of each instance. The ``status`` is ``"dead"`` if the supervisor
+        process no longer exists, for example because it was killed or the
+        machine was restarted.
+    """
+    res = []
+    for instance_dir in _get_instance_dirs(instance_ids):
+        state = read_state(instance_dir)
+        if state is None:
+            if instance_dir.exists():
+                state = {"id": instance_dir.name, "status": STATUS_STARTING}
+            else:
+                state = {
+                    "id": instance_dir.name,
+                    "status": STATUS_UNKNOWN,
+                    "error": "No instance with this ID exists.",
+                }
+        elif state["status"] in (STATUS_STARTING, STATUS_RUNNING) and not _supervisor_alive(
+            instance_dir
+        ):
+            state["status"] = STATUS_DEAD
+        if check and state["status"] == STATUS_RUNNING:
+            state["healthy"] = _check_health(state)
+        res.append(state)
+    return res
+
+
+def stop_detached(instance_ids: list[str] | None = None, *, timeout: float) -> list[dict[str, Any]]:
+    """Stop detached instances.
+
+    Instances whose supervisor is dead are cleaned up: on POSIX systems, the
+    product process left behind by the supervisor is stopped, and the state
+    of the instance is removed.
+
+    Parameters
+    ----------
+    instance_ids :
+        IDs of the instances. If ``None``, all instances are stopped.
+    timeout :
+        Time in seconds to wait for each supervisor to stop its instance.
+
+    Returns
+    -------
+    :
+        Final state of each instance. The ``status`` is ``"stopped"`` if the
+        instance was stopped, and ``"running"`` if it did not stop in time.
+    """
+    states = get_status(instance_ids)
+    for state in states:
+        instance_dir = get_instances_dir() / state["id"]
+        if state["status"] == STATUS_RUNNING:
+            _request_stop(instance_dir, state["supervisor_pid"])
+        elif state["status"] == STATUS_DEAD:
+            _signal_orphaned_product(state, signal.SIGTERM)
+
+    deadline = time.monotonic() + timeout
+    for state in states:
+        instance_dir = get_instances_dir() / state["id"]
+        if state["status"] == STATUS_RUNNING:
+            while _supervisor_alive(instance_dir) and instance_dir.exists():
+                if time.monotonic() > deadline:
+                    break
+                time.sleep(_POLL_INTERVAL)
+            else:
+                state["status"] = STATUS_STOPPED
+        elif state["status"] == STATUS_DEAD:
+            while _signal_orphaned_product(state, 0):
+                if time.monotonic() > deadline:
+                    _signal_orphaned_product(state, signal.SIGKILL)
+                    break
+                time.sleep(_POLL_INTERVAL)
+            shutil.rmtree(instance_dir, ignore_errors=True)
+    return states
+
+
+def _supervisor_alive(instance_dir: pathlib.Path) -> bool:
+    return _is_locked(instance_dir / LOCK_FILENAME)
+
+
+def _request_stop(instance_dir: pathlib.Path, supervisor_pid: int) -> None:
+    # The stop file works on all platforms. On POSIX, the supervisor is also
+    # signalled, such that it does not need to wait for its next poll. The
+    # PID is only signalled while the supervisor holds its lock, so it cannot
+    # belong to an unrelated process.
+    (instance_dir / STOP_FILENAME).touch()
+    if os.name != "nt" and _supervisor_alive(instance_dir):
+        try:
+            os.kill(supervisor_pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+def _signal_orphaned_product(state: dict[str, Any], signum: int) -> bool:
+    """Signal the product process of an instance whose supervisor is dead.
+
+    The supervisor runs in its own session, so the product shares the process
+    group whose ID is the PID of the supervisor. The product is only signalled
+    if its PID still belongs to that group, such that an unrelated process
+    which reuses the PID is not affected.
+
+    Returns ``True`` if the product process was signalled.
+    """
+    pid = state.get("pid")
+    if os.name == "nt" or pid is None:
+        return False
+    try:
+        if os.getpgid(pid) != state["supervisor_pid"]:
+            return False
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def _get_instance_dirs(instance_ids: list[str] | None) -> list[pathlib.Path]:
+    instances_dir = get_instances_dir()
+    if instance_ids:
+        return [instances_dir / instance_id for instance_id in instance_ids]
+    if not instances_dir.exists():
+        return []
+    return sorted(path for path in instances_dir.iterdir() if path.is_dir())
+
+
+def _check_health(state: dict[str, Any]) -> bool:
+    for transport_options in state["transport_options"].values():
+        channel = transport_options_from_dict(transport_options).create_channel()
+        with channel:
+            if not check_grpc_health(channel, timeout=5):
+                return False
+    return True
@@ -0,0 +1,427 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Diagnostics of the launch environment, used by the ``doctor`` CLI command."""
+
+from collections.abc import Callable, Sequence
+import dataclasses
+import json
+import os
+import pathlib
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+import uuid
+
+from ansys.tools.common.launcher import config
+
+from . import _plugins
+from ._bench import _get_stats
+from ._vendored import cyberchannel
+from .grpc_transport import get_transport_capabilities
+from .helpers.ports import PortReservation, find_free_ports, reserve_ports
+
+__all__ = ["run_diagnostics", "format_diagnostics"]
+
+PACKAGE_NAME = "ansys.tools.local_product_launcher"
+
+NETWORK_FILESYSTEMS = frozenset(
+    {"nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "ceph", "glusterfs", "lustre", "gpfs"}
+)
+"""Filesystem types on which file and socket operations involve network round trips."""
+
+# Thresholds above which the result is reported as a likely cause of slow launches.
+_SLOW_FILESYSTEM_SECONDS = 0.01
+_SLOW_IMPORT_SECONDS = 1.0
+
+_SUBPROCESS_TIMEOUT = 120.0
+
+_MEASURE_PACKAGE_IMPORT_SCRIPT = f"""
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import {PACKAGE_NAME}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(set(sys.modules) - before)}}))
+"""
+
+_MEASURE_PLUGIN_IMPORTS_SCRIPT = f"""
+import json
+from {PACKAGE_NAME}._doctor import _measure_plugin_imports
+print(json.dumps(_measure_plugin_imports()))
+"""
+
+
+def run_diagnostics(*, num_iterations: int = 10, num_ports: int = 50) -> dict[str, Any]:
+    """Collect information about the environment which affects the launch latency.
+
+    Parameters
+    ----------
+    num_iterations :
+        Number of times each filesystem operation is measured.
+    num_ports :
+        Number of ports allocated to measure the port allocation.
+
+    Returns
+    -------
+    :
+        JSON-serializable diagnostics result.
+    """
+    result = {
+        "python": {"version": platform.python_version(), "executable": sys.executable},
+        "platform": platform.platform(),
+        "transport": _get_transport_diagnostics(),
+        "filesystems": {
+            "uds_dir": _diagnose_directory(_get_uds_dir, num_iterations=num_iterations),
+            "config_dir": _diagnose_directory(
+                lambda: config._get_config_path().parent, num_iterations=num_iterations
+            ),
+        },
+        "ports": _measure_port_allocation(num_ports),
+        "package_import": _measure_package_import(),
+        "plugins": _run_script(_MEASURE_PLUGIN_IMPORTS_SCRIPT),
+    }
+    result["findings"] = _get_findings(result)
+    return result
+
+
+def _get_transport_diagnostics() -> dict[str, Any]:
+    # The on-disk cache is bypassed, so that the result reflects the
+    # current state of the machine.
+    capabilities = get_transport_capabilities(use_disk_cache=False)
+    res = dataclasses.asdict(capabilities)
+    res["available_modes"] = [mode.value for mode in capabilities.available_modes]
+    res["abstract_sockets_supported"] = _abstract_sockets_supported()
+    return res
+
+
+def _abstract_sockets_supported() -> bool:
+    # Abstract sockets are a Linux extension: their name starts with a null
+    # byte, and they do not exist on the filesystem.
+    if not sys.platform.startswith("linux"):
+        return False
+    name = f"\0{PACKAGE_NAME}-doctor-{uuid.uuid4().hex}"
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.bind(name)
+    except OSError:
+        return False
+    return True
+
+
+def _get_uds_dir() -> pathlib.Path:
+    return cyberchannel.determine_uds_folder()
+
+
+def _diagnose_directory(
+    get_path: Callable[[], pathlib.Path], *, num_iterations: int
+) -> dict[str, Any]:
+    try:
+        path = get_path()
+    except (OSError, KeyError) as exc:
+        return {"path": None, "error": str(exc)}
+    res: dict[str, Any] = {"path": str(path), "exists": path.is_dir()}
+    if not res["exists"]:
+        return res
+    res["filesystem_type"] = get_filesystem_type(path)
+    try:
+        res["latency"] = _measure_filesystem_latency(path, num_iterations=num_iterations)
+    except OSError as exc:
+        res["error"] = str(exc)
+    return res
+
+
+def get_filesystem_type(path: pathlib.Path) -> str | None:
+    """Get the type of the filesystem containing a path.
+
+    The filesystem type is only determined on Linux, where it is read from
+    ``/proc/self/mountinfo``. On other platforms, ``None`` is returned.
+    """
+    try:
+        with open("/proc/self/mountinfo") as mountinfo:
+            lines = mountinfo.readlines()
+    except OSError:
+        return None
+    real_path = os.path.realpath(path)
+    best_mount_point = ""
+    filesystem_type = None
+    for line in lines:
+        # The format is described in 'man 5 proc'. The optional fields are
+        # terminated by a single hyphen, which is followed by the filesystem type.
+        fields = line.split()
+        try:
+            separator_idx = fields.index("-")
+        except ValueError:
+            continue
+        mount_point = fields[4].replace("\\040", " ")
+        if _is_relative_to(real_path, mount_point) and len(mount_point) >= len(best_mount_point):
+            best_mount_point = mount_point
+            filesystem_type = fields[separator_idx + 1]
+    return filesystem_type
+
+
+def _is_relative_to(path: str, mount_point: str) -> bool:
+    return path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+
+
+def _measure_filesystem_latency(path: pathlib.Path, *, num_iterations: int) -> dict[str, Any]:
+    # The operations mirror what happens during a launch: creating and
+    # removing small files, such as sockets, locks, and configuration files.
+    write_times = []
+    remove_times = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        fd, file_path = tempfile.mkstemp(dir=path, prefix=".ansys-launcher-doctor-")
+        try:
+            os.write(fd, b"0" * 512)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        write_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        os.remove(file_path)
+        remove_times.append(time.perf_counter() - start)
+    return {"write_seconds": _get_stats(write_times), "remove_seconds": _get_stats(remove_times)}
+
+
+def _measure_port_allocation(num_ports: int) -> dict[str, Any]:
+    res = {}
+    # Ports returned by 'find_free_ports' are released immediately, such that
+    # the operating system may return them again. Each repeated port is a
+    # collision which could make two products try to bind the same port.
+    ports = []
+    times = []
+    for _ in range(num_ports):
+        start = time.perf_counter()
+        ports.extend(find_free_ports())
+        times.append(time.perf_counter() - start)
+    res["find_free_ports"] = _get_port_stats(ports, times)
+
+    reservations: list[PortReservation] = []
+    times = []
+    try:
+        for _ in range(num_ports):
+            start = time.perf_counter()
+            reservations.append(reserve_ports())
+            times.append(time.perf_counter() - start)
+        ports = [port for reservation in reservations for port in reservation.ports]
+    finally:
+        for reservation in reservations:
+            reservation.release()
+    res["reserve_ports"] = _get_port_stats(ports, times)
+    return res
+
+
+def _get_port_stats(ports: Sequence[int], times: Sequence[float]) -> dict[str, Any]:
+    collisions = len(ports) - len(set(ports))
+    return {
+        "seconds": _get_stats(times),
+        "collisions": collisions,
+        "collision_rate": collisions / len(ports),
+    }
+
+
+def _measure_package_import() -> dict[str, Any]:
+    # The import is measured in a new interpreter, because the package is
+    # already imported in the current one.
+    try:
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _MEASURE_PACKAGE_IMPORT_SCRIPT],
+            capture_output=True,
+            text=True,
+            timeout=_SUBPROCESS_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"The import did not finish within {_SUBPROCESS_TIMEOUT} s."}
+    if process.returncode != 0:
+        return {"error": process.stderr.strip()}
+    measurement = json.loads(process.stdout)
+    new_modules = set(measurement["modules"])
+    # Lines have the format 'import time: <self> | <cumulative> | <name>'.
+    # The slowest dependencies are reported per distribution, which is
+    # approximated by the top-level package, or the first three levels for
+    # the 'ansys' namespace package.
+    dependency_seconds: dict[str, float] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = (part.strip() for part in line.split("|"))
+        if name not in new_modules:
+            continue
+        parts = name.split(".")
+        dependency = ".".join(parts[:3]) if parts[0] == "ansys" else parts[0]
+        if dependency in (PACKAGE_NAME, "ansys", "ansys.tools"):
+            continue
+        try:
+            seconds = int(cumulative) / 1e6
+        except ValueError:
+            continue
+        dependency_seconds[dependency] = max(seconds, dependency_seconds.get(dependency, 0.0))
+    slowest = sorted(dependency_seconds.items(), key=lambda item: item[1], reverse=True)[:5]
+    return {
+        "seconds": measurement["seconds"],
+        "slowest_dependencies": [{"name": name, "seconds": seconds} for name, seconds in slowest],
+    }
+
+
+def _run_script(script: str) -> dict[str, Any]:
+    try:
+        process = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            timeout=_SUBPROCESS_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"The measurement did not finish within {_SUBPROCESS_TIMEOUT} s."}
+    if process.returncode != 0:
+        return {"error": process.stderr.strip()}
+    res: dict[str, Any] = json.loads(process.stdout)
+    return res
+
+
+def _measure_plugin_imports() -> dict[str, Any]:
+    # Plugins are imported in the order of their discovery. Modules shared
+    # between plugins are only imported once, so their import time is
+    # attributed to the first plugin using them.
+    start = time.perf_counter()
+    entry_points = _plugins._get_entry_points()
+    discovery_seconds = time.perf_counter() - start
+    plugins = []
+    for entry_point in entry_points:
+        plugin: dict[str, Any] = {"name": entry_point.name, "value": entry_point.value}
+        start = time.perf_counter()
+        try:
+            entry_point.load()
+        except Exception as exc:
+            plugin["error"] = f"{type(exc).__name__}: {exc}"
+        plugin["import_seconds"] = time.perf_counter() - start
+        plugins.append(plugin)
+    return {"discovery_seconds": discovery_seconds, "entry_points": plugins}
+
+
+def _get_findings(result: dict[str, Any]) -> list[str]:
+    findings = []
+    transport = result["transport"]
+    if not (transport["uds_supported"] and transport["uds_dir_writable"]):
+        findings.append("UDS cannot be used, products fall back to slower TCP-based transports.")
+    for key, title in (("uds_dir", "UDS directory"), ("config_dir", "configuration directory")):
+        info = result["filesystems"][key]
+        if info.get("filesystem_type") in NETWORK_FILESYSTEMS:
+            findings.append(f"The {title} is on a network filesystem ({info['filesystem_type']}).")
+        if "latency" in info:
+            write_seconds = info["latency"]["write_seconds"]["p50"]
+            if write_seconds > _SLOW_FILESYSTEM_SECONDS:
+                findings.append(
+                    f"Writing a file in the {title} is slow ({write_seconds * 1000:.1f} ms)."
+                )
+    if result["ports"]["find_free_ports"]["collisions"]:
+        findings.append(
+            "The operating system reuses recently freed ports. Launchers should use "
+            "'reserve_ports' instead of 'find_free_ports'."
+        )
+    package_seconds = result["package_import"].get("seconds")
+    if package_seconds is not None and package_seconds > _SLOW_IMPORT_SECONDS:
+        findings.append(f"Importing the package is slow ({package_seconds:.2f} s).")
+    for plugin in result["plugins"].get("entry_points", []):
+        if "error" in plugin:
+            findings.append(f"The plugin '{plugin['name']}' cannot be imported.")
+        elif plugin["import_seconds"] > _SLOW_IMPORT_SECONDS:
+            findings.append(
+                f"Importing the plugin '{plugin['name']}' is slow "
+                f"({plugin['import_seconds']:.2f} s)."
+            )
+    return findings
+
+
+def format_diagnostics(result: dict[str, Any]) -> str:
+    """Format the result of :func:`run_diagnostics` as a report."""
+    lines = [
+        f"Python: {result['python']['version']} ({result['python']['executable']})",
+        f"Platform: {result['platform']}",
+        "",
+        "Transport:",
+    ]
+    transport = result["transport"]
+    lines.append(f"    gRPC version:       {transport['grpc_version']}")
+    lines.append(f"    UDS supported:      {_yes_no(transport['uds_supported'])}")
+    lines.append(f"    UDS dir writable:   {_yes_no(transport['uds_dir_writable'])}")
+    lines.append(f"    abstract sockets:   {_yes_no(transport['abstract_sockets_supported'])}")
+    lines.append(f"    available modes:    {', '.join(transport['available_modes'])}")
+
+    lines += ["", "Filesystems:"]
+    for key, title in (("uds_dir", "UDS directory"), ("config_dir", "config directory")):
+        info = result["filesystems"][key]
+        lines.append(f"    {title}: {info['path']}")
+        if not info.get("exists", True):
+            lines.append("        does not exist")
+        if "filesystem_type" in info:
+            lines.append(f"        type:   {info['filesystem_type'] or 'unknown'}")
+        if "latency" in info:
+            for name in ("write", "remove"):
+                lines.append(
+                    f"        {name + ':':<8}" + _format_stats(info["latency"][f"{name}_seconds"])
+                )
+        if "error" in info:
+            lines.append(f"        error:  {info['error']}")
+
+    lines += ["", "Port allocation:"]
+    for name, info in result["ports"].items():
+        lines.append(
+            f"    {name + ':':<20}"
+            + _format_stats(info["seconds"])
+            + f", {info['collisions']} collisions ({info['collision_rate']:.0%})"
+        )
+
+    lines += ["", "Imports:"]
+    package_import = result["package_import"]
+    if "error" in package_import:
+        lines.append(f"    package: failed: {package_import['error']}")
+    else:
+        lines.append(f"    package: {package_import['seconds'] * 1000:.1f} ms")
+        for module in package_import["slowest_dependencies"]:
+            lines.append(f"        {module['name']:<40}{module['seconds'] * 1000:>10.1f} ms")
+    plugins = result["plugins"]
+    if "error" in plugins:
+        lines.append(f"    plugins: failed: {plugins['error']}")
+    else:
+        lines.append(f"    plugin discovery: {plugins['discovery_seconds'] * 1000:.1f} ms")
+        for plugin in plugins["entry_points"]:
+            status = " (failed)" if "error" in plugin else ""
+            lines.append(
+                f"        {plugin['name']:<40}{plugin['import_seconds'] * 1000:>10.1f} ms{status}"
+            )
+
+    lines += ["", "Findings:"]
+    lines += [f"    - {finding}" for finding in result["findings"]] or ["    none"]
+    return "\n".join(lines)
+
+
+def _yes_no(value: bool) -> str:
+    return "yes" if value else "no"
+
+
+def _format_stats(stats: dict[str, float]) -> str:
+    return ", ".join(f"{name} {stats[name] * 1000:.2f} ms" for name in ("p50", "max"))
@@ -0,0 +1,164 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Cross-process lock based on an operating system lock on a file."""
+
+import os
+import pathlib
+import sys
+import time
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+__all__ = ["FileLock"]
+
+
+class FileLock:
+    """Cross-process lock based on an operating system lock on a file.
+
+    The lock is held through ``flock`` on POSIX systems, and through
+    ``msvcrt.locking`` on Windows. The operating system releases the lock
+    when the owning process exits, so a lock is never left behind by a
+    crashed process, and a lock held by a running process is never taken
+    over.
+
+    The lock file itself is not removed when the lock is released, since
+    removing it would race with other processes opening the same path.
+
+    Parameters
+    ----------
+    path :
+        Path of the lock file. The parent directory is created if needed.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self._path = pathlib.Path(path)
+        self._fd: int | None = None
+
+    def __enter__(self) -> "FileLock":
+        """Acquire the lock, blocking until it is available."""
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Release the lock."""
+        self.release()
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Path of the lock file."""
+        return self._path
+
+    @property
+    def is_locked(self) -> bool:
+        """Flag indicating if the lock is held by this object."""
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """Try to acquire the lock without blocking.
+
+        Returns
+        -------
+        :
+            ``True`` if the lock was acquired, ``False`` otherwise.
+        """
+        if self._fd is not None:
+            raise RuntimeError(f"The lock '{self._path}' is already held.")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_CREAT | os.O_RDWR)
+        try:
+            _lock(fd)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def acquire(self, timeout: float | None = None, poll_interval: float = 0.01) -> bool:
+        """Acquire the lock, waiting until it becomes available.
+
+        Parameters
+        ----------
+        timeout :
+            Maximum time in seconds to wait for the lock. If ``None``, wait
+            indefinitely.
+        poll_interval :
+            Time in seconds between attempts to acquire the lock.
+
+        Returns
+        -------
+        :
+            ``True`` if the lock was acquired, ``False`` if the timeout expired.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.try_acquire():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+        return True
+
+    def release(self) -> None:
+        """Release the lock, if it is held."""
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+
+
+if sys.platform == "win32":
+
+    def _lock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+
+    def _lock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _is_locked(path: str | os.PathLike[str]) -> bool:
+    """Check if a lock file is currently held, without creating it."""
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return False
+    try:
+        _lock(fd)
+    except OSError:
+        return True
+    else:
+        _unlock(fd)
+        return False
+    finally:
+        os.close(fd)
@@ -0,0 +1,133 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Supervisor process owning a detached product instance.
+
+The supervisor launches the product, writes the state of the instance to its
+directory, and keeps the product running until it receives ``SIGTERM`` or
+``SIGINT``, or a stop file is created in its directory. It then stops the
+product and removes the directory. While it runs, it holds the lock file in
+its directory, which shows other processes that it is alive.
+
+This module is started by the ``launch`` CLI command, and is not intended to
+be run directly.
+"""
+
+import argparse
+import os
+import pathlib
+import shutil
+import signal
+import threading
+import time
+import traceback
+
+from ansys.tools.common.launcher.config import get_launch_mode_for
+
+from . import _detached
+from ._file_lock import FileLock
+from .grpc_transport import transport_options_to_dict
+from .interface import SupportsProcessId
+from .launch import launch_product
+
+_STOP_POLL_INTERVAL = 0.5
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the supervisor."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("instance_dir", type=pathlib.Path)
+    parser.add_argument("product_name")
+    parser.add_argument("--launch-mode", default=None)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args(argv)
+    instance_dir: pathlib.Path = args.instance_dir
+    lock = FileLock(instance_dir / _detached.LOCK_FILENAME)
+    if not lock.try_acquire():
+        raise SystemExit(f"The instance '{instance_dir.name}' already has a supervisor.")
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    state = {
+        "id": instance_dir.name,
+        "status": _detached.STATUS_STARTING,
+        "product_name": args.product_name,
+        "launch_mode": args.launch_mode,
+        "supervisor_pid": os.getpid(),
+    }
+    _detached.write_state(instance_dir, state)
+
+    start_time = time.monotonic()
+    try:
+        launch_mode = get_launch_mode_for(
+            product_name=args.product_name, launch_mode=args.launch_mode
+        )
+        state["launch_mode"] = launch_mode
+        instance = launch_product(args.product_name, launch_mode=launch_mode)
+        started_time = time.monotonic()
+        try:
+            instance.wait(timeout=args.timeout)
+        except BaseException:
+            instance.stop()
+            raise
+    except Exception as exc:
+        traceback.print_exc()
+        state["status"] = _detached.STATUS_FAILED
+        state["error"] = f"{type(exc).__name__}: {exc}"
+        _detached.write_state(instance_dir, state)
+        raise SystemExit(1)
+    ready_time = time.monotonic()
+
+    launcher = instance._launcher
+    state.update(
+        {
+            "status": _detached.STATUS_RUNNING,
+            "pid": launcher.pid if isinstance(launcher, SupportsProcessId) else None,
+            "urls": instance.urls,
+            "transport_options": {
+                key: transport_options_to_dict(transport_options)
+                for key, transport_options in instance.transport_options.items()
+            },
+            "started_at": time.time() - (ready_time - start_time),
+            "timings": {
+                "start_seconds": started_time - start_time,
+                "ready_seconds": ready_time - start_time,
+            },
+        }
+    )
+    _detached.write_state(instance_dir, state)
+
+    stop_file = instance_dir / _detached.STOP_FILENAME
+    try:
+        while not stop_event.wait(_STOP_POLL_INTERVAL):
+            if stop_file.exists():
+                break
+    finally:
+        instance.stop()
+        # The lock is released first, since open files cannot be removed on Windows.
+        lock.release()
+        shutil.rmtree(instance_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
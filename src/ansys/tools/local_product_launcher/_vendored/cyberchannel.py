@@ -37,10 +37,13 @@ Example
     )
     stub = hello_pb2_grpc.GreeterStub(channel)
 
+The ``create_aio_channel`` function accepts the same parameters and returns
+a ``grpc.aio.Channel`` for use with asynchronous client stubs.
+
 """
 
-# Only the create_channel function is exposed for external use
-__all__ = ["create_channel", "verify_transport_mode", "verify_uds_socket"]
+# Only the create_channel functions are exposed for external use
+__all__ = ["create_channel", "create_aio_channel", "verify_transport_mode", "verify_uds_socket"]
 
 from dataclasses import dataclass
 import logging
@@ -121,29 +124,17 @@ def create_channel(
         The created gRPC channel
 
     """
-
-    def check_host_port(transport_mode, host, port) -> tuple[str, str, str]:
-        if host is None:
-            raise ValueError(
-                f"When using {transport_mode.lower()} transport mode, 'host' must be provided."
-            )
-        if port is None:
-            raise ValueError(
-                f"When using {transport_mode.lower()} transport mode, 'port' must be provided."
-            )
-        return transport_mode, host, port
-
     match transport_mode.lower():
         case "insecure":
-            transport_mode, host, port = check_host_port(transport_mode, host, port)
+            transport_mode, host, port = _check_host_port(transport_mode, host, port)
             return create_insecure_channel(host, port, grpc_options)
         case "uds":
             return create_uds_channel(uds_service, uds_dir, uds_id, grpc_options)
         case "wnua":
-            transport_mode, host, port = check_host_port(transport_mode, host, port)
+            transport_mode, host, port = _check_host_port(transport_mode, host, port)
             return create_wnua_channel(host, port, grpc_options)
         case "mtls":
-            transport_mode, host, port = check_host_port(transport_mode, host, port)
+            transport_mode, host, port = _check_host_port(transport_mode, host, port)
             return create_mtls_channel(host, port, certs_dir, cert_files, grpc_options)
         case _:
             raise ValueError(
@@ -152,6 +143,99 @@ def create_channel(
             )
 
 
+def create_aio_channel(
+    transport_mode: str,
+    host: str | None = None,
+    port: int | str | None = None,
+    uds_service: str | None = None,
+    uds_dir: str | Path | None = None,
+    uds_id: str | None = None,
+    certs_dir: str | Path | None = None,
+    cert_files: CertificateFiles | None = None,
+    grpc_options: list[tuple[str, object]] | None = None,
+) -> grpc.aio.Channel:
+    """Create a ``grpc.aio`` channel based on the transport mode.
+
+    The parameters are the same as for :func:`create_channel`. The channel
+    must be created, used and closed within a running asyncio event loop.
+
+    Parameters
+    ----------
+    transport_mode : str
+        Transport mode selected by the user.
+        Options are: "insecure", "uds", "wnua", "mtls"
+    host : str | None
+        Hostname or IP address of the server.
+        By default `None` - however, if not using UDS transport mode,
+        it will be requested.
+    port : int | str | None
+        Port in which the server is running.
+        By default `None` - however, if not using UDS transport mode,
+        it will be requested.
+    uds_service : str | None
+        Optional service name for the UDS socket.
+        By default `None` - however, if UDS is selected, it will
+        be requested.
+    uds_dir : str | Path | None
+        Directory to use for Unix Domain Sockets (UDS) transport mode.
+        By default `None` and thus it will use the "~/.conn" folder.
+    uds_id : str | None
+        Optional ID to use for the UDS socket filename.
+        By default `None` and thus it will use "<uds_service>.sock".
+        Otherwise, the socket filename will be "<uds_service>-<uds_id>.sock".
+    certs_dir : str | Path | None
+        Directory to use for TLS certificates.
+        By default `None` and thus search for the "ANSYS_GRPC_CERTIFICATES" environment variable.
+        If not found, it will use the "certs" folder assuming it is in the current working
+        directory.
+    cert_files: CertificateFiles | None = None
+        Path to the client certificate file, client key file, and issuing certificate authority.
+        By default `None`.
+        If all three file paths are not all provided, use the certs_dir parameter.
+    grpc_options: list[tuple[str, object]] | None
+        gRPC channel options to pass when creating the channel.
+        Each option is a tuple of the form ("option_name", value).
+        By default `None` and thus no extra options are added.
+
+    Returns
+    -------
+    grpc.aio.Channel
+        The created asynchronous gRPC channel
+
+    """
+    match transport_mode.lower():
+        case "insecure":
+            transport_mode, host, port = _check_host_port(transport_mode, host, port)
+            return create_insecure_aio_channel(host, port, grpc_options)
+        case "uds":
+            return create_uds_aio_channel(uds_service, uds_dir, uds_id, grpc_options)
+        case "wnua":
+            transport_mode, host, port = _check_host_port(transport_mode, host, port)
+            return create_wnua_aio_channel(host, port, grpc_options)
+        case "mtls":
+            transport_mode, host, port = _check_host_port(transport_mode, host, port)
+            return create_mtls_aio_channel(host, port, certs_dir, cert_files, grpc_options)
+        case _:
+            raise ValueError(
+                f"Unknown transport mode: {transport_mode}. "
+                "Valid options are: 'insecure', 'uds', 'wnua', 'mtls'."
+            )
+
+
+def _check_host_port(
+    transport_mode: str, host: str | None, port: int | str | None
+) -> tuple[str, str, int | str]:
+    if host is None:
+        raise ValueError(
+            f"When using {transport_mode.lower()} transport mode, 'host' must be provided."
+        )
+    if port is None:
+        raise ValueError(
+            f"When using {transport_mode.lower()} transport mode, 'port' must be provided."
+        )
+    return transport_mode, host, port
+
+
 ##################################### TRANSPORT MODE CHANNELS #####################################
 
 
@@ -177,15 +261,36 @@ def create_insecure_channel(
         The created gRPC channel
 
     """
-    target = f"{host}:{port}"
-    warn(
-        f"Starting gRPC client without TLS on {target}. This is INSECURE. "
-        "Consider using a secure connection."
-    )
-    logger.info(f"Connecting using INSECURE -> {target}")
+    target = _get_insecure_target(host, port)
     return grpc.insecure_channel(target, options=grpc_options)
 
 
+def create_insecure_aio_channel(
+    host: str, port: int | str, grpc_options: list[tuple[str, object]] | None = None
+) -> grpc.aio.Channel:
+    """Create an insecure ``grpc.aio`` channel without TLS.
+
+    Parameters
+    ----------
+    host : str
+        Hostname or IP address of the server.
+    port : int | str
+        Port in which the server is running.
+    grpc_options: list[tuple[str, object]] | None
+        gRPC channel options to pass when creating the channel.
+        Each option is a tuple of the form ("option_name", value).
+        By default `None` and thus no extra options are added.
+
+    Returns
+    -------
+    grpc.aio.Channel
+        The created asynchronous gRPC channel
+
+    """
+    target = _get_insecure_target(host, port)
+    return grpc.aio.insecure_channel(target, options=grpc_options)
+
+
 def create_uds_channel(
     uds_service: str | None,
     uds_dir: str | Path | None = None,
@@ -216,33 +321,42 @@ def create_uds_channel(
         The created gRPC channel
 
     """
-    if not is_uds_supported():
-        raise RuntimeError(
-            "Unix Domain Sockets are not supported on this platform or gRPC version."
-        )
+    target, options = _get_uds_target_and_options(uds_service, uds_dir, uds_id, grpc_options)
+    return grpc.insecure_channel(target, options=options)
 
-    if not uds_service:
-        raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
 
-    # Determine UDS folder
-    uds_folder = determine_uds_folder(uds_dir)
+def create_uds_aio_channel(
+    uds_service: str | None,
+    uds_dir: str | Path | None = None,
+    uds_id: str | None = None,
+    grpc_options: list[tuple[str, object]] | None = None,
+) -> grpc.aio.Channel:
+    """Create a ``grpc.aio`` channel using Unix Domain Sockets (UDS).
 
-    # Make sure the folder exists
-    uds_folder.mkdir(parents=True, exist_ok=True)
+    Parameters
+    ----------
+    uds_service : str
+        Service name for the UDS socket.
+    uds_dir : str | Path | None
+        Directory to use for Unix Domain Sockets (UDS) transport mode.
+        By default `None` and thus it will use the "~/.conn" folder.
+    uds_id : str | None
+        Optional ID to use for the UDS socket filename.
+        By default `None` and thus it will use "<uds_service>.sock".
+        Otherwise, the socket filename will be "<uds_service>-<uds_id>.sock".
+    grpc_options: list[tuple[str, object]] | None
+        gRPC channel options to pass when creating the channel.
+        Each option is a tuple of the form ("option_name", value).
+        By default `None` and thus only the default authority option is added.
 
-    # Generate socket filename with optional ID
-    socket_filename = f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
-    target = f"unix:{uds_folder / socket_filename}"
-    # Set default authority to "localhost" for UDS connection
-    # This is needed to avoid issues with some gRPC implementations,
-    # see https://github.com/grpc/grpc/issues/34305
-    options: list[tuple[str, object]] = [
-        ("grpc.default_authority", "localhost"),
-    ]
-    if grpc_options:
-        options.extend(grpc_options)
-    logger.info(f"Connecting using UDS -> {target}")
-    return grpc.insecure_channel(target, options=options)
+    Returns
+    -------
+    grpc.aio.Channel
+        The created asynchronous gRPC channel
+
+    """
+    target, options = _get_uds_target_and_options(uds_service, uds_dir, uds_id, grpc_options)
+    return grpc.aio.insecure_channel(target, options=options)
 
 
 def create_wnua_channel(
@@ -269,24 +383,38 @@ def create_wnua_channel(
         The created gRPC channel
 
     """
-    if not _IS_WINDOWS:
-        raise ValueError("Windows Named User Authentication (WNUA) is only supported on Windows.")
-    if host not in LOOPBACK_HOSTS:
-        raise ValueError("Remote host connections are not supported with WNUA.")
-
-    target = f"{host}:{port}"
-    # Set default authority to "localhost" for WNUA connection
-    # This is needed to avoid issues with some gRPC implementations,
-    # see https://github.com/grpc/grpc/issues/34305
-    options: list[tuple[str, object]] = [
-        ("grpc.default_authority", "localhost"),
-    ]
-    if grpc_options:
-        options.extend(grpc_options)
-    logger.info(f"Connecting using WNUA -> {target}")
+    target, options = _get_wnua_target_and_options(host, port, grpc_options)
     return grpc.insecure_channel(target, options=options)
 
 
+def create_wnua_aio_channel(
+    host: str,
+    port: int | str,
+    grpc_options: list[tuple[str, object]] | None = None,
+) -> grpc.aio.Channel:
+    """Create a ``grpc.aio`` channel using Windows Named User Authentication (WNUA).
+
+    Parameters
+    ----------
+    host : str
+        Hostname or IP address of the server.
+    port : int | str
+        Port in which the server is running.
+    grpc_options: list[tuple[str, object]] | None
+        gRPC channel options to pass when creating the channel.
+        Each option is a tuple of the form ("option_name", value).
+        By default `None` and thus only the default authority option is added.
+
+    Returns
+    -------
+    grpc.aio.Channel
+        The created asynchronous gRPC channel
+
+    """
+    target, options = _get_wnua_target_and_options(host, port, grpc_options)
+    return grpc.aio.insecure_channel(target, options=options)
+
+
 def create_mtls_channel(
     host: str,
     port: int | str,
@@ -322,6 +450,124 @@ def create_mtls_channel(
         The created gRPC channel
 
     """
+    credentials = _get_mtls_credentials(certs_dir, cert_files)
+    target = f"{host}:{port}"
+    logger.info(f"Connecting using mTLS -> {target}")
+    return grpc.secure_channel(target, credentials, options=grpc_options)
+
+
+def create_mtls_aio_channel(
+    host: str,
+    port: int | str,
+    certs_dir: str | Path | None = None,
+    cert_files: CertificateFiles | None = None,
+    grpc_options: list[tuple[str, object]] | None = None,
+) -> grpc.aio.Channel:
+    """Create a ``grpc.aio`` channel using Mutual TLS (mTLS).
+
+    Parameters
+    ----------
+    host : str
+        Hostname or IP address of the server.
+    port : int | str
+        Port in which the server is running.
+    certs_dir : str | Path | None
+        Directory to use for TLS certificates.
+        By default `None` and thus search for the "ANSYS_GRPC_CERTIFICATES" environment variable.
+        If not found, it will use the "certs" folder assuming it is in the current working
+        directory.
+    cert_files: CertificateFiles | None
+        Path to the client certificate file, client key file, and issuing certificate authority.
+        By default `None`.
+        If all three file paths are not all provided, use the certs_dir parameter.
+    grpc_options: list[tuple[str, object]] | None
+        gRPC channel options to pass when creating the channel.
+        Each option is a tuple of the form ("option_name", value).
+        By default `None` and thus no extra options are added.
+
+    Returns
+    -------
+    grpc.aio.Channel
+        The created asynchronous gRPC channel
+
+    """
+    credentials = _get_mtls_credentials(certs_dir, cert_files)
+    target = f"{host}:{port}"
+    logger.info(f"Connecting using mTLS -> {target}")
+    return grpc.aio.secure_channel(target, credentials, options=grpc_options)
+
+
+def _get_insecure_target(host: str, port: int | str) -> str:
+    target = f"{host}:{port}"
+    warn(
+        f"Starting gRPC client without TLS on {target}. This is INSECURE. "
+        "Consider using a secure connection."
+    )
+    logger.info(f"Connecting using INSECURE -> {target}")
+    return target
+
+
+def _get_uds_target_and_options(
+    uds_service: str | None,
+    uds_dir: str | Path | None,
+    uds_id: str | None,
+    grpc_options: list[tuple[str, object]] | None,
+) -> tuple[str, list[tuple[str, object]]]:
+    if not is_uds_supported():
+        raise RuntimeError(
+            "Unix Domain Sockets are not supported on this platform or gRPC version."
+        )
+
+    if not uds_service:
+        raise ValueError("When using UDS transport mode, 'uds_service' must be provided.")
+
+    # Determine UDS folder
+    uds_folder = determine_uds_folder(uds_dir)
+
+    # Make sure the folder exists
+    uds_folder.mkdir(parents=True, exist_ok=True)
+
+    # Generate socket filename with optional ID
+    socket_filename = f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
+    target = f"unix:{uds_folder / socket_filename}"
+    # Set default authority to "localhost" for UDS connection
+    # This is needed to avoid issues with some gRPC implementations,
+    # see https://github.com/grpc/grpc/issues/34305
+    options: list[tuple[str, object]] = [
+        ("grpc.default_authority", "localhost"),
+    ]
+    if grpc_options:
+        options.extend(grpc_options)
+    logger.info(f"Connecting using UDS -> {target}")
+    return target, options
+
+
+def _get_wnua_target_and_options(
+    host: str,
+    port: int | str,
+    grpc_options: list[tuple[str, object]] | None,
+) -> tuple[str, list[tuple[str, object]]]:
+    if not _IS_WINDOWS:
+        raise ValueError("Windows Named User Authentication (WNUA) is only supported on Windows.")
+    if host not in LOOPBACK_HOSTS:
+        raise ValueError("Remote host connections are not supported with WNUA.")
+
+    target = f"{host}:{port}"
+    # Set default authority to "localhost" for WNUA connection
+    # This is needed to avoid issues with some gRPC implementations,
+    # see https://github.com/grpc/grpc/issues/34305
+    options: list[tuple[str, object]] = [
+        ("grpc.default_authority", "localhost"),
+    ]
+    if grpc_options:
+        options.extend(grpc_options)
+    logger.info(f"Connecting using WNUA -> {target}")
+    return target, options
+
+
+def _get_mtls_credentials(
+    certs_dir: str | Path | None, cert_files: CertificateFiles | None
+) -> grpc.ChannelCredentials:
     certs_folder = None
     if (
         cert_files is not None
@@ -362,14 +608,10 @@ def create_mtls_channel(
         raise FileNotFoundError(error_message) from e
 
     # Create SSL credentials
-    credentials = grpc.ssl_channel_credentials(
+    return grpc.ssl_channel_credentials(
         root_certificates=trusted_certs, private_key=client_key, certificate_chain=client_cert
     )
 
-    target = f"{host}:{port}"
-    logger.info(f"Connecting using mTLS -> {target}")
-    return grpc.secure_channel(target, credentials, options=grpc_options)
-
 
 ######################################## HELPER FUNCTIONS ########################################
 
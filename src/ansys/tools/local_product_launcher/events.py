@@ -0,0 +1,232 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Structured lifecycle events for product instances.
+
+When an event log is configured with :func:`set_event_log`, each
+:class:`.ProductInstance` writes its lifecycle events to it as JSON lines.
+The following events are emitted:
+
+- ``spawn``: The launcher has started the product.
+- ``first-check``: The first health check after starting has completed.
+- ``server-ready``: A single server of the product has passed its first health
+  check, for launchers implementing :class:`.SupportsServerChecks`.
+- ``ready``: The product has become ready in :meth:`.ProductInstance.wait`.
+- ``wait-failed``: The product did not become ready in :meth:`.ProductInstance.wait`.
+- ``unhealthy``: A health check failed after the product was ready.
+- ``stop``: The product has been stopped.
+
+Launcher plugins can emit additional events with :func:`emit`, for example
+``kill-escalation`` when the product has to be killed after failing to stop.
+
+Each record contains the event name, a monotonic and a wall-clock timestamp,
+the PID of the launching process, and the ID of the instance. To correlate
+the events with the product's own logs, each instance has a W3C trace context.
+Launchers can pass it to the product in the ``TRACEPARENT`` environment variable
+with :func:`child_environment`.
+"""
+
+from collections.abc import Iterator, Mapping
+import contextlib
+import contextvars
+import dataclasses
+import json
+import os
+import re
+import threading
+import time
+from typing import IO, Any
+import uuid
+
+__all__ = [
+    "TRACEPARENT_ENV_VAR",
+    "EventLog",
+    "TraceContext",
+    "set_event_log",
+    "get_event_log",
+    "emit",
+    "child_environment",
+]
+
+TRACEPARENT_ENV_VAR = "TRACEPARENT"
+
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+@dataclasses.dataclass(frozen=True)
+class TraceContext:
+    """Identifies a product instance in logs and traces."""
+
+    instance_id: str
+    trace_id: str
+    span_id: str
+
+    @classmethod
+    def new(cls) -> "TraceContext":
+        """Create a trace context for a new instance.
+
+        If the current process has a valid ``TRACEPARENT`` environment
+        variable, its trace ID is reused. Otherwise, a new trace is started.
+        """
+        match = _TRACEPARENT_PATTERN.match(os.environ.get(TRACEPARENT_ENV_VAR, ""))
+        trace_id = match.group(1) if match else uuid.uuid4().hex
+        span_id = uuid.uuid4().hex[:16]
+        return cls(instance_id=span_id, trace_id=trace_id, span_id=span_id)
+
+    @property
+    def traceparent(self) -> str:
+        """Trace context in the W3C ``traceparent`` format."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+class EventLog:
+    """Writes events as JSON lines to a file.
+
+    Parameters
+    ----------
+    sink :
+        Path of the file, which is opened in append mode, or an open text file.
+    """
+
+    def __init__(self, sink: str | os.PathLike[str] | IO[str]):
+        if isinstance(sink, (str, os.PathLike)):
+            self._file: IO[str] = open(sink, "a", encoding="utf-8")
+            self._owns_file = True
+        else:
+            self._file = sink
+            self._owns_file = False
+        self._lock = threading.Lock()
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        """Write a single record to the log.
+
+        Parameters
+        ----------
+        record :
+            JSON-serializable record. Values which are not serializable are
+            converted to strings.
+        """
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the file, if it was opened by the event log."""
+        if self._owns_file:
+            self._file.close()
+
+
+_EVENT_LOG: EventLog | None = None
+_CURRENT_TRACE_CONTEXT: contextvars.ContextVar[TraceContext | None] = contextvars.ContextVar(
+    "current_trace_context", default=None
+)
+
+
+def set_event_log(sink: str | os.PathLike[str] | IO[str] | EventLog | None) -> None:
+    """Set the sink for lifecycle events.
+
+    Parameters
+    ----------
+    sink :
+        Path of a JSONL file, an open text file, or an :class:`EventLog`.
+        If ``None``, events are no longer recorded.
+    """
+    global _EVENT_LOG
+    if _EVENT_LOG is not None:
+        _EVENT_LOG.close()
+    if sink is None or isinstance(sink, EventLog):
+        _EVENT_LOG = sink
+    else:
+        _EVENT_LOG = EventLog(sink)
+
+
+def get_event_log() -> EventLog | None:
+    """Get the current sink for lifecycle events."""
+    return _EVENT_LOG
+
+
+def emit(event: str, *, trace_context: TraceContext | None = None, **fields: Any) -> None:
+    """Emit a lifecycle event.
+
+    This function does nothing if no event log is configured.
+
+    Parameters
+    ----------
+    event :
+        Name of the event.
+    trace_context :
+        Trace context of the instance the event relates to. By default,
+        the trace context of the instance currently being started, checked
+        or stopped is used.
+    fields :
+        Additional JSON-serializable fields of the event.
+    """
+    event_log = _EVENT_LOG
+    if event_log is None:
+        return
+    if trace_context is None:
+        trace_context = _CURRENT_TRACE_CONTEXT.get()
+    record: dict[str, Any] = {
+        "event": event,
+        "monotonic": time.monotonic(),
+        "time": time.time(),
+        "pid": os.getpid(),
+    }
+    if trace_context is not None:
+        record["instance_id"] = trace_context.instance_id
+        record["trace_id"] = trace_context.trace_id
+    record.update(fields)
+    event_log.write(record)
+
+
+def child_environment(env: Mapping[str, str] | None = None) -> dict[str, str]:
+    """Get the environment for a product process, including the trace context.
+
+    This function is intended to be called from the launcher's ``start()``
+    method, and its result passed as ``env`` to :class:`subprocess.Popen`.
+
+    Parameters
+    ----------
+    env :
+        Base environment. By default, the environment of the current process.
+
+    Returns
+    -------
+    :
+        Copy of the environment, with ``TRACEPARENT`` set to the trace context
+        of the instance being started.
+    """
+    res = dict(os.environ if env is None else env)
+    trace_context = _CURRENT_TRACE_CONTEXT.get()
+    if trace_context is not None:
+        res[TRACEPARENT_ENV_VAR] = trace_context.traceparent
+    return res
+
+
+@contextlib.contextmanager
+def _use_trace_context(trace_context: TraceContext) -> Iterator[None]:
+    """Make the trace context current while calling into the launcher."""
+    token = _CURRENT_TRACE_CONTEXT.set(trace_context)
+    try:
+        yield
+    finally:
+        _CURRENT_TRACE_CONTEXT.reset(token)
@@ -23,12 +23,21 @@
 """Defines options for connecting to a gRPC server."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 import enum
+import functools
+import json
+import os
 from pathlib import Path
+import platform
+import socket
+import sys
+import tempfile
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import grpc
+import platformdirs
 
 from ._vendored import cyberchannel
 
@@ -39,6 +48,12 @@ __all__ = [
     "MTLSOptions",
     "InsecureOptions",
     "TransportOptionsType",
+    "TransportCapabilities",
+    "get_transport_capabilities",
+    "resolve_transport_mode",
+    "select_transport_options",
+    "transport_options_to_dict",
+    "transport_options_from_dict",
 ]
 
 # For Python 3.10 and below, emulate the behavior of StrEnum by
@@ -73,6 +88,12 @@ class TransportMode(StrEnum):
     WNUA = "wnua"
     MTLS = "mtls"
     INSECURE = "insecure"
+    AUTO = "auto"
+    """Placeholder resolved to a concrete mode by :func:`resolve_transport_mode`.
+
+    If a field of a launcher configuration is set to ``AUTO``,
+    :func:`.launch_product` resolves it before creating the launcher.
+    """
 
 
 class TransportOptionsBase(ABC):
@@ -100,6 +121,23 @@ class TransportOptionsBase(ABC):
         """
         return cyberchannel.create_channel(**self._to_cyberchannel_kwargs(), **extra_kwargs)
 
+    def create_aio_channel(self, **extra_kwargs: Any) -> grpc.aio.Channel:
+        """Create a ``grpc.aio`` channel using the transport options.
+
+        The channel must be used from within a running asyncio event loop.
+
+        Parameters
+        ----------
+        extra_kwargs :
+            Extra keyword arguments to pass to the channel creation function.
+
+        Returns
+        -------
+        :
+            Asynchronous gRPC channel created using the transport options.
+        """
+        return cyberchannel.create_aio_channel(**self._to_cyberchannel_kwargs(), **extra_kwargs)
+
     @abstractmethod
     def _to_cyberchannel_kwargs(self) -> dict[str, Any]:
         """Convert transport options to cyberchannel keyword arguments.
@@ -182,3 +220,257 @@ class InsecureOptions(TransportOptionsBase):
 
 
 TransportOptionsType = UDSOptions | WNUAOptions | MTLSOptions | InsecureOptions
+
+
+_TRANSPORT_MODE_PREFERENCE = (
+    TransportMode.UDS,
+    TransportMode.WNUA,
+    TransportMode.MTLS,
+    TransportMode.INSECURE,
+)
+"""Concrete transport modes, in order of preference.
+
+The local transports come first, since they have the lowest latency and
+are secured by the operating system. mTLS is preferred over the insecure
+mode, so that TLS is never given up to save latency.
+"""
+
+_CAPABILITIES_CACHE_FILENAME = "transport_capabilities.json"
+
+
+@dataclass(frozen=True, kw_only=True)
+class TransportCapabilities:
+    """Transport features supported by the current platform and gRPC build."""
+
+    grpc_version: str
+    uds_supported: bool
+    uds_dir_writable: bool
+    wnua_supported: bool
+
+    @property
+    def available_modes(self) -> tuple[TransportMode, ...]:
+        """Concrete transport modes usable on this machine, in order of preference."""
+        usable = {
+            TransportMode.UDS: self.uds_supported and self.uds_dir_writable,
+            TransportMode.WNUA: self.wnua_supported,
+            TransportMode.INSECURE: True,
+            TransportMode.MTLS: True,
+        }
+        return tuple(mode for mode in _TRANSPORT_MODE_PREFERENCE if usable[mode])
+
+
+def get_transport_capabilities(*, use_disk_cache: bool = True) -> TransportCapabilities:
+    """Get the transport capabilities of the current machine.
+
+    The capabilities are probed once per process. If ``use_disk_cache`` is
+    set, the probe result is additionally stored in the user cache directory,
+    and reused by other processes on the same host until the Python or
+    gRPC version changes.
+
+    Parameters
+    ----------
+    use_disk_cache :
+        Whether to read and write the on-disk capability cache.
+
+    Returns
+    -------
+    :
+        Capabilities of the current machine.
+    """
+    return _get_transport_capabilities_cached(use_disk_cache=use_disk_cache)
+
+
+def resolve_transport_mode(
+    supported_modes: Iterable[TransportMode | str],
+    *,
+    capabilities: TransportCapabilities | None = None,
+) -> TransportMode:
+    """Pick the preferred transport mode out of the modes a launcher supports.
+
+    Modes are ranked UDS, WNUA, mTLS, insecure. Modes which the current
+    machine cannot use, as determined by :func:`get_transport_capabilities`,
+    are skipped.
+
+    Parameters
+    ----------
+    supported_modes :
+        Transport modes advertised by the launcher. ``TransportMode.AUTO``
+        entries are ignored.
+    capabilities :
+        Capabilities to use for the selection. By default, the capabilities
+        of the current machine are used.
+
+    Returns
+    -------
+    :
+        Concrete transport mode to use.
+
+    Raises
+    ------
+    ValueError
+        If none of the supported modes can be used on this machine.
+    """
+    if capabilities is None:
+        capabilities = get_transport_capabilities()
+    requested = {TransportMode(mode) for mode in supported_modes}
+    for mode in capabilities.available_modes:
+        if mode in requested:
+            return mode
+    raise ValueError(
+        f"None of the transport modes {sorted(requested - {TransportMode.AUTO})} "
+        "are usable on this machine."
+    )
+
+
+def select_transport_options(
+    candidates: Iterable[TransportOptionsType],
+    *,
+    capabilities: TransportCapabilities | None = None,
+) -> TransportOptionsType:
+    """Pick the preferred transport options out of a set of candidates.
+
+    Parameters
+    ----------
+    candidates :
+        Transport options the launcher can start its server with.
+    capabilities :
+        Capabilities to use for the selection. By default, the capabilities
+        of the current machine are used.
+
+    Returns
+    -------
+    :
+        The candidate whose transport mode is returned by :func:`resolve_transport_mode`.
+    """
+    candidates_by_mode: dict[TransportMode, TransportOptionsType] = {}
+    for candidate in candidates:
+        candidates_by_mode.setdefault(candidate.mode, candidate)
+    mode = resolve_transport_mode(candidates_by_mode, capabilities=capabilities)
+    return candidates_by_mode[mode]
+
+
+def transport_options_to_dict(transport_options: Any) -> dict[str, Any]:
+    """Convert transport options to a JSON-serializable dictionary.
+
+    This can be used to pass the transport options of a running product
+    to another process.
+
+    Parameters
+    ----------
+    transport_options :
+        Transport options to convert. Both the transport options defined in
+        this module and those of ``ansys-tools-common`` are supported.
+
+    Returns
+    -------
+    :
+        Dictionary containing the transport mode and the options.
+    """
+    res: dict[str, Any] = {"mode": TransportMode(transport_options.mode).value}
+    for key, value in asdict(transport_options).items():
+        res[key] = str(value) if isinstance(value, os.PathLike) else value
+    return res
+
+
+def transport_options_from_dict(data: dict[str, Any]) -> TransportOptionsType:
+    """Create transport options from a dictionary.
+
+    Parameters
+    ----------
+    data :
+        Dictionary as returned by :func:`transport_options_to_dict`.
+
+    Returns
+    -------
+    :
+        Transport options of the class corresponding to the transport mode.
+
+    Raises
+    ------
+    ValueError
+        If the transport mode is not supported.
+    """
+    options = dict(data)
+    mode = TransportMode(options.pop("mode"))
+    options_classes: dict[TransportMode, type[TransportOptionsType]] = {
+        TransportMode.UDS: UDSOptions,
+        TransportMode.WNUA: WNUAOptions,
+        TransportMode.MTLS: MTLSOptions,
+        TransportMode.INSECURE: InsecureOptions,
+    }
+    if mode not in options_classes:
+        raise ValueError(f"Transport mode '{mode}' cannot be used to create transport options.")
+    return options_classes[mode](**options)
+
+
+def _get_uds_path(transport_options: Any) -> Path:
+    """Get the path of the socket file described by UDS transport options."""
+    uds_service = transport_options.uds_service
+    uds_id = transport_options.uds_id
+    filename = f"{uds_service}-{uds_id}.sock" if uds_id else f"{uds_service}.sock"
+    return cyberchannel.determine_uds_folder(transport_options.uds_dir) / filename
+
+
+@functools.lru_cache(maxsize=None)
+def _get_transport_capabilities_cached(*, use_disk_cache: bool) -> TransportCapabilities:
+    if not use_disk_cache:
+        return _probe_transport_capabilities()
+
+    cache_key = _get_capabilities_cache_key()
+    cache_path = _get_capabilities_cache_path()
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached.get("key") == cache_key:
+            return TransportCapabilities(**cached["capabilities"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    capabilities = _probe_transport_capabilities()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that concurrent readers
+        # never observe a partially written cache.
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"key": cache_key, "capabilities": asdict(capabilities)}))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return capabilities
+
+
+def _get_capabilities_cache_key() -> dict[str, str]:
+    return {
+        "host": platform.node(),
+        "platform": sys.platform,
+        "python": platform.python_version(),
+        "grpc": grpc.__version__,
+    }
+
+
+def _get_capabilities_cache_path() -> Path:
+    return (
+        Path(platformdirs.user_cache_dir("ansys_tools_local_product_launcher"))
+        / _CAPABILITIES_CACHE_FILENAME
+    )
+
+
+def _probe_transport_capabilities() -> TransportCapabilities:
+    return TransportCapabilities(
+        grpc_version=grpc.__version__,
+        # On Windows, this includes the check of the gRPC version.
+        uds_supported=cyberchannel.is_uds_supported() and hasattr(socket, "AF_UNIX"),
+        uds_dir_writable=_probe_uds_dir_writable(),
+        wnua_supported=os.name == "nt",
+    )
+
+
+def _probe_uds_dir_writable() -> bool:
+    try:
+        uds_folder = cyberchannel.determine_uds_folder()
+        uds_folder.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=uds_folder):
+            pass
+        return True
+    except (OSError, KeyError):
+        # KeyError is raised if the home directory environment variable is not set.
+        return False
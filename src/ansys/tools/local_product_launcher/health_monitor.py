@@ -0,0 +1,354 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines a shared background monitor of the health of many product instances."""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+import heapq
+import logging
+import threading
+import time
+from typing import Any
+
+from ansys.tools.common.launcher.interface import ServerType
+import grpc
+from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse
+from grpc_health.v1.health_pb2_grpc import HealthStub
+
+from . import metrics
+from .product_instance import ProductInstance
+
+__all__ = ["HealthCallback", "HealthMonitor"]
+
+HealthCallback = Callable[[ProductInstance, bool], None]
+"""Callback invoked with an instance and its new health state."""
+
+_LOGGER = logging.getLogger(__name__)
+
+# Successive multiples of the golden ratio modulo 1 are evenly spread over
+# [0, 1), no matter how many instances are registered.
+_GOLDEN_RATIO_CONJUGATE = 0.6180339887498949
+
+
+@dataclasses.dataclass(eq=False)
+class _Entry:
+    instance: ProductInstance
+    healthy: bool | None = None
+    in_flight: bool = False
+
+
+class HealthMonitor:
+    """Monitors the health of many product instances from a single thread.
+
+    Each registered instance is checked once per ``interval``. The checks of
+    different instances are staggered over the interval, so that they do not
+    happen in bursts. The callbacks are invoked with the first result for each
+    instance, and whenever its health state changes.
+
+    For instances whose servers are all gRPC servers, the checks are made
+    with asynchronous calls to the standard gRPC health service, so that any
+    number of checks can be in flight without additional threads. Other
+    instances are checked with :meth:`.ProductInstance.check_servers` in a
+    small thread pool.
+
+    The results are also recorded as if :meth:`.ProductInstance.check` had
+    been called. If the instance uses a :class:`.HealthCheckPolicy` with a
+    ``cache_ttl`` of at least the ``interval``, calls to ``check()`` are then
+    answered from the monitor's results.
+
+    The background thread is started when the first instance is registered,
+    and exits when no instances are registered. Callbacks are invoked on this
+    thread, and should return quickly.
+
+    The :class:`HealthMonitor` class can be used as a context manager,
+    closing the monitor when exiting the context.
+
+    Parameters
+    ----------
+    interval :
+        Time in seconds between checks of each instance.
+    timeout :
+        Timeout in seconds of each check. Defaults to the ``interval``.
+    max_workers :
+        Number of threads used to check instances which have servers other
+        than gRPC servers.
+    """
+
+    def __init__(
+        self, *, interval: float = 5.0, timeout: float | None = None, max_workers: int = 4
+    ):
+        if interval <= 0:
+            raise ValueError("The 'interval' must be positive.")
+        self._interval = interval
+        self._timeout = interval if timeout is None else timeout
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._entries: dict[ProductInstance, _Entry] = {}
+        # The schedule is a heap of (due time, sequence number, entry). The
+        # sequence number breaks ties, since entries are not comparable.
+        self._schedule: list[tuple[float, int, _Entry]] = []
+        self._num_scheduled = 0
+        self._num_registered = 0
+        self._results: list[tuple[_Entry, bool, float]] = []
+        self._callbacks: list[HealthCallback] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def __enter__(self) -> "HealthMonitor":
+        """Enter the context manager defined by the health monitor."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the health monitor when exiting a context manager."""
+        self.close()
+
+    @property
+    def interval(self) -> float:
+        """Time in seconds between checks of each instance."""
+        return self._interval
+
+    @property
+    def instances(self) -> tuple[ProductInstance, ...]:
+        """Instances currently registered with the monitor."""
+        with self._lock:
+            return tuple(self._entries)
+
+    def add_callback(self, callback: HealthCallback) -> None:
+        """Add a callback invoked when the health state of an instance changes.
+
+        Parameters
+        ----------
+        callback :
+            Function called with the instance and its new health state.
+            Exceptions raised by the callback are logged and otherwise ignored.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: HealthCallback) -> None:
+        """Remove a callback added with :meth:`add_callback`."""
+        with self._lock:
+            self._callbacks.remove(callback)
+
+    def register(self, instance: ProductInstance) -> None:
+        """Start monitoring an instance.
+
+        Parameters
+        ----------
+        instance :
+            Instance to monitor. Registering an instance which is already
+            monitored has no effect.
+
+        Raises
+        ------
+        RuntimeError
+            If the monitor is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The health monitor is closed.")
+            if instance in self._entries:
+                return
+            entry = _Entry(instance)
+            self._entries[instance] = entry
+            offset = (self._num_registered * _GOLDEN_RATIO_CONJUGATE) % 1.0
+            self._num_registered += 1
+            self._schedule_entry(entry, time.monotonic() + offset * self._interval)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="HealthMonitor", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+
+    def unregister(self, instance: ProductInstance) -> None:
+        """Stop monitoring an instance.
+
+        Unregistering an instance which is not monitored has no effect.
+        """
+        with self._lock:
+            self._entries.pop(instance, None)
+            self._wakeup.notify()
+
+    def get_health(self, instance: ProductInstance) -> bool | None:
+        """Get the most recent health state of a registered instance.
+
+        Returns
+        -------
+        :
+            Result of the most recent check, or ``None`` if the instance
+            has not been checked yet.
+
+        Raises
+        ------
+        KeyError
+            If the instance is not registered.
+        """
+        with self._lock:
+            return self._entries[instance].healthy
+
+    def close(self) -> None:
+        """Stop monitoring all instances, and wait for the background thread to exit."""
+        with self._lock:
+            self._closed = True
+            self._entries.clear()
+            self._wakeup.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _schedule_entry(self, entry: _Entry, due_time: float) -> None:
+        heapq.heappush(self._schedule, (due_time, self._num_scheduled, entry))
+        self._num_scheduled += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed or not self._entries:
+                    self._schedule.clear()
+                    self._thread = None
+                    return
+                due_entries = self._pop_due_entries()
+                changes = self._process_results()
+                callbacks = list(self._callbacks)
+
+            for entry in due_entries:
+                self._start_check(entry)
+            for instance, healthy in changes:
+                for callback in callbacks:
+                    try:
+                        callback(instance, healthy)
+                    except Exception:
+                        _LOGGER.exception("Health monitor callback %r failed.", callback)
+
+            with self._lock:
+                if not self._results and not self._closed and self._entries:
+                    self._wakeup.wait(timeout=max(self._schedule[0][0] - time.monotonic(), 0))
+
+    def _pop_due_entries(self) -> list[_Entry]:
+        now = time.monotonic()
+        due_entries = []
+        while self._schedule and self._schedule[0][0] <= now:
+            due_time, _, entry = heapq.heappop(self._schedule)
+            if self._entries.get(entry.instance) is not entry:
+                # The instance has been unregistered.
+                continue
+            # Keep the fixed rate, so that the stagger between instances is
+            # preserved. If the monitor has fallen behind, missed checks are
+            # skipped rather than made in a burst.
+            next_due_time = due_time + self._interval
+            if next_due_time <= now:
+                next_due_time = now + self._interval
+            self._schedule_entry(entry, next_due_time)
+            # An instance whose previous check has not finished is skipped.
+            if not entry.in_flight:
+                entry.in_flight = True
+                due_entries.append(entry)
+        return due_entries
+
+    def _process_results(self) -> list[tuple[ProductInstance, bool]]:
+        changes = []
+        for entry, healthy, check_time in self._results:
+            entry.in_flight = False
+            if self._entries.get(entry.instance) is not entry:
+                continue
+            entry.instance._record_check_result(healthy, check_time=check_time)
+            if entry.healthy != healthy:
+                entry.healthy = healthy
+                changes.append((entry.instance, healthy))
+        self._results.clear()
+        return changes
+
+    def _report(self, entry: _Entry, healthy: bool, check_time: float) -> None:
+        with self._lock:
+            self._results.append((entry, healthy, check_time))
+            self._wakeup.notify()
+
+    def _start_check(self, entry: _Entry) -> None:
+        check_time = time.monotonic()
+        instance = entry.instance
+        try:
+            if instance.stopped:
+                self._report(entry, False, check_time)
+                return
+            server_types = set(instance._launcher.SERVER_SPEC.values())
+            if server_types == {ServerType.GRPC}:
+                channels = list(instance.channels.values())
+                if channels:
+                    self._start_grpc_check(entry, channels, check_time)
+                    return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="HealthMonitorCheck"
+                )
+            self._executor.submit(self._run_blocking_check, entry, check_time)
+        except Exception:
+            _LOGGER.exception("Failed to start the health check of %r.", instance)
+            self._report(entry, False, check_time)
+
+    def _run_blocking_check(self, entry: _Entry, check_time: float) -> None:
+        # The result is recorded in the instance when it is processed, so
+        # 'check_servers' is used instead of 'check', which records it too.
+        try:
+            healthy = all(entry.instance.check_servers(timeout=self._timeout).values())
+        except Exception:
+            healthy = False
+        self._report(entry, healthy, check_time)
+
+    def _start_grpc_check(
+        self, entry: _Entry, channels: list[grpc.Channel], check_time: float
+    ) -> None:
+        lock = threading.Lock()
+        results: list[bool] = []
+
+        def record(healthy: bool) -> None:
+            metrics.HEALTH_CHECK_SECONDS.observe(
+                time.monotonic() - check_time,
+                result="serving" if healthy else "not_serving",
+            )
+            with lock:
+                results.append(healthy)
+                if len(results) < len(channels):
+                    return
+            self._report(entry, all(results), check_time)
+
+        def on_done(future: grpc.Future) -> None:
+            try:
+                healthy = future.result().status == HealthCheckResponse.ServingStatus.SERVING
+            except grpc.RpcError:
+                healthy = False
+            record(healthy)
+
+        for channel in channels:
+            # Each channel must produce a result, so that the check completes.
+            try:
+                future = HealthStub(channel).Check.future(
+                    HealthCheckRequest(), timeout=self._timeout
+                )
+            except Exception:
+                _LOGGER.exception("Failed to start the health check of %r.", entry.instance)
+                record(False)
+            else:
+                future.add_done_callback(on_done)
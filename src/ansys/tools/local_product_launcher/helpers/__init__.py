@@ -33,6 +33,6 @@ warnings.warn(
 )
 
 
-from ansys.tools.common.launcher.helpers import grpc, ports  # noqa
+from . import grpc, http, notify, output, ports, servers, socket_activation  # noqa
 
-__all__ = ["grpc", "ports"]
+__all__ = ["grpc", "http", "notify", "output", "ports", "servers", "socket_activation"]
@@ -32,4 +32,34 @@ warnings.warn(
     DeprecationWarning,
 )
 
-from ansys.tools.common.launcher.helpers.grpc import *  # noqa
+import time
+
+from ansys.tools.common.launcher.helpers import grpc as _common_grpc
+import grpc
+
+from .. import metrics
+
+__all__ = ["check_grpc_health"]
+
+
+def check_grpc_health(channel: grpc.Channel, timeout: float | None = None) -> bool:
+    """Check that a gRPC server is responding to health check requests.
+
+    Parameters
+    ----------
+    channel :
+        Channel to the gRPC server.
+    timeout :
+        Timeout in seconds for the gRPC health check request.
+
+    Returns
+    -------
+    bool
+        ``True`` if the health check succeeds, ``False`` otherwise.
+    """
+    start_time = time.monotonic()
+    res = _common_grpc.check_grpc_health(channel, timeout=timeout)
+    metrics.HEALTH_CHECK_SECONDS.observe(
+        time.monotonic() - start_time, result="serving" if res else "not_serving"
+    )
+    return res
@@ -0,0 +1,305 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for interacting with HTTP servers.
+
+Connections are kept alive and reused between health checks of the same
+server, so that each check costs a single request instead of a new TCP
+connection. Idle connections are closed once they have not been used for
+a while, or when too many are kept.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Container
+import http.client
+import os
+import socket
+import threading
+import time
+from typing import Any
+import urllib.parse
+
+__all__ = ["check_http_health", "close_http_connections"]
+
+_MAX_IDLE_CONNECTIONS_PER_SERVER = 4
+_MAX_IDLE_CONNECTIONS = 64
+_IDLE_TIMEOUT = 30.0
+
+# Exceptions indicating that an idle keep-alive connection was closed by
+# the server. A request which fails this way is retried on a new connection.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+_ConnectionKey = tuple[str, str, str | None]
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, host: str, *, uds_path: str, timeout: float | None = None):
+        super().__init__(host, timeout=timeout)
+        self._uds_path = uds_path
+
+    def connect(self) -> None:
+        """Connect to the Unix domain socket."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._uds_path)
+        except BaseException:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections, per server.
+
+    Servers are kept in least recently used order, and each connection
+    is stored with the time at which it became idle.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._idle: OrderedDict[_ConnectionKey, list[tuple[http.client.HTTPConnection, float]]] = (
+            OrderedDict()
+        )
+
+    def acquire(self, key: _ConnectionKey) -> http.client.HTTPConnection | None:
+        with self._lock:
+            self._reset_after_fork()
+            expired = self._pop_expired()
+            connections = self._idle.get(key)
+            connection = connections.pop()[0] if connections else None
+            if connections == []:
+                del self._idle[key]
+        _close_all(expired)
+        return connection
+
+    def release(self, key: _ConnectionKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._reset_after_fork()
+            expired = self._pop_expired()
+            connections = self._idle.setdefault(key, [])
+            self._idle.move_to_end(key)
+            if len(connections) < _MAX_IDLE_CONNECTIONS_PER_SERVER:
+                connections.append((connection, time.monotonic()))
+                expired += self._pop_least_recently_used()
+            else:
+                expired.append(connection)
+        _close_all(expired)
+
+    def clear(self, predicate: Callable[[_ConnectionKey], bool] | None = None) -> None:
+        with self._lock:
+            self._reset_after_fork()
+            keys = [key for key in self._idle if predicate is None or predicate(key)]
+            removed = [connection for key in keys for connection, _ in self._idle.pop(key)]
+        _close_all(removed)
+
+    def _pop_expired(self) -> list[http.client.HTTPConnection]:
+        # Connections are appended in the order they become idle, so the
+        # expired connections of a server are at the start of its list.
+        expired_before = time.monotonic() - _IDLE_TIMEOUT
+        expired = []
+        for key in list(self._idle):
+            connections = self._idle[key]
+            num_expired = sum(1 for _, idle_since in connections if idle_since < expired_before)
+            expired += [connection for connection, _ in connections[:num_expired]]
+            del connections[:num_expired]
+            if not connections:
+                del self._idle[key]
+        return expired
+
+    def _pop_least_recently_used(self) -> list[http.client.HTTPConnection]:
+        evicted = []
+        num_idle = sum(len(connections) for connections in self._idle.values())
+        while num_idle > _MAX_IDLE_CONNECTIONS:
+            key, connections = next(iter(self._idle.items()))
+            evicted.append(connections.pop(0)[0])
+            if not connections:
+                del self._idle[key]
+            num_idle -= 1
+        return evicted
+
+    def _reset_after_fork(self) -> None:
+        # Connections inherited from the parent process must not be used,
+        # since the parent shares the underlying sockets.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._idle = OrderedDict()
+
+
+_POOL = _ConnectionPool()
+
+
+def check_http_health(
+    url: str,
+    path: str = "/",
+    timeout: float | None = None,
+    *,
+    uds_path: str | os.PathLike[str] | None = None,
+    expected_status: int | Container[int] | None = None,
+) -> bool:
+    """Check that an HTTP server is responding to requests.
+
+    A ``GET`` request is sent to the server, reusing an idle keep-alive
+    connection to the same server if one is available.
+
+    Parameters
+    ----------
+    url :
+        URL of the server, for example ``http://localhost:8080``. If the
+        scheme is omitted, ``http`` is used. Both ``http`` and ``https``
+        are supported.
+    path :
+        Path of the health endpoint on the server.
+    timeout :
+        Timeout in seconds for connecting and for each read of the response.
+    uds_path :
+        Path of a Unix domain socket to connect to instead of the host and
+        port of the URL. The host of the URL is still sent in the ``Host``
+        header. Only supported with the ``http`` scheme.
+    expected_status :
+        HTTP status code, or collection of status codes, which indicate that
+        the server is healthy. By default, any ``2xx`` status code is accepted.
+
+    Returns
+    -------
+    bool
+        ``True`` if the server responds with an expected status code,
+        ``False`` otherwise.
+    """
+    if "://" not in url:
+        url = f"http://{url}"
+    parsed_url = urllib.parse.urlsplit(url)
+    if uds_path is not None:
+        uds_path = os.fspath(uds_path)
+        if parsed_url.scheme != "http":
+            raise ValueError("Unix domain sockets are only supported with the 'http' scheme.")
+    key: _ConnectionKey = (parsed_url.scheme, parsed_url.netloc, uds_path)
+
+    connection = _POOL.acquire(key)
+    reused = connection is not None
+    if connection is None:
+        connection = _create_connection(parsed_url, uds_path=uds_path, timeout=timeout)
+    try:
+        status = _get_status(connection, path, timeout=timeout)
+    except _STALE_CONNECTION_ERRORS:
+        connection.close()
+        if not reused:
+            return False
+        connection = _create_connection(parsed_url, uds_path=uds_path, timeout=timeout)
+        try:
+            status = _get_status(connection, path, timeout=timeout)
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            return False
+    except (OSError, http.client.HTTPException):
+        connection.close()
+        return False
+    if connection.sock is not None:
+        _POOL.release(key, connection)
+
+    if expected_status is None:
+        return 200 <= status < 300
+    if isinstance(expected_status, int):
+        return status == expected_status
+    return status in expected_status
+
+
+def close_http_connections(
+    url: str | None = None, *, uds_path: str | os.PathLike[str] | None = None
+) -> None:
+    """Close idle connections kept alive by :func:`check_http_health`.
+
+    Launchers should call this function when stopping a server, since its
+    connections cannot be reused by the next server.
+
+    Parameters
+    ----------
+    url :
+        URL of the server whose connections are closed. If the scheme is
+        omitted, ``http`` is used.
+    uds_path :
+        Path of the Unix domain socket of the server whose connections
+        are closed.
+
+    If neither ``url`` nor ``uds_path`` is given, all idle connections
+    are closed.
+    """
+    if url is None and uds_path is None:
+        _POOL.clear()
+        return
+    server: tuple[str, str] | None = None
+    if url is not None:
+        if "://" not in url:
+            url = f"http://{url}"
+        parsed_url = urllib.parse.urlsplit(url)
+        server = (parsed_url.scheme, parsed_url.netloc)
+    uds_path = None if uds_path is None else os.fspath(uds_path)
+
+    def matches(key: _ConnectionKey) -> bool:
+        if server is not None and key[:2] != server:
+            return False
+        return uds_path is None or key[2] == uds_path
+
+    _POOL.clear(matches)
+
+
+def _close_all(connections: list[http.client.HTTPConnection]) -> None:
+    for connection in connections:
+        connection.close()
+
+
+def _create_connection(
+    parsed_url: urllib.parse.SplitResult, *, uds_path: str | None, timeout: float | None
+) -> http.client.HTTPConnection:
+    if parsed_url.scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme '{parsed_url.scheme}'.")
+    host = parsed_url.hostname or "localhost"
+    if uds_path is not None:
+        return _UnixHTTPConnection(host, uds_path=uds_path, timeout=timeout)
+    connection_class: Any = (
+        http.client.HTTPSConnection if parsed_url.scheme == "https" else http.client.HTTPConnection
+    )
+    connection: http.client.HTTPConnection = connection_class(
+        host, port=parsed_url.port, timeout=timeout
+    )
+    return connection
+
+
+def _get_status(connection: http.client.HTTPConnection, path: str, *, timeout: float | None) -> int:
+    # Reused connections keep the timeout of their first request otherwise.
+    connection.timeout = timeout
+    if connection.sock is not None:
+        connection.sock.settimeout(timeout)
+    connection.request("GET", path or "/")
+    response = connection.getresponse()
+    # The body must be read completely before the connection can be reused.
+    response.read()
+    if response.will_close:
+        connection.close()
+    return response.status
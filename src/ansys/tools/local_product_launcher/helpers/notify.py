@@ -0,0 +1,214 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for readiness notification with the ``sd_notify`` protocol.
+
+The launcher creates a :class:`NotifySocket`, and passes its path to the
+product in the ``NOTIFY_SOCKET`` environment variable. Once the product
+is ready to serve requests, it sends a ``READY=1`` datagram to the socket.
+The launcher's ``wait_ready`` method, as defined by
+:class:`.interface.SupportsReadinessNotification`, can then block on
+:meth:`NotifySocket.wait_ready` instead of polling health checks.
+
+Readiness notification is only available on POSIX systems.
+"""
+
+import os
+import pathlib
+import select
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+from typing import Any
+
+__all__ = ["NOTIFY_SOCKET_ENV_VAR", "NotifySocket", "notify"]
+
+NOTIFY_SOCKET_ENV_VAR = "NOTIFY_SOCKET"
+
+_MAX_MESSAGE_SIZE = 4096
+_POLL_INTERVAL = 0.1
+
+
+class NotifySocket:
+    """Provides a socket which the product can send readiness notifications to.
+
+    The :class:`NotifySocket` class can be used as a context manager, closing
+    the socket when exiting the context.
+
+    Raises
+    ------
+    NotImplementedError
+        If the platform does not support readiness notification.
+    """
+
+    def __init__(self) -> None:
+        if not hasattr(socket, "AF_UNIX") or os.name == "nt":
+            raise NotImplementedError("Readiness notification is not supported on Windows.")
+        # Use a short temporary directory, since the length of socket
+        # paths is limited.
+        self._tmp_dir = pathlib.Path(tempfile.mkdtemp(prefix="ansys-notify-"))
+        self._path = self._tmp_dir / "notify.sock"
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(str(self._path))
+        self._socket.setblocking(False)
+        self._ready = False
+        self._status: str | None = None
+        self._errno: int | None = None
+
+    def __enter__(self) -> "NotifySocket":
+        """Enter the context manager defined by the notify socket."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the socket when exiting a context manager."""
+        self.close()
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Path of the socket file."""
+        return self._path
+
+    @property
+    def env(self) -> dict[str, str]:
+        """Environment variables to pass to the product."""
+        return {NOTIFY_SOCKET_ENV_VAR: str(self._path)}
+
+    @property
+    def ready(self) -> bool:
+        """Flag indicating if the product has reported to be ready."""
+        self._receive_pending()
+        return self._ready
+
+    @property
+    def status(self) -> str | None:
+        """Last status line reported by the product with ``STATUS=...``."""
+        self._receive_pending()
+        return self._status
+
+    @property
+    def errno(self) -> int | None:
+        """Error number reported by the product with ``ERRNO=...``."""
+        self._receive_pending()
+        return self._errno
+
+    def wait_ready(
+        self, timeout: float | None = None, *, process: "subprocess.Popen[Any] | None" = None
+    ) -> bool:
+        """Wait until the product reports to be ready.
+
+        Parameters
+        ----------
+        timeout :
+            Maximum time in seconds to wait. If ``None``, wait indefinitely.
+        process :
+            Product process. If given, waiting stops early when the process exits.
+
+        Returns
+        -------
+        :
+            ``True`` if the product reported to be ready, ``False`` if the
+            timeout expired.
+
+        Raises
+        ------
+        RuntimeError
+            If the product reported an error with ``ERRNO=...``, or the process
+            exited before reporting to be ready.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._receive_pending()
+            if self._ready:
+                return True
+            if self._errno is not None:
+                message = f"The product reported error {self._errno} ({os.strerror(self._errno)})"
+                if self._status:
+                    message += f" with status '{self._status}'"
+                raise RuntimeError(f"{message}.")
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(
+                    f"The product exited with code {process.returncode} "
+                    "before reporting to be ready."
+                )
+            select_timeout = _POLL_INTERVAL if process is not None else None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                select_timeout = min(remaining, select_timeout or remaining)
+            select.select([self._socket], [], [], select_timeout)
+
+    def close(self) -> None:
+        """Close the socket and remove the socket file."""
+        self._socket.close()
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def _receive_pending(self) -> None:
+        if self._socket.fileno() == -1:
+            return
+        while True:
+            try:
+                message = self._socket.recv(_MAX_MESSAGE_SIZE)
+            except BlockingIOError:
+                return
+            self._handle_message(message.decode(errors="replace"))
+
+    def _handle_message(self, message: str) -> None:
+        for line in message.splitlines():
+            key, _, value = line.partition("=")
+            if key == "READY" and value == "1":
+                self._ready = True
+            elif key == "STATUS":
+                self._status = value
+            elif key == "ERRNO":
+                try:
+                    self._errno = int(value)
+                except ValueError:
+                    pass
+
+
+def notify(message: str = "READY=1") -> bool:
+    """Send a notification to the socket given by the ``NOTIFY_SOCKET`` variable.
+
+    This function is intended for use in the product process.
+
+    Parameters
+    ----------
+    message :
+        Notification to send, as newline-separated ``KEY=VALUE`` assignments.
+
+    Returns
+    -------
+    :
+        ``True`` if the notification was sent, ``False`` if no notification
+        socket is configured.
+    """
+    path = os.environ.get(NOTIFY_SOCKET_ENV_VAR)
+    if not path or not hasattr(socket, "AF_UNIX"):
+        return False
+    # Abstract socket addresses are denoted by a leading '@'.
+    if path.startswith("@"):
+        path = "\0" + path[1:]
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+        sock.sendto(message.encode(), path)
+    return True
@@ -0,0 +1,280 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for capturing the output of a product.
+
+Discarding the product's output with :data:`subprocess.DEVNULL` loses the
+diagnostics of failed launches. Reading it with :data:`subprocess.PIPE`
+on the other hand can deadlock the product once the pipe buffer is full,
+if the output is not continuously read.
+
+The :class:`OutputCapture` class continuously reads the product's output
+in background threads. It keeps the most recent lines in memory, and can
+optionally write all output to size-rotated, compressed log files. It can
+also detect when the product is ready by matching its output against a
+regular expression.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+import dataclasses
+import gzip
+import logging
+import logging.handlers
+import os
+import pathlib
+import re
+import shutil
+import subprocess
+import threading
+import time
+from typing import IO, Any
+
+__all__ = ["OutputLine", "OutputCapture"]
+
+_LOG_FORMAT = "%(asctime)s [%(stream)s] %(message)s"
+
+
+@dataclasses.dataclass(frozen=True)
+class OutputLine:
+    """A single line of output of the product."""
+
+    stream: str
+    """Name of the stream the line was written to, ``"stdout"`` or ``"stderr"``."""
+    text: str
+    """Content of the line, without the trailing newline."""
+
+
+class OutputCapture:
+    """Captures the output of a product process in the background.
+
+    The process must be started with ``stdout=subprocess.PIPE`` and
+    ``stderr=subprocess.PIPE``, and passed to :meth:`attach`. Its output
+    is then read by background threads until the process closes the pipes.
+
+    The :class:`OutputCapture` class implements the ``wait_ready`` method of
+    :class:`.interface.SupportsReadinessNotification`, such that a launcher
+    can delegate its ``wait_ready`` method to it.
+
+    Parameters
+    ----------
+    max_lines :
+        Maximum number of lines kept in memory.
+    max_line_length :
+        Maximum length of a single line, in characters. Longer lines are
+        split into multiple lines.
+    ready_pattern :
+        Regular expression which marks the product as ready when it matches
+        a line of output. If ``None``, :meth:`wait_ready` returns ``None``.
+    log_file :
+        Path of a file which all output is written to. If ``None``, the
+        output is only kept in memory.
+    max_log_bytes :
+        Size of the log file in bytes after which it is rotated. The rotated
+        files are compressed with gzip, and have the suffixes ``.1.gz``,
+        ``.2.gz``, and so on.
+    log_backup_count :
+        Number of rotated log files to keep.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_lines: int = 1000,
+        max_line_length: int = 4096,
+        ready_pattern: str | re.Pattern[str] | None = None,
+        log_file: str | os.PathLike[str] | None = None,
+        max_log_bytes: int = 10 * 1024**2,
+        log_backup_count: int = 3,
+    ):
+        self._lines: deque[OutputLine] = deque(maxlen=max_lines)
+        self._max_line_length = max_line_length
+        self._ready_pattern = re.compile(ready_pattern) if ready_pattern is not None else None
+        self._log_handler: logging.handlers.RotatingFileHandler | None = None
+        if log_file is not None:
+            self._log_handler = _create_log_handler(
+                pathlib.Path(log_file), max_bytes=max_log_bytes, backup_count=log_backup_count
+            )
+        self._condition = threading.Condition()
+        self._ready = False
+        self._threads: list[threading.Thread] = []
+
+    def attach(self, process: subprocess.Popen[Any]) -> None:
+        """Start capturing the output of a process.
+
+        Parameters
+        ----------
+        process :
+            Process started with ``stdout=subprocess.PIPE`` and ``stderr=subprocess.PIPE``.
+            The pipes can be opened in text or binary mode.
+
+        Raises
+        ------
+        ValueError
+            If the process output is not redirected to pipes.
+        """
+        streams = {"stdout": process.stdout, "stderr": process.stderr}
+        for name, stream in streams.items():
+            if stream is None:
+                raise ValueError(f"The {name} of the process must be redirected to a pipe.")
+        for name, stream in streams.items():
+            thread = threading.Thread(
+                target=self._drain,
+                args=(name, stream),
+                name=f"OutputCapture-{process.pid}-{name}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def lines(self) -> list[OutputLine]:
+        """Most recent lines of output, oldest first."""
+        with self._condition:
+            return list(self._lines)
+
+    def tail(self, num_lines: int | None = None) -> str:
+        """Get the most recent output as a string, for example for an error message.
+
+        Parameters
+        ----------
+        num_lines :
+            Number of lines to return. By default, all lines kept in memory are returned.
+        """
+        lines = self.lines
+        if num_lines is not None:
+            lines = lines[-num_lines:] if num_lines > 0 else []
+        return "\n".join(f"[{line.stream}] {line.text}" for line in lines)
+
+    @property
+    def ready(self) -> bool:
+        """Flag indicating if a line of output matched the ``ready_pattern``."""
+        with self._condition:
+            return self._ready
+
+    def wait_ready(self, *, timeout: float) -> bool | None:
+        """Wait until a line of output matches the ``ready_pattern``.
+
+        Parameters
+        ----------
+        timeout :
+            Maximum time in seconds to wait.
+
+        Returns
+        -------
+        bool or None
+            ``True`` if the product is ready, ``False`` if the output did not
+            match within the timeout. ``None`` if no ``ready_pattern`` is set.
+
+        Raises
+        ------
+        RuntimeError
+            If the product closed its output without matching, typically
+            because it exited.
+        """
+        if self._ready_pattern is None:
+            return None
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while not self._ready and not self._finished:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(timeout=remaining)
+            if not self._ready and self._finished:
+                raise RuntimeError("The product closed its output without reporting to be ready.")
+            return self._ready
+
+    def close(self, timeout: float | None = None) -> None:
+        """Wait for the output to be read until the end, and close the log file.
+
+        This method should be called after the process has exited.
+
+        Parameters
+        ----------
+        timeout :
+            Maximum time in seconds to wait for each stream. Output which is
+            still read after the timeout is not written to the log file.
+        """
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        if self._log_handler is not None:
+            self._log_handler.close()
+
+    @property
+    def _finished(self) -> bool:
+        return bool(self._threads) and not any(thread.is_alive() for thread in self._threads)
+
+    def _drain(self, name: str, stream: IO[Any]) -> None:
+        try:
+            for text in _iter_lines(stream, self._max_line_length):
+                self._add_line(OutputLine(stream=name, text=text))
+        finally:
+            stream.close()
+            with self._condition:
+                self._condition.notify_all()
+
+    def _add_line(self, line: OutputLine) -> None:
+        with self._condition:
+            self._lines.append(line)
+            if (
+                not self._ready
+                and self._ready_pattern is not None
+                and self._ready_pattern.search(line.text)
+            ):
+                self._ready = True
+                self._condition.notify_all()
+        if self._log_handler is not None:
+            self._log_handler.handle(
+                logging.makeLogRecord({"msg": line.text, "stream": line.stream})
+            )
+
+
+def _iter_lines(stream: IO[Any], max_line_length: int) -> Iterable[str]:
+    while True:
+        chunk = stream.readline(max_line_length)
+        if not chunk:
+            return
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode(errors="replace")
+        yield chunk.rstrip("\r\n")
+
+
+def _create_log_handler(
+    path: pathlib.Path, *, max_bytes: int, backup_count: int
+) -> logging.handlers.RotatingFileHandler:
+    handler = logging.handlers.RotatingFileHandler(
+        path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8", delay=True
+    )
+    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    handler.namer = _gzip_namer
+    handler.rotator = _gzip_rotator
+    return handler
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as in_f, gzip.open(dest, "wb") as out_f:
+        shutil.copyfileobj(in_f, out_f)
+    os.remove(source)
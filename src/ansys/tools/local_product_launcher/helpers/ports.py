@@ -31,4 +31,154 @@ warnings.warn(
     "https://github.com/ansys/ansys-tools-local-product-launcher/issues/264",
     DeprecationWarning,
 )
-from ansys.tools.common.launcher.helpers.ports import *  # noqa
+
+import pathlib
+import socket
+from typing import Any
+import weakref
+
+from ansys.tools.common.launcher.helpers.ports import find_free_ports
+import platformdirs
+
+from .._file_lock import FileLock
+
+__all__ = ["find_free_ports", "reserve_ports", "PortReservation"]
+
+_REGISTRY_DIR_NAME = "ports"
+_MAX_ATTEMPTS_PER_PORT = 20
+
+
+class PortReservation:
+    """Holds a set of ports reserved with :func:`reserve_ports`.
+
+    The ports are protected in two ways:
+
+    - Until :meth:`handoff` is called, a socket is kept bound to each port.
+      This prevents the operating system from assigning the same port to
+      any other socket.
+    - Until :meth:`release` is called, each port is registered in a
+      cross-process registry. Other calls to :func:`reserve_ports`, also
+      from other processes, skip registered ports.
+
+    The :class:`PortReservation` class can be used as a context manager,
+    releasing the ports when exiting the context. The ports are also
+    released when the object is garbage collected.
+    """
+
+    def __init__(self, *, sockets: list[socket.socket], locks: list[FileLock]):
+        self._ports = [sock.getsockname()[1] for sock in sockets]
+        self._finalizer = weakref.finalize(self, _release, sockets, locks)
+        self._sockets = sockets
+
+    def __enter__(self) -> "PortReservation":
+        """Enter the context manager defined by the port reservation."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Release the ports when exiting a context manager."""
+        self.release()
+
+    @property
+    def ports(self) -> list[int]:
+        """Reserved port numbers."""
+        return list(self._ports)
+
+    def handoff(self) -> None:
+        """Close the sockets bound to the ports, so that the product can bind them.
+
+        This method should be called right before starting the product.
+        The ports stay registered until :meth:`release` is called.
+        """
+        for sock in self._sockets:
+            sock.close()
+
+    def release(self) -> None:
+        """Close the sockets and remove the ports from the registry.
+
+        This method should be called once the product is listening on the
+        ports, for example after :meth:`.ProductInstance.wait` returns.
+        """
+        self._finalizer()
+
+
+def reserve_ports(num_ports: int = 1) -> PortReservation:
+    """Reserve free ports on the localhost.
+
+    Unlike :func:`find_free_ports`, the ports stay reserved until they are
+    handed off to the product, and are not returned by another call to
+    this function before they are released. This is also true for calls
+    from other processes, such as other launchers on the same machine.
+
+    The registry is based on operating system file locks, so the
+    reservations of a process are dropped automatically when it exits.
+    It is kept in the cache directory of the current user, so reservations
+    are not shared with launchers run by other users.
+
+    Parameters
+    ----------
+    num_ports :
+        Number of ports to reserve.
+
+    Returns
+    -------
+    :
+        Reservation holding the ports.
+
+    Raises
+    ------
+    ValueError
+        If the number of ports is negative.
+    RuntimeError
+        If not enough ports can be reserved.
+    """
+    if num_ports < 0:
+        raise ValueError(f"The number of ports must not be negative, got {num_ports}.")
+    if num_ports == 0:
+        return PortReservation(sockets=[], locks=[])
+    registry_dir = _get_registry_dir()
+    sockets: list[socket.socket] = []
+    locks: list[FileLock] = []
+    # Sockets for ports registered by other processes are kept open until
+    # all ports are found, so that the same port is not returned again.
+    # Each socket is tracked here until it is reserved, so that it is also
+    # closed if binding it or registering its port fails.
+    skipped_sockets: list[socket.socket] = []
+    try:
+        for _ in range(num_ports * _MAX_ATTEMPTS_PER_PORT):
+            sock = socket.socket()
+            skipped_sockets.append(sock)
+            sock.bind(("", 0))
+            port = sock.getsockname()[1]
+            lock = FileLock(registry_dir / f"{port}.lock")
+            if not lock.try_acquire():
+                continue
+            skipped_sockets.remove(sock)
+            sockets.append(sock)
+            locks.append(lock)
+            if len(sockets) == num_ports:
+                break
+        else:
+            raise RuntimeError(f"Unable to reserve {num_ports} free ports.")
+    except BaseException:
+        _release(sockets, locks)
+        raise
+    finally:
+        for sock in skipped_sockets:
+            sock.close()
+    return PortReservation(sockets=sockets, locks=locks)
+
+
+def _get_registry_dir() -> pathlib.Path:
+    # A directory shared between users would let any user block the lock
+    # files of the others, since they are created with the owner's permissions.
+    return (
+        pathlib.Path(platformdirs.user_cache_dir("ansys_tools_local_product_launcher"))
+        / _REGISTRY_DIR_NAME
+    )
+
+
+def _release(sockets: list[socket.socket], locks: list[FileLock]) -> None:
+    for sock in sockets:
+        sock.close()
+    for lock in locks:
+        lock.release()
@@ -0,0 +1,125 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for starting products which consist of several servers.
+
+Servers which do not depend on each other are started concurrently. A
+server which depends on others is only started once they respond to
+requests.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+import concurrent.futures
+import contextvars
+import graphlib
+import time
+
+__all__ = ["start_servers"]
+
+
+def start_servers(
+    start_functions: Mapping[str, Callable[[], None]],
+    *,
+    check: Callable[[str], bool],
+    timeout: float,
+    dependencies: Mapping[str, Iterable[str]] | None = None,
+    poll_interval: float = 0.05,
+) -> None:
+    """Start the servers of a product, respecting their start order.
+
+    Each server is started as soon as all servers it depends on respond
+    to requests. Servers whose dependencies are met at the same time are
+    started concurrently. Only servers which others depend on are waited
+    for; the remaining ones are checked by :meth:`.ProductInstance.wait`.
+
+    This function is intended to be called from the ``start()`` method of
+    a launcher which implements the :class:`.SupportsServerChecks` interface.
+
+    Parameters
+    ----------
+    start_functions :
+        Mapping of server keys to functions which start the server. The
+        functions should return without waiting for the server to be ready.
+    check :
+        Function which checks if the server with the given key responds
+        to requests, for example the launcher's ``check_server()`` method.
+    timeout :
+        Time in seconds to wait for each server that others depend on.
+    dependencies :
+        Mapping of server keys to the keys of the servers which must
+        respond to requests before the server is started. By default,
+        all servers are started concurrently.
+    poll_interval :
+        Time in seconds between checks of a server that others depend on.
+
+    Raises
+    ------
+    ValueError
+        If the dependencies refer to unknown servers or contain a cycle.
+    TimeoutError
+        If a server that others depend on does not respond within the
+        timeout. The servers which depend on it are not started.
+    """
+    dependencies = {key: list(deps) for key, deps in (dependencies or {}).items()}
+    for key, deps in dependencies.items():
+        unknown_keys = sorted({key, *deps} - set(start_functions))
+        if unknown_keys:
+            raise ValueError(f"The dependencies refer to unknown servers: {unknown_keys}.")
+    required_keys = {dep for deps in dependencies.values() for dep in deps}
+
+    sorter = graphlib.TopologicalSorter({key: dependencies.get(key, []) for key in start_functions})
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as exc:
+        raise ValueError(f"The server dependencies contain a cycle: {exc.args[1]}.") from exc
+
+    def _start_server(key: str) -> str:
+        start_functions[key]()
+        if key in required_keys:
+            _wait_for_server(key, check=check, timeout=timeout, poll_interval=poll_interval)
+        return key
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(start_functions), thread_name_prefix="server-start"
+    ) as executor:
+        pending: set[concurrent.futures.Future[str]] = set()
+        while sorter.is_active():
+            # Each server starts in a copy of the current context, so that the
+            # events it emits keep the trace context of the product instance.
+            for key in sorter.get_ready():
+                pending.add(executor.submit(contextvars.copy_context().run, _start_server, key))
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                # If a server fails to start, the servers which are already
+                # starting are completed before the error is raised.
+                sorter.done(future.result())
+
+
+def _wait_for_server(
+    key: str, *, check: Callable[[str], bool], timeout: float, poll_interval: float
+) -> None:
+    deadline = time.monotonic() + timeout
+    while not check(key):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"The server '{key}' did not respond after {timeout}s.")
+        time.sleep(poll_interval)
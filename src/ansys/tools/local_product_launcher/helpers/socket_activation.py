@@ -0,0 +1,251 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Helpers for passing pre-bound listening sockets to a product.
+
+The sockets are passed with the systemd socket activation protocol: they
+are inherited as file descriptors starting at ``3``, and described by the
+``LISTEN_FDS``, ``LISTEN_PID`` and ``LISTEN_FDNAMES`` environment variables.
+
+Since the sockets are already listening when the product starts, clients
+can connect immediately. The connections are queued by the operating system
+until the product accepts them. Unlike with :func:`.ports.find_free_ports`,
+no other process can take the port before the product binds it.
+
+Socket activation is only available on POSIX systems.
+"""
+
+from collections.abc import Mapping, Sequence
+import os
+import pathlib
+import socket
+import subprocess
+import sys
+from typing import Any
+
+__all__ = [
+    "SD_LISTEN_FDS_START",
+    "bind_tcp_socket",
+    "bind_uds_socket",
+    "start_with_sockets",
+    "listen_fds",
+]
+
+SD_LISTEN_FDS_START = 3
+"""File descriptor number of the first passed socket."""
+
+# Moves the inherited sockets to the file descriptors starting at 3, sets
+# LISTEN_PID to its own PID, and replaces itself with the command. The sockets
+# are first moved out of the target range, so that none is overwritten before
+# it has been moved.
+_SHIM_SCRIPT = """\
+import fcntl, os, sys
+source_fds = [int(fd) for fd in sys.argv[1].split(",")]
+target_fds = range(3, 3 + len(source_fds))
+temp_fds = [fcntl.fcntl(fd, fcntl.F_DUPFD, target_fds[-1] + 1) for fd in source_fds]
+for fd in source_fds:
+    os.close(fd)
+for temp_fd, target_fd in zip(temp_fds, target_fds):
+    os.dup2(temp_fd, target_fd, inheritable=True)
+    os.close(temp_fd)
+os.environ["LISTEN_PID"] = str(os.getpid())
+try:
+    os.execvp(sys.argv[2], sys.argv[2:])
+except OSError as exc:
+    print(f"{sys.argv[2]}: {exc.strerror}", file=sys.stderr)
+    os._exit(127)
+"""
+
+
+def bind_tcp_socket(host: str = "127.0.0.1", port: int = 0, *, backlog: int = 128) -> socket.socket:
+    """Create a listening TCP socket.
+
+    Parameters
+    ----------
+    host :
+        Address to bind the socket to.
+    port :
+        Port to bind the socket to. If ``0``, a free port is chosen by the
+        operating system. The chosen port is available from ``getsockname()``.
+    backlog :
+        Maximum number of connections queued before the product accepts them.
+
+    Returns
+    -------
+    :
+        Listening socket.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def bind_uds_socket(path: str | os.PathLike[str], *, backlog: int = 128) -> socket.socket:
+    """Create a listening Unix Domain Socket.
+
+    Parameters
+    ----------
+    path :
+        Path of the socket file. The file must not exist yet.
+    backlog :
+        Maximum number of connections queued before the product accepts them.
+
+    Returns
+    -------
+    :
+        Listening socket.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.bind(str(pathlib.Path(path)))
+        sock.listen(backlog)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def start_with_sockets(
+    args: Sequence[str],
+    sockets: Sequence[socket.socket] | Mapping[str, socket.socket],
+    **popen_kwargs: Any,
+) -> "subprocess.Popen[Any]":
+    """Start a process, passing it listening sockets with socket activation.
+
+    The sockets are passed as file descriptors ``3``, ``4``, and so on, in the
+    given order. If ``sockets`` is a mapping, its keys are passed as
+    ``LISTEN_FDNAMES``. The parent process may close its copy of the sockets
+    once this function returns.
+
+    The command is started through a small Python shim, which moves the
+    sockets into place and sets ``LISTEN_PID`` to its own PID before replacing
+    itself with the command. The PID of the returned process is therefore the
+    PID of the command. No code runs between fork and exec, so this function
+    is safe to call while other threads are running. If the command cannot
+    be run, the process exits with code ``127`` instead of this function
+    raising an exception.
+
+    Parameters
+    ----------
+    args :
+        Command to run.
+    sockets :
+        Listening sockets to pass to the process.
+    popen_kwargs :
+        Extra keyword arguments for :class:`subprocess.Popen`. The ``pass_fds``,
+        ``close_fds``, ``shell`` and ``executable`` arguments are not supported.
+
+    Returns
+    -------
+    :
+        The started process.
+
+    Raises
+    ------
+    NotImplementedError
+        If the platform does not support socket activation.
+    """
+    if os.name == "nt":
+        raise NotImplementedError("Socket activation is not supported on Windows.")
+    for unsupported_kwarg in ("pass_fds", "close_fds", "shell", "executable"):
+        if unsupported_kwarg in popen_kwargs:
+            raise TypeError(
+                "The 'pass_fds', 'close_fds', 'shell' and 'executable' arguments are not supported."
+            )
+
+    if isinstance(sockets, Mapping):
+        names: list[str] | None = list(sockets.keys())
+        socket_fds = [sock.fileno() for sock in sockets.values()]
+    else:
+        names = None
+        socket_fds = [sock.fileno() for sock in sockets]
+    if not socket_fds:
+        raise ValueError("At least one socket must be passed.")
+
+    # The environment is built here, only LISTEN_PID is set in the child.
+    env = dict(popen_kwargs.pop("env", None) or os.environ)
+    env["LISTEN_FDS"] = str(len(socket_fds))
+    if names is not None:
+        env["LISTEN_FDNAMES"] = ":".join(names)
+    else:
+        env.pop("LISTEN_FDNAMES", None)
+    env.pop("LISTEN_PID", None)
+
+    # LISTEN_PID must match the PID of the product, which is not known before
+    # the fork, and the sockets must be moved to fixed file descriptors. Both
+    # are done by a shim which then replaces itself with the product. Unlike
+    # '/bin/sh', it can refer to file descriptors above 9.
+    command = [args] if isinstance(args, str) else list(args)
+    shim_args = [
+        sys.executable,
+        "-I",
+        "-S",
+        "-c",
+        _SHIM_SCRIPT,
+        ",".join(str(fd) for fd in socket_fds),
+        *command,
+    ]
+    return subprocess.Popen(shim_args, env=env, pass_fds=socket_fds, **popen_kwargs)
+
+
+def listen_fds(*, unset_environment: bool = True) -> dict[str, socket.socket]:
+    """Get the sockets passed to the current process with socket activation.
+
+    This function is intended for use in the product process.
+
+    Parameters
+    ----------
+    unset_environment :
+        Whether to remove the socket activation environment variables, such
+        that they are not inherited by child processes.
+
+    Returns
+    -------
+    :
+        Mapping of socket names to sockets. Unnamed sockets are named
+        ``"unknown"``, followed by their index if there is more than one.
+        The mapping is empty if no sockets were passed.
+    """
+    try:
+        if int(os.environ.get("LISTEN_PID", "0")) != os.getpid():
+            return {}
+        num_fds = int(os.environ.get("LISTEN_FDS", "0"))
+    except ValueError:
+        return {}
+    names = os.environ.get("LISTEN_FDNAMES", "").split(":")
+    if len(names) != num_fds:
+        names = ["unknown"] if num_fds == 1 else [f"unknown{i}" for i in range(num_fds)]
+    if unset_environment:
+        for key in ("LISTEN_PID", "LISTEN_FDS", "LISTEN_FDNAMES"):
+            os.environ.pop(key, None)
+    res = {}
+    for i, name in enumerate(names):
+        fd = SD_LISTEN_FDS_START + i
+        os.set_inheritable(fd, False)
+        res[name] = socket.socket(fileno=fd)
+    return res
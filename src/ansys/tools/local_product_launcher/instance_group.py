@@ -0,0 +1,217 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Defines a client-side load-balanced gRPC channel across product instances."""
+
+from collections.abc import Iterable
+import ipaddress
+import json
+from typing import Any, cast
+
+import grpc
+
+from ._vendored import cyberchannel
+from .grpc_transport import InsecureOptions, TransportMode, TransportOptionsType, UDSOptions
+from .product_instance import ProductInstance
+
+__all__ = ["ProductInstanceGroup"]
+
+
+class ProductInstanceGroup:
+    """Provides a single gRPC channel that round-robins across product instances.
+
+    All instances must serve the same product and use the same transport
+    mode, either UDS or insecure TCP. The channel uses the ``round_robin``
+    load balancing policy. If ``health_check`` is enabled, only instances
+    whose gRPC health service reports ``SERVING`` receive requests.
+
+    Instances can be added and removed at runtime. Since the target of a
+    gRPC channel cannot be changed, a new channel is created on the next
+    access to :attr:`channel` after a change. Channels which were handed
+    out previously stay open until :meth:`close` is called.
+
+    The :class:`ProductInstanceGroup` class can be used as a context manager,
+    closing all its channels when exiting the context. The instances
+    themselves are not stopped.
+
+    Parameters
+    ----------
+    instances :
+        Initial product instances in the group.
+    server_key :
+        Key of the gRPC server to connect to, as defined in the launcher's
+        ``SERVER_SPEC``. May be omitted if the launcher starts exactly one
+        gRPC server.
+    health_check :
+        Whether to enable client-side health checking of the instances.
+    grpc_options :
+        Extra gRPC channel options.
+    """
+
+    def __init__(
+        self,
+        instances: Iterable[ProductInstance] = (),
+        *,
+        server_key: str | None = None,
+        health_check: bool = True,
+        grpc_options: list[tuple[str, Any]] | None = None,
+    ):
+        self._instances: list[ProductInstance] = list(instances)
+        self._server_key = server_key
+        self._health_check = health_check
+        self._grpc_options = list(grpc_options or [])
+        self._channel: grpc.Channel | None = None
+        self._superseded_channels: list[grpc.Channel] = []
+
+    def __enter__(self) -> "ProductInstanceGroup":
+        """Enter the context manager defined by the instance group."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the channels when exiting a context manager."""
+        self.close()
+
+    @property
+    def instances(self) -> tuple[ProductInstance, ...]:
+        """Product instances currently in the group."""
+        return tuple(self._instances)
+
+    def add(self, instance: ProductInstance) -> None:
+        """Add a product instance to the group.
+
+        Parameters
+        ----------
+        instance :
+            Product instance to add.
+        """
+        self._instances.append(instance)
+        self._invalidate_channel()
+
+    def remove(self, instance: ProductInstance) -> None:
+        """Remove a product instance from the group.
+
+        Parameters
+        ----------
+        instance :
+            Product instance to remove.
+
+        Raises
+        ------
+        ValueError
+            If the instance is not part of the group.
+        """
+        self._instances.remove(instance)
+        self._invalidate_channel()
+
+    @property
+    def channel(self) -> grpc.Channel:
+        """Load-balanced gRPC channel to the current instances.
+
+        Raises
+        ------
+        ValueError
+            If the group is empty, or its instances cannot be combined
+            into a single channel.
+        """
+        if self._channel is None:
+            self._channel = self._create_channel()
+        return self._channel
+
+    def close(self) -> None:
+        """Close all channels created by the group."""
+        self._invalidate_channel()
+        for channel in self._superseded_channels:
+            channel.close()
+        self._superseded_channels.clear()
+
+    def _invalidate_channel(self) -> None:
+        if self._channel is not None:
+            self._superseded_channels.append(self._channel)
+            self._channel = None
+
+    def _create_channel(self) -> grpc.Channel:
+        if not self._instances:
+            raise ValueError("Cannot create a channel for an empty instance group.")
+        transport_options = [
+            instance.transport_options[self._get_server_key(instance)]
+            for instance in self._instances
+        ]
+        schemes, addresses = zip(*(_get_address(options) for options in transport_options))
+        if len(set(schemes)) != 1:
+            raise ValueError(
+                "All instances in the group must use the same transport mode and address family."
+            )
+        service_config: dict[str, Any] = {"loadBalancingConfig": [{"round_robin": {}}]}
+        if self._health_check:
+            service_config["healthCheckConfig"] = {"serviceName": ""}
+        options: list[tuple[str, Any]] = [
+            ("grpc.service_config", json.dumps(service_config)),
+            # Each channel must create its own subchannels, otherwise the
+            # subchannels may be shared with channels using a different
+            # load balancing policy.
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+        if schemes[0] == "unix":
+            # See https://github.com/grpc/grpc/issues/34305
+            options.append(("grpc.default_authority", "localhost"))
+        options.extend(self._grpc_options)
+        return grpc.insecure_channel(f"{schemes[0]}:{','.join(addresses)}", options=options)
+
+    def _get_server_key(self, instance: ProductInstance) -> str:
+        if self._server_key is not None:
+            return self._server_key
+        keys = list(instance.transport_options)
+        if len(keys) != 1:
+            raise ValueError(
+                f"The instance has gRPC servers {keys}. Specify the 'server_key' to "
+                "select which one to connect to."
+            )
+        return keys[0]
+
+
+def _get_address(transport_options: TransportOptionsType) -> tuple[str, str]:
+    """Get the resolver scheme and address for the given transport options."""
+    # The transport mode is compared by value, such that transport options
+    # defined in 'ansys-tools-common' are also accepted.
+    if transport_options.mode == TransportMode.UDS:
+        uds_options = cast(UDSOptions, transport_options)
+        uds_folder = cyberchannel.determine_uds_folder(uds_options.uds_dir)
+        service = uds_options.uds_service
+        uds_id = uds_options.uds_id
+        socket_filename = f"{service}-{uds_id}.sock" if uds_id else f"{service}.sock"
+        return "unix", str(uds_folder / socket_filename)
+    if transport_options.mode == TransportMode.INSECURE:
+        insecure_options = cast(InsecureOptions, transport_options)
+        # Validate the remote host setting
+        insecure_options._to_cyberchannel_kwargs()
+        host = "127.0.0.1" if insecure_options.host == "localhost" else insecure_options.host
+        try:
+            ip_address = ipaddress.ip_address(host)
+        except ValueError as exc:
+            raise ValueError(
+                f"Host '{host}' must be an IP address to be used in an instance group."
+            ) from exc
+        if ip_address.version == 6:
+            return "ipv6", f"[{ip_address}]:{insecure_options.port}"
+        return "ipv4", f"{ip_address}:{insecure_options.port}"
+    raise ValueError(
+        f"Transport mode '{transport_options.mode}' is not supported in an instance group."
+    )
@@ -34,4 +34,100 @@ warnings.warn(
     "https://github.com/ansys/ansys-tools-local-product-launcher/issues/264",
     DeprecationWarning,
 )
+from typing import Protocol, runtime_checkable
+
+from ansys.tools.common.launcher import interface as _common_interface
 from ansys.tools.common.launcher.interface import *  # noqa
+
+__all__ = [
+    *_common_interface.__all__,
+    "SupportsReadinessNotification",
+    "SupportsProcessId",
+    "SupportsServerChecks",
+]
+
+
+@runtime_checkable
+class SupportsReadinessNotification(Protocol):
+    """Optional interface for launchers which are notified when the product is ready.
+
+    If a launcher implements this interface, :meth:`.ProductInstance.wait`
+    blocks on :meth:`wait_ready` instead of polling the
+    :meth:`LauncherProtocol.check` method. This allows returning as soon
+    as the product reports to be ready, without making health check requests.
+
+    The :class:`.helpers.notify.NotifySocket` class implements the
+    ``sd_notify`` protocol, which can be used for the notification.
+    """
+
+    def wait_ready(self, *, timeout: float) -> bool | None:
+        """Wait until the product reports to be ready.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum time in seconds to wait.
+
+        Returns
+        -------
+        bool or None
+            ``True`` if the product reported to be ready, ``False`` if it did
+            not do so within the timeout. ``None`` if readiness notification
+            is not available for this product instance, in which case the
+            :meth:`LauncherProtocol.check` method is polled instead.
+
+        Raises
+        ------
+        Exception
+            If the product can no longer become ready, for example because
+            it reported an error or exited. The message of the exception is
+            included in the error raised by :meth:`.ProductInstance.wait`.
+        """
+
+
+@runtime_checkable
+class SupportsProcessId(Protocol):
+    """Optional interface for launchers which start the product as a local process.
+
+    If a launcher implements this interface, the resource usage of the
+    product's process tree can be sampled while it runs. See
+    :mod:`.resources`.
+    """
+
+    @property
+    def pid(self) -> int | None:
+        """Process ID of the product's main process.
+
+        ``None`` if the product is not running as a local process.
+        """
+
+
+@runtime_checkable
+class SupportsServerChecks(Protocol):
+    """Optional interface for launchers which can check each server separately.
+
+    If a launcher implements this interface, :meth:`.ProductInstance.check`
+    checks all servers in the ``SERVER_SPEC`` concurrently, instead of calling
+    the :meth:`LauncherProtocol.check` method. For products with several
+    servers, a check then takes as long as the slowest server, instead of
+    the sum of all servers.
+
+    To also start independent servers concurrently, launchers can use
+    :func:`.helpers.servers.start_servers`.
+    """
+
+    def check_server(self, key: str, *, timeout: float | None = None) -> bool:
+        """Check if a single server is responding to requests.
+
+        Parameters
+        ----------
+        key : str
+            Key of the server in the ``SERVER_SPEC``.
+        timeout : float, default: None
+            Time in seconds to wait for the server to respond.
+
+        Returns
+        -------
+        bool
+            ``True`` if the server is responding to requests, ``False`` otherwise.
+        """
@@ -19,7 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-"""Defines a function for launching Ansys products."""
+"""Defines functions for launching Ansys products."""
 
 import warnings
 
@@ -32,4 +32,233 @@ warnings.warn(
     DeprecationWarning,
 )
 
-from ansys.tools.common.launcher.launch import *  # noqa
+import concurrent.futures
+import contextvars
+import dataclasses
+import os
+import threading
+import typing
+from typing import Any, cast
+
+from ansys.tools.common.launcher import grpc_transport as _common_grpc_transport
+from ansys.tools.common.launcher._plugins import get_launcher
+from ansys.tools.common.launcher.config import get_config_for, get_launch_mode_for
+from ansys.tools.common.launcher.interface import LAUNCHER_CONFIG_T, LauncherProtocol
+
+from .grpc_transport import TransportMode, resolve_transport_mode
+from .product_instance import HealthCheckPolicy, ProductInstance
+
+__all__ = ["launch_product", "launch_product_async"]
+
+_TRANSPORT_MODE_TYPES = (TransportMode, _common_grpc_transport.TransportMode)
+
+
+def launch_product(
+    product_name: str,
+    *,
+    launch_mode: str | None = None,
+    config: LAUNCHER_CONFIG_T | None = None,
+    health_check_policy: HealthCheckPolicy | None = None,
+    stable_endpoint_dir: str | os.PathLike[str] | None = None,
+    lazy: bool = False,
+) -> ProductInstance:
+    """Launch a product instance.
+
+    Parameters
+    ----------
+    product_name : str
+        Name of the product to launch.
+    launch_mode : str, default: None
+        Launch mode to use. The default is ``None``, in which case
+        the default launched mode is used. Options available
+        depend on the launcher plugin.
+    config : LAUNCHER_CONFIG_T, default: None
+        Configuration to use for launching the product. The default is
+        ``None``, in which case the default configuration is used.
+    health_check_policy : HealthCheckPolicy, default: None
+        Caching and circuit breaking of the health checks made by
+        :meth:`.ProductInstance.check`. The default is ``None``, in which
+        case every call makes a health check.
+    stable_endpoint_dir : str or os.PathLike, default: None
+        Directory in which to expose gRPC servers which use UDS at a fixed
+        path, so that the channels of the instance keep working across
+        restarts. The default is ``None``, in which case the servers are
+        accessed at the path chosen by the launcher. See
+        :class:`.ProductInstance` for details.
+    lazy : bool, default: False
+        Whether to defer starting the product until the instance is first
+        used, for example by accessing its :attr:`.ProductInstance.channels`.
+        See :class:`.ProductInstance` for details.
+
+    Returns
+    -------
+    ProductInstance
+        Object that can be used to interact with the started product.
+
+    Raises
+    ------
+    TypeError
+        If the type of the configuration object does not match the type
+        requested by the launcher plugin.
+
+    Notes
+    -----
+    Fields of the configuration which are set to ``TransportMode.AUTO`` are
+    resolved to a concrete transport mode with
+    :func:`.grpc_transport.resolve_transport_mode` before the launcher is
+    created. The candidate modes are taken from the ``TRANSPORT_MODES``
+    attribute of the launcher class if it is defined, and include all
+    transport modes otherwise.
+    """
+    launcher, launch_mode = _create_launcher(product_name, launch_mode=launch_mode, config=config)
+    return ProductInstance(
+        launcher=launcher,
+        product_name=product_name,
+        launch_mode=launch_mode,
+        health_check_policy=health_check_policy,
+        stable_endpoint_dir=stable_endpoint_dir,
+        lazy=lazy,
+    )
+
+
+def launch_product_async(
+    product_name: str,
+    *,
+    launch_mode: str | None = None,
+    config: LAUNCHER_CONFIG_T | None = None,
+    timeout: float = 60.0,
+    connect_channels: bool = False,
+    health_check_policy: HealthCheckPolicy | None = None,
+    stable_endpoint_dir: str | os.PathLike[str] | None = None,
+) -> "concurrent.futures.Future[ProductInstance]":
+    """Launch a product instance in a background thread.
+
+    The product is started and waited for in a separate thread, so that
+    the caller can continue with other work, such as imports or loading
+    input data, while the product starts.
+
+    Parameters
+    ----------
+    product_name : str
+        Name of the product to launch.
+    launch_mode : str, default: None
+        Launch mode to use. The default is ``None``, in which case
+        the default launched mode is used. Options available
+        depend on the launcher plugin.
+    config : LAUNCHER_CONFIG_T, default: None
+        Configuration to use for launching the product. The default is
+        ``None``, in which case the default configuration is used.
+    timeout : float, default: 60.0
+        Time in seconds to wait for the product to become ready.
+    connect_channels : bool, default: False
+        Whether to also connect the gRPC channels of the instance before
+        the future is resolved. See :meth:`.ProductInstance.wait`.
+    health_check_policy : HealthCheckPolicy, default: None
+        Caching and circuit breaking of the health checks made by
+        :meth:`.ProductInstance.check`. The default is ``None``, in which
+        case every call makes a health check.
+    stable_endpoint_dir : str or os.PathLike, default: None
+        Directory in which to expose gRPC servers which use UDS at a fixed
+        path. See :class:`.ProductInstance` for details.
+
+    Returns
+    -------
+    concurrent.futures.Future[ProductInstance]
+        Future which resolves to the product instance once it is ready. If
+        the product fails to start or does not become ready within the
+        timeout, the instance is stopped and the future holds the exception.
+
+    Raises
+    ------
+    TypeError
+        If the type of the configuration object does not match the type
+        requested by the launcher plugin.
+    """
+    # The launcher and configuration are looked up in the calling thread,
+    # so that errors in the arguments are raised immediately.
+    launcher, launch_mode = _create_launcher(product_name, launch_mode=launch_mode, config=config)
+    future: concurrent.futures.Future[ProductInstance] = concurrent.futures.Future()
+
+    def _launch() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            instance = ProductInstance(
+                launcher=launcher,
+                product_name=product_name,
+                launch_mode=launch_mode,
+                health_check_policy=health_check_policy,
+                stable_endpoint_dir=stable_endpoint_dir,
+            )
+        except BaseException as exc:
+            future.set_exception(exc)
+            return
+        try:
+            instance.wait(timeout=timeout, connect_channels=connect_channels)
+        except BaseException as exc:
+            try:
+                instance.stop()
+            finally:
+                future.set_exception(exc)
+            return
+        future.set_result(instance)
+
+    # The launch runs in a copy of the current context, so that the
+    # instance inherits the trace context of the caller.
+    threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(_launch,),
+        name=f"launch-{product_name}",
+        daemon=True,
+    ).start()
+    return future
+
+
+def _create_launcher(
+    product_name: str, *, launch_mode: str | None, config: LAUNCHER_CONFIG_T | None
+) -> tuple[LauncherProtocol[LAUNCHER_CONFIG_T], str]:
+    launch_mode = get_launch_mode_for(product_name=product_name, launch_mode=launch_mode)
+
+    # The type of the CONFIG_MODEL is checked below, so here we can cast
+    # from type[LauncherProtocol[DataclassProtocol]] to type[LauncherProtocol[LAUNCHER_CONFIG_T]].
+    launcher_klass = cast(
+        type[LauncherProtocol[LAUNCHER_CONFIG_T]],
+        get_launcher(
+            product_name=product_name,
+            launch_mode=launch_mode,
+        ),
+    )
+
+    if config is None:
+        config = get_config_for(product_name=product_name, launch_mode=launch_mode)  # type: ignore
+    if not isinstance(config, launcher_klass.CONFIG_MODEL):
+        raise TypeError(
+            f"Incompatible config of type '{type(config)} is supplied. "
+            f"It needs to be '{launcher_klass.CONFIG_MODEL}'."
+        )
+    config = _resolve_auto_transport_modes(config, launcher_klass=launcher_klass)
+    return launcher_klass(config=config), launch_mode
+
+
+def _resolve_auto_transport_modes(
+    config: LAUNCHER_CONFIG_T, *, launcher_klass: type[Any]
+) -> LAUNCHER_CONFIG_T:
+    supported_modes = getattr(launcher_klass, "TRANSPORT_MODES", list(TransportMode))
+    try:
+        type_hints = typing.get_type_hints(type(config))
+    except Exception:
+        type_hints = {}
+    replacements = {}
+    for field in dataclasses.fields(config):
+        value = getattr(config, field.name)
+        # Configurations loaded from the configuration file contain strings
+        # instead of enum members, so the annotation is checked as well.
+        mode_type = type_hints.get(field.name)
+        if mode_type not in _TRANSPORT_MODE_TYPES:
+            mode_type = type(value)
+        if field.init and mode_type in _TRANSPORT_MODE_TYPES and value == TransportMode.AUTO:
+            replacements[field.name] = mode_type(resolve_transport_mode(supported_modes).value)
+    if not replacements:
+        return config
+    # The configuration passed by the caller is not modified.
+    return cast(LAUNCHER_CONFIG_T, dataclasses.replace(config, **replacements))
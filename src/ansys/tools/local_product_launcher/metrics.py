@@ -0,0 +1,411 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Metrics for the lifecycle of product instances.
+
+The metrics are recorded in the :data:`REGISTRY` by :func:`.launch_product`,
+:class:`.ProductInstance` and :func:`.helpers.grpc.check_grpc_health`. They
+can be exposed in the Prometheus text format, either by writing them to a file
+with :func:`write_text_file`, or by serving them over HTTP with
+:func:`start_http_server`.
+"""
+
+from collections.abc import Iterable, Sequence
+import http.server
+import math
+import os
+import pathlib
+import threading
+from typing import Any
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "generate_text",
+    "write_text_file",
+    "start_http_server",
+]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+"""Default histogram bucket upper bounds, in seconds."""
+
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_LabelValues = tuple[str, ...]
+
+
+class _Metric:
+    """Base class for metrics with an optional set of labels."""
+
+    _TYPE: str
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, Any]) -> _LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' requires the labels {list(self.labelnames)}, "
+                f"got {list(labels)}."
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: _LabelValues, extra: dict[str, str] | None = None) -> str:
+        pairs = list(zip(self.labelnames, values)) + list((extra or {}).items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError  # pragma: no cover
+
+    def to_text(self) -> str:
+        """Format the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation, quote=False)}",
+            f"# TYPE {self.name} {self._TYPE}",
+            *self._samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    _TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[_LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the count.
+
+        Parameters
+        ----------
+        amount :
+            Non-negative amount to increase the count by.
+        labels :
+            Values for each of the metric's labels.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be increased.")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        """Get the current count for the given labels."""
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value which can go up and down."""
+
+    _TYPE = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        """Increase the value.
+
+        Parameters
+        ----------
+        amount :
+            Amount to increase the value by.
+        labels :
+            Values for each of the metric's labels.
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        """Decrease the value.
+
+        Parameters
+        ----------
+        amount :
+            Amount to decrease the value by.
+        labels :
+            Values for each of the metric's labels.
+        """
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        """Set the value.
+
+        Parameters
+        ----------
+        value :
+            New value.
+        labels :
+            Values for each of the metric's labels.
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, counted in cumulative buckets."""
+
+    _TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(set(buckets) - {math.inf})) + (math.inf,)
+        self._counts: dict[_LabelValues, list[int]] = {}
+        self._sums: dict[_LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        """Record an observed value.
+
+        Parameters
+        ----------
+        value :
+            Observed value.
+        labels :
+            Values for each of the metric's labels.
+        """
+        key = self._label_values(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def get_count(self, **labels: Any) -> int:
+        """Get the number of observations for the given labels."""
+        with self._lock:
+            return sum(self._counts.get(self._label_values(labels), []))
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            counts = {key: list(value) for key, value in self._counts.items()}
+            sums = dict(self._sums)
+        for key in sorted(counts):
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets, counts[key]):
+                cumulative += count
+                labels = self._format_labels(key, {"le": _format_value(upper_bound)})
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{self._format_labels(key)} {_format_value(sums[key])}"
+            yield f"{self.name}_count{self._format_labels(key)} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metrics which are exposed together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        """Add a metric to the registry.
+
+        Raises
+        ------
+        ValueError
+            If a metric with the same name is already registered.
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"A metric named '{metric.name}' is already registered.")
+            self._metrics[metric.name] = metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Create and register a gauge."""
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def to_text(self) -> str:
+        """Format all metrics in the Prometheus text format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.to_text() for metric in metrics)
+
+
+REGISTRY = MetricsRegistry()
+"""Registry containing the lifecycle metrics of the Local Product Launcher."""
+
+LAUNCHES_STARTED = REGISTRY.counter(
+    "ansys_launcher_launches_started_total",
+    "Number of product launches started.",
+    ("product", "launch_mode"),
+)
+LAUNCHES_SUCCEEDED = REGISTRY.counter(
+    "ansys_launcher_launches_succeeded_total",
+    "Number of product launches which became ready.",
+    ("product", "launch_mode"),
+)
+LAUNCHES_FAILED = REGISTRY.counter(
+    "ansys_launcher_launches_failed_total",
+    "Number of product launches which failed to start or to become ready.",
+    ("product", "launch_mode"),
+)
+LAUNCH_READY_SECONDS = REGISTRY.histogram(
+    "ansys_launcher_launch_ready_seconds",
+    "Time from starting a product instance until it is ready.",
+    ("product", "launch_mode"),
+)
+HEALTH_CHECK_SECONDS = REGISTRY.histogram(
+    "ansys_launcher_health_check_seconds",
+    "Duration of gRPC health checks.",
+    ("result",),
+)
+HEALTH_CHECKS_SKIPPED = REGISTRY.counter(
+    "ansys_launcher_health_checks_skipped_total",
+    "Number of product instance checks answered without a health check, "
+    "because a cached result was used or the circuit breaker was open.",
+    ("product", "launch_mode", "reason"),
+)
+STOP_SECONDS = REGISTRY.histogram(
+    "ansys_launcher_stop_seconds",
+    "Time taken to stop a product instance.",
+    ("product", "launch_mode"),
+)
+LIVE_INSTANCES = REGISTRY.gauge(
+    "ansys_launcher_live_instances",
+    "Number of product instances which are currently started.",
+    ("product", "launch_mode"),
+)
+
+
+def generate_text(registry: MetricsRegistry = REGISTRY) -> str:
+    """Format the metrics in the Prometheus text format.
+
+    Parameters
+    ----------
+    registry :
+        Registry containing the metrics.
+    """
+    return registry.to_text()
+
+
+def write_text_file(path: str | os.PathLike[str], registry: MetricsRegistry = REGISTRY) -> None:
+    """Write the metrics to a file in the Prometheus text format.
+
+    The file is replaced atomically, so that it can be read concurrently,
+    for example by the node exporter's textfile collector.
+
+    Parameters
+    ----------
+    path :
+        Path of the output file.
+    registry :
+        Registry containing the metrics.
+    """
+    path = pathlib.Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(generate_text(registry))
+    os.replace(tmp_path, path)
+
+
+def start_http_server(
+    port: int = 0, addr: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY
+) -> http.server.ThreadingHTTPServer:
+    """Serve the metrics over HTTP in a background thread.
+
+    Parameters
+    ----------
+    port :
+        Port to listen on. If ``0``, a free port is chosen. The chosen port
+        is available from the ``server_port`` attribute of the returned server.
+    addr :
+        Address to listen on.
+    registry :
+        Registry containing the metrics.
+
+    Returns
+    -------
+    :
+        The running server. Call its ``shutdown()`` method to stop it.
+    """
+
+    class _MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = generate_text(registry).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", _CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer((addr, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
+
+
+def _escape(value: str, *, quote: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    if quote:
+        value = value.replace('"', '\\"')
+    return value
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
@@ -32,4 +32,686 @@ warnings.warn(
     DeprecationWarning,
 )
 
-from ansys.tools.common.launcher.product_instance import *  # noqa
+import concurrent.futures
+import contextvars
+from dataclasses import dataclass
+import os
+import pathlib
+import threading
+import time
+from typing import Any
+import uuid
+
+from ansys.tools.common.exceptions import ProductInstanceError
+from ansys.tools.common.launcher.grpc_transport import TransportOptionsType
+from ansys.tools.common.launcher.product_instance import ProductInstance as _ProductInstanceBase
+from ansys.tools.common.launcher.product_instance import _GRPC_MAX_MESSAGE_LENGTH
+import grpc
+
+from . import events, metrics, resources
+from .grpc_transport import TransportMode, UDSOptions, _get_uds_path
+from .interface import (
+    LAUNCHER_CONFIG_T,
+    LauncherProtocol,
+    ServerType,
+    SupportsProcessId,
+    SupportsReadinessNotification,
+    SupportsServerChecks,
+)
+
+__all__ = ["HealthCheckPolicy", "ProductInstance"]
+
+
+@dataclass(frozen=True, kw_only=True)
+class HealthCheckPolicy:
+    """Controls how :meth:`ProductInstance.check` avoids redundant health checks.
+
+    Parameters
+    ----------
+    cache_ttl :
+        Time in seconds for which the result of a health check is reused
+        by subsequent calls. The default of ``0`` disables the cache.
+    failure_threshold :
+        Number of consecutive failed health checks after which the circuit
+        breaker opens. While it is open, :meth:`ProductInstance.check` returns
+        ``False`` immediately, instead of waiting for a hanging product to
+        time out. The default of ``None`` disables the circuit breaker.
+    reset_timeout :
+        Time in seconds for which the circuit breaker stays open. Afterwards,
+        a single health check is made. If it succeeds, the circuit breaker
+        closes, otherwise it stays open for another ``reset_timeout``.
+    """
+
+    cache_ttl: float = 0.0
+    failure_threshold: int | None = None
+    reset_timeout: float = 5.0
+
+    def __post_init__(self) -> None:
+        """Validate the policy parameters."""
+        if self.cache_ttl < 0:
+            raise ValueError("The 'cache_ttl' must not be negative.")
+        if self.failure_threshold is not None and self.failure_threshold < 1:
+            raise ValueError("The 'failure_threshold' must be at least 1.")
+        if self.reset_timeout < 0:
+            raise ValueError("The 'reset_timeout' must not be negative.")
+
+
+class ProductInstance(_ProductInstanceBase):
+    """Provides a wrapper for interacting with the launched product instance.
+
+    This class allows stopping and starting of the product instance. It also
+    provides access to its server URLs and gRPC channels.
+
+    The :class:`ProductInstance` class can be used as a context manager, stopping
+    the instance when exiting the context.
+
+    Parameters
+    ----------
+    launcher :
+        Launcher used to start and stop the product.
+    product_name :
+        Name of the product. Used to label the lifecycle metrics.
+    launch_mode :
+        Launch mode of the product. Used to label the lifecycle metrics.
+    health_check_policy :
+        Caching and circuit breaking of the health checks made by
+        :meth:`check`. By default, every call makes a health check.
+    stable_endpoint_dir :
+        Directory in which to expose gRPC servers which use UDS at a fixed
+        path. If given, the channels in :attr:`channels` and the
+        :attr:`transport_options` refer to a symbolic link in this directory,
+        which is atomically re-pointed to the product's socket each time the
+        instance is started. Channels therefore keep working across
+        :meth:`restart`, reconnecting to the new product process. They are
+        closed by :meth:`stop`. Not supported on Windows.
+    lazy :
+        Whether to defer starting the product until the instance is first
+        used. If ``True``, the product is started by the first access to
+        :attr:`urls`, :attr:`channels`, or :attr:`transport_options`, or the
+        first call to :meth:`check`, :meth:`check_servers`, or :meth:`wait`.
+        If :meth:`stop` cancels the pending start, these raise a
+        ``ProductInstanceError`` until the instance is started explicitly.
+
+    Notes
+    -----
+    If an event log is configured with :func:`.events.set_event_log`, the
+    lifecycle events of the instance are written to it.
+
+    If resource sampling is enabled with :func:`.resources.enable_resource_sampling`,
+    the resource usage of the product's processes is recorded while it runs.
+    """
+
+    def __init__(
+        self,
+        *,
+        launcher: LauncherProtocol[LAUNCHER_CONFIG_T],
+        product_name: str | None = None,
+        launch_mode: str | None = None,
+        health_check_policy: HealthCheckPolicy | None = None,
+        stable_endpoint_dir: str | os.PathLike[str] | None = None,
+        lazy: bool = False,
+    ):
+        if stable_endpoint_dir is not None and os.name == "nt":
+            raise ProductInstanceError("Stable endpoints are not supported on Windows.")
+        self._stable_endpoint_dir = (
+            None if stable_endpoint_dir is None else pathlib.Path(stable_endpoint_dir)
+        )
+        self._stable_transport_options: dict[str, UDSOptions] = {}
+        self._stable_channels: dict[str, grpc.Channel] = {}
+        self._restarting = False
+        self._metric_labels = {"product": product_name or "", "launch_mode": launch_mode or ""}
+        self._start_time: float | None = None
+        self._trace_context = events.TraceContext.new()
+        self._spawn_time: float | None = None
+        self._awaiting_first_check = False
+        self._healthy = False
+        self._health_check_policy = health_check_policy or HealthCheckPolicy()
+        self._check_lock = threading.Lock()
+        self._last_check: tuple[float, bool] | None = None
+        self._consecutive_failures = 0
+        self._circuit_open_until: float | None = None
+        self._ready_servers: set[str] = set()
+        self._server_check_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._resource_sampler: resources.ResourceSampler | None = None
+        self._resource_tracker: resources.ResourceTracker | None = None
+        self._resource_summary: resources.ResourceSummary | None = None
+        # The base class constructor calls 'start()', which skips the start
+        # once if it is deferred.
+        self._skip_constructor_start = lazy
+        self._start_pending = lazy
+        self._start_cancelled = False
+        self._lazy_start_lock = threading.Lock()
+        super().__init__(launcher=launcher)
+
+    def __enter__(self) -> "ProductInstance":
+        """Enter the context manager defined by the product instance."""
+        if not self._start_pending:
+            super().__enter__()
+        return self
+
+    def start(self) -> None:
+        """Start the product instance.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance is already started or the URLs do not match
+            the launcher's SERVER_SPEC.
+        """
+        if self._skip_constructor_start:
+            self._skip_constructor_start = False
+            return
+        if not self.stopped:
+            raise ProductInstanceError("Cannot start the server. It has already been started.")
+        self._start_pending = False
+        self._start_cancelled = False
+        metrics.LAUNCHES_STARTED.inc(**self._metric_labels)
+        start_time = time.monotonic()
+        try:
+            with events._use_trace_context(self._trace_context):
+                super().start()
+            try:
+                self._update_stable_endpoints()
+            except BaseException:
+                # The launch counts as failed, so the product must not keep running.
+                self._remove_stable_endpoints(close_channels=not self._restarting)
+                with events._use_trace_context(self._trace_context):
+                    super().stop()
+                raise
+        except BaseException as exc:
+            metrics.LAUNCHES_FAILED.inc(**self._metric_labels)
+            self._emit("spawn-failed", error=repr(exc), **self._metric_labels)
+            raise
+        self._start_time = start_time
+        self._spawn_time = time.monotonic()
+        self._awaiting_first_check = True
+        self._healthy = False
+        self._ready_servers = set()
+        self._reset_check_state()
+        metrics.LIVE_INSTANCES.inc(**self._metric_labels)
+        self._start_resource_sampling()
+        self._emit("spawn", elapsed=self._spawn_time - start_time, **self._metric_labels)
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        """Stop the product instance.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds after which the instance is forcefully stopped.
+            Not all launch methods implement this parameter. If the parameter
+            is not implemented, it is ignored.
+
+        If the start of a lazy instance is still pending, it is cancelled
+        instead.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance is already stopped.
+        """
+        with self._lazy_start_lock:
+            if self._start_pending:
+                self._start_pending = False
+                self._start_cancelled = True
+                return
+        if self.stopped:
+            raise ProductInstanceError("Cannot stop the server. It has already been stopped.")
+        stop_start_time = time.monotonic()
+        self._sample_before_stop()
+        try:
+            with events._use_trace_context(self._trace_context):
+                super().stop(timeout=timeout)
+        finally:
+            self._stop_resource_sampling()
+            self._remove_stable_endpoints(close_channels=not self._restarting)
+            self._shutdown_server_check_executor()
+        stop_duration = time.monotonic() - stop_start_time
+        metrics.STOP_SECONDS.observe(stop_duration, **self._metric_labels)
+        metrics.LIVE_INSTANCES.dec(**self._metric_labels)
+        self._start_time = None
+        resource_fields = {}
+        if self._resource_summary is not None:
+            resource_fields = {
+                "peak_rss_bytes": self._resource_summary.peak_rss_bytes,
+                "cpu_seconds": self._resource_summary.cpu_seconds,
+            }
+        self._emit("stop", elapsed=stop_duration, **resource_fields)
+
+    def restart(self, stop_timeout: float | None = None) -> None:
+        """Stop and then start the product instance.
+
+        The channels of stable endpoints are kept open, and reconnect to
+        the new product process.
+
+        Parameters
+        ----------
+        stop_timeout : float, default: None
+            Time in seconds after which the instance is forcefully stopped.
+            Not all launch methods implement this parameter. If the parameter
+            is not implemented, it is ignored.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the instance is already stopped or URL keys mismatch.
+        """
+        self._restarting = True
+        try:
+            super().restart(stop_timeout=stop_timeout)
+        finally:
+            self._restarting = False
+
+    def check(self, timeout: float | None = None, *, force: bool = False) -> bool:
+        """Check if all servers are responding to requests.
+
+        Depending on the :attr:`health_check_policy`, the result of a
+        recent check may be reused, or ``False`` may be returned without
+        a check while the circuit breaker is open.
+
+        If the launcher implements the :class:`.SupportsServerChecks`
+        interface, the servers are checked concurrently.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for the servers to respond. There
+            is no guarantee that the ``check()`` method returns within this time.
+            Instead, this parameter is used as a hint to the launcher implementation.
+        force : bool, default: False
+            Whether to check the servers even if a cached result is
+            available or the circuit breaker is open.
+        """
+        self._ensure_started()
+        if not force:
+            skipped_result = self._get_skipped_check_result()
+            if skipped_result is not None:
+                return skipped_result
+        check_time = time.monotonic()
+        with events._use_trace_context(self._trace_context):
+            result = all(self._check_servers(timeout).values())
+        self._record_check_result(result, check_time=check_time)
+        if self._awaiting_first_check:
+            self._awaiting_first_check = False
+            self._emit("first-check", result=result, elapsed=self._elapsed_since_spawn())
+        elif self._healthy and not result:
+            self._emit("unhealthy", elapsed=self._elapsed_since_spawn())
+        self._healthy = result
+        return result
+
+    def check_servers(self, timeout: float | None = None) -> dict[str, bool]:
+        """Check which servers are responding to requests.
+
+        Unlike :meth:`check`, this method always makes a health check,
+        regardless of the :attr:`health_check_policy`.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for the servers to respond.
+
+        Returns
+        -------
+        dict[str, bool]
+            Mapping of server keys to whether the server is responding. If
+            the launcher does not implement the :class:`.SupportsServerChecks`
+            interface, the servers are checked together, and the result is
+            reported for each of them.
+        """
+        self._ensure_started()
+        with events._use_trace_context(self._trace_context):
+            return self._check_servers(timeout)
+
+    @property
+    def health_check_policy(self) -> HealthCheckPolicy:
+        """Caching and circuit breaking of the health checks made by :meth:`check`."""
+        return self._health_check_policy
+
+    @health_check_policy.setter
+    def health_check_policy(self, value: HealthCheckPolicy) -> None:
+        self._health_check_policy = value
+
+    @property
+    def circuit_open(self) -> bool:
+        """Flag indicating if the circuit breaker of :meth:`check` is currently open."""
+        with self._check_lock:
+            return self._circuit_open_until is not None
+
+    def wait(self, timeout: float, *, connect_channels: bool = False) -> None:
+        """Wait for all servers to respond.
+
+        This method repeatedly checks if the servers are running, returning as soon
+        as they are all ready. If the launcher implements the
+        :class:`.SupportsReadinessNotification` interface, the readiness
+        notification is waited for instead.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Wait time in seconds before raising an exception.
+        connect_channels : bool, default: False
+            Whether to also connect the gRPC channels in :attr:`.channels`
+            before returning. This moves the cost of establishing the
+            connection (including the HTTP/2 and TLS handshakes) out of
+            the first RPC made by the client. The channel connection
+            counts towards the ``timeout``.
+
+        Raises
+        ------
+        ProductInstanceError
+            If the server still has not responded after ``timeout`` seconds,
+            or if the product reported that it failed to start.
+        """
+        self._ensure_started()
+        start_time = time.monotonic()
+        try:
+            ready = None
+            if isinstance(self._launcher, SupportsReadinessNotification):
+                try:
+                    ready = self._launcher.wait_ready(timeout=timeout)
+                except ProductInstanceError:
+                    raise
+                except Exception as exc:
+                    raise ProductInstanceError(
+                        f"The product failed to become ready: {exc}"
+                    ) from exc
+            if ready is None:
+                self._poll_until_healthy(timeout)
+            elif not ready:
+                raise ProductInstanceError(
+                    f"The product did not report to be ready after {timeout}s."
+                )
+            if connect_channels:
+                self._connect_channels(deadline=start_time + timeout)
+        except BaseException as exc:
+            self._record_launch_result(success=False)
+            self._emit("wait-failed", error=str(exc), elapsed=self._elapsed_since_spawn())
+            raise
+        self._record_launch_result(success=True)
+        self._healthy = True
+        self._reset_check_state(healthy_since=time.monotonic())
+        self._emit("ready", elapsed=self._elapsed_since_spawn())
+
+    @property
+    def transport_options(self) -> dict[str, TransportOptionsType]:
+        """Read-only mapping of gRPC server keys to their transport options."""
+        self._ensure_started()
+        if not self._stable_transport_options:
+            return self._launcher.transport_options
+        # The stable options are compatible with the UDS options of 'ansys-tools-common'.
+        stable_transport_options: dict[str, Any] = self._stable_transport_options
+        return {**self._launcher.transport_options, **stable_transport_options}
+
+    @property
+    def urls(self) -> dict[str, str]:
+        """Read-only mapping of server keys to their URLs.
+
+        Only generic server types are listed, gRPC servers should be accessed
+        via the :attr:`.channels` property.
+        """
+        self._ensure_started()
+        return super().urls
+
+    @property
+    def channels(self) -> dict[str, grpc.Channel]:
+        """Read-only mapping of server keys to gRPC channels."""
+        self._ensure_started()
+        return super().channels
+
+    @property
+    def resource_samples(self) -> list[resources.ResourceSample]:
+        """Most recent resource usage samples of the product's processes.
+
+        Empty if resource sampling was not enabled when the instance was started.
+        """
+        if self._resource_tracker is None:
+            return []
+        return self._resource_tracker.samples
+
+    @property
+    def resource_summary(self) -> resources.ResourceSummary | None:
+        """Summary of the resource usage of the product's processes.
+
+        Available after the instance has been stopped, if resource sampling was
+        enabled when it was started.
+        """
+        return self._resource_summary
+
+    @property
+    def instance_id(self) -> str:
+        """Identifier of the instance in the lifecycle events."""
+        return self._trace_context.instance_id
+
+    @property
+    def traceparent(self) -> str:
+        """W3C trace context passed to the product in the ``TRACEPARENT`` environment variable."""
+        return self._trace_context.traceparent
+
+    def _ensure_started(self) -> None:
+        if self._start_pending:
+            with self._lazy_start_lock:
+                if self._start_pending:
+                    self.start()
+        if self._start_cancelled:
+            raise ProductInstanceError("The product instance was stopped before it was started.")
+
+    def _update_stable_endpoints(self) -> None:
+        if self._stable_endpoint_dir is None:
+            return
+        launcher_transport_options = self._launcher.transport_options
+        for key, server_type in self._launcher.SERVER_SPEC.items():
+            transport_options = launcher_transport_options.get(key)
+            if (
+                server_type != ServerType.GRPC
+                or transport_options is None
+                or TransportMode(transport_options.mode) != TransportMode.UDS
+            ):
+                continue
+            stable_options = self._stable_transport_options.get(key)
+            if stable_options is None:
+                stable_options = UDSOptions(
+                    uds_service=key,
+                    uds_dir=self._stable_endpoint_dir,
+                    uds_id=self.instance_id,
+                )
+                self._stable_transport_options[key] = stable_options
+            # The target is made absolute, since relative link targets are
+            # resolved relative to the directory of the link.
+            _swap_symlink(
+                _get_uds_path(stable_options),
+                target=_get_uds_path(transport_options).absolute(),
+            )
+            if key not in self._stable_channels:
+                self._stable_channels[key] = stable_options.create_channel(
+                    grpc_options=[
+                        ("grpc.max_receive_message_length", _GRPC_MAX_MESSAGE_LENGTH),
+                        # The default backoff of up to two minutes would delay
+                        # reconnecting after a restart. Connection attempts to
+                        # a local socket are cheap, so they are retried quickly.
+                        ("grpc.initial_reconnect_backoff_ms", 100),
+                        ("grpc.min_reconnect_backoff_ms", 100),
+                        ("grpc.max_reconnect_backoff_ms", 1000),
+                    ]
+                )
+            # Replace the channel created by the base class, which connects
+            # to the socket of the current product process.
+            self._channels[key].close()
+            self._channels[key] = self._stable_channels[key]
+
+    def _remove_stable_endpoints(self, *, close_channels: bool) -> None:
+        # During a restart, the channels are kept so that they can be reused.
+        for stable_options in self._stable_transport_options.values():
+            _get_uds_path(stable_options).unlink(missing_ok=True)
+        if close_channels:
+            stable_channels, self._stable_channels = self._stable_channels, {}
+            for channel in stable_channels.values():
+                channel.close()
+
+    def _poll_until_healthy(self, timeout: float) -> None:
+        # The cache and circuit breaker are bypassed, since the result of
+        # the checks is expected to change while the product starts.
+        start_time = time.monotonic()
+        while time.monotonic() - start_time <= timeout:
+            if self.check(timeout=timeout / 3, force=True):
+                return
+            # Try again until the timeout is reached. A small delay is added
+            # so that the server isn't bombarded with requests.
+            time.sleep(timeout / 100)
+        raise ProductInstanceError(f"The product is not running after {timeout}s.")
+
+    def _check_servers(self, timeout: float | None) -> dict[str, bool]:
+        keys = list(self._launcher.SERVER_SPEC)
+        launcher = self._launcher
+        if not isinstance(launcher, SupportsServerChecks):
+            return dict.fromkeys(keys, self._launcher.check(timeout=timeout))
+        if len(keys) == 1:
+            results = {keys[0]: launcher.check_server(keys[0], timeout=timeout)}
+        else:
+            executor = self._server_check_executor
+            if executor is None:
+                executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(keys), thread_name_prefix="server-check"
+                )
+                self._server_check_executor = executor
+            # Each check runs in a copy of the current context, so that
+            # events emitted by the launcher keep the trace context.
+            futures = {
+                key: executor.submit(
+                    contextvars.copy_context().run, launcher.check_server, key, timeout=timeout
+                )
+                for key in keys
+            }
+            results = {key: future.result() for key, future in futures.items()}
+        for key, result in results.items():
+            if result and key not in self._ready_servers:
+                self._ready_servers.add(key)
+                self._emit("server-ready", server=key, elapsed=self._elapsed_since_spawn())
+        return results
+
+    def _shutdown_server_check_executor(self) -> None:
+        if self._server_check_executor is not None:
+            self._server_check_executor.shutdown(wait=False)
+            self._server_check_executor = None
+
+    def _get_skipped_check_result(self) -> bool | None:
+        policy = self._health_check_policy
+        now = time.monotonic()
+        with self._check_lock:
+            if self._circuit_open_until is not None:
+                if now < self._circuit_open_until:
+                    self._count_skipped_check("circuit_open")
+                    return False
+                # Let a single trial check through. Concurrent callers keep
+                # failing fast until its result is recorded.
+                self._circuit_open_until = now + policy.reset_timeout
+                return None
+            if self._last_check is not None:
+                last_check_time, last_result = self._last_check
+                if now - last_check_time < policy.cache_ttl:
+                    self._count_skipped_check("cached")
+                    return last_result
+        return None
+
+    def _record_check_result(self, result: bool, *, check_time: float) -> None:
+        policy = self._health_check_policy
+        with self._check_lock:
+            self._last_check = (check_time, result)
+            if result:
+                self._consecutive_failures = 0
+                if self._circuit_open_until is not None:
+                    self._circuit_open_until = None
+                    self._emit("circuit-closed")
+                return
+            self._consecutive_failures += 1
+            if (
+                policy.failure_threshold is not None
+                and self._consecutive_failures >= policy.failure_threshold
+            ):
+                if self._circuit_open_until is None:
+                    self._emit("circuit-open", consecutive_failures=self._consecutive_failures)
+                self._circuit_open_until = time.monotonic() + policy.reset_timeout
+
+    def _reset_check_state(self, *, healthy_since: float | None = None) -> None:
+        with self._check_lock:
+            self._last_check = None if healthy_since is None else (healthy_since, True)
+            self._consecutive_failures = 0
+            self._circuit_open_until = None
+
+    def _count_skipped_check(self, reason: str) -> None:
+        metrics.HEALTH_CHECKS_SKIPPED.inc(**self._metric_labels, reason=reason)
+
+    def _start_resource_sampling(self) -> None:
+        self._resource_sampler = resources.get_resource_sampler()
+        self._resource_tracker = None
+        self._resource_summary = None
+        if self._resource_sampler is None or not isinstance(self._launcher, SupportsProcessId):
+            return
+        pid = self._launcher.pid
+        if pid is not None:
+            self._resource_tracker = self._resource_sampler.track(pid)
+
+    def _sample_before_stop(self) -> None:
+        if self._resource_tracker is None:
+            return
+        # Take a final sample while the process still exists.
+        self._resource_tracker.sample()
+
+    def _stop_resource_sampling(self) -> None:
+        if self._resource_sampler is None or self._resource_tracker is None:
+            return
+        self._resource_sampler.untrack(self._resource_tracker)
+        self._resource_summary = self._resource_tracker.summary()
+
+    def _emit(self, event: str, **fields: Any) -> None:
+        events.emit(event, trace_context=self._trace_context, **fields)
+
+    def _elapsed_since_spawn(self) -> float | None:
+        if self._spawn_time is None:
+            return None
+        return time.monotonic() - self._spawn_time
+
+    def _record_launch_result(self, *, success: bool) -> None:
+        # Only the first wait after each start is counted as the launch result.
+        if self._start_time is None:
+            return
+        if success:
+            metrics.LAUNCHES_SUCCEEDED.inc(**self._metric_labels)
+            metrics.LAUNCH_READY_SECONDS.observe(
+                time.monotonic() - self._start_time, **self._metric_labels
+            )
+        else:
+            metrics.LAUNCHES_FAILED.inc(**self._metric_labels)
+        self._start_time = None
+
+    def _connect_channels(self, *, deadline: float) -> None:
+        # Start connecting all channels at once, such that the handshakes
+        # happen concurrently.
+        ready_futures = {
+            key: grpc.channel_ready_future(channel) for key, channel in self.channels.items()
+        }
+        try:
+            for key, ready_future in ready_futures.items():
+                try:
+                    ready_future.result(timeout=max(deadline - time.monotonic(), 0.0))
+                except grpc.FutureTimeoutError as exc:
+                    raise ProductInstanceError(
+                        f"The gRPC channel for the server with key '{key}' could not be "
+                        "connected in time."
+                    ) from exc
+        finally:
+            for ready_future in ready_futures.values():
+                ready_future.cancel()
+
+
+def _swap_symlink(path: pathlib.Path, *, target: pathlib.Path) -> None:
+    # Renaming a new link over the old one replaces it atomically, such that
+    # clients connecting concurrently always find either the old or the new
+    # target.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    os.symlink(target, tmp_path)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
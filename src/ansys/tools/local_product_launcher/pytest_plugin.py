@@ -0,0 +1,428 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Pytest plugin for sharing product instances between tests.
+
+Starting a product is often the most expensive part of a test. This plugin
+provides the session-scoped :func:`product_instance_pool` fixture, which
+launches each product once per test session and reuses it across tests.
+
+When running with ``pytest-xdist``, each worker has its own session, and
+therefore its own instance of each product. For products which are
+stateless, a single instance can instead be shared between all workers by
+passing ``shared=True``. The first worker to request the product launches
+it, and the other workers connect to it. The instance is stopped once all
+workers have finished.
+
+The plugin is not registered automatically when the package is installed,
+so that it does not affect the test sessions of unrelated projects. To use
+it, enable it in the top-level ``conftest.py`` file of the test suite, and
+use :func:`product_instance_fixture` to define fixtures for specific products:
+
+.. code:: python
+
+    from ansys.tools.local_product_launcher.pytest_plugin import product_instance_fixture
+
+    pytest_plugins = ["ansys.tools.local_product_launcher.pytest_plugin"]
+
+    acp_server = product_instance_fixture("ACP", launch_mode="direct")
+
+Alternatively, the plugin can be enabled on the command line with
+``pytest -p ansys.tools.local_product_launcher.pytest_plugin``.
+"""
+
+from collections.abc import Callable, Iterator
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import time
+from typing import Any
+import uuid
+
+from ansys.tools.common.launcher.product_instance import _GRPC_MAX_MESSAGE_LENGTH
+import grpc
+import pytest
+
+from ._file_lock import FileLock, _is_locked
+from .grpc_transport import (
+    TransportOptionsType,
+    transport_options_from_dict,
+    transport_options_to_dict,
+)
+from .helpers.grpc import check_grpc_health
+from .launch import launch_product
+from .product_instance import ProductInstance
+
+__all__ = [
+    "ProductInstancePool",
+    "SharedProductInstance",
+    "product_instance_pool",
+    "product_instance_fixture",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+_POLL_INTERVAL = 0.1
+
+
+class SharedProductInstance:
+    """Provides access to a product instance launched by another pytest-xdist worker.
+
+    This class provides the same interface for accessing the product as
+    :class:`.ProductInstance`, but cannot stop or restart the product.
+
+    Parameters
+    ----------
+    urls :
+        Mapping of server keys to the URLs of generic servers.
+    transport_options :
+        Mapping of server keys to the transport options of gRPC servers.
+    """
+
+    def __init__(self, *, urls: dict[str, str], transport_options: dict[str, TransportOptionsType]):
+        self._urls = urls
+        self._transport_options = transport_options
+        self._channels: dict[str, grpc.Channel] | None = None
+
+    @property
+    def urls(self) -> dict[str, str]:
+        """Read-only mapping of server keys to their URLs."""
+        return self._urls
+
+    @property
+    def transport_options(self) -> dict[str, TransportOptionsType]:
+        """Read-only mapping of gRPC server keys to their transport options."""
+        return self._transport_options
+
+    @property
+    def channels(self) -> dict[str, grpc.Channel]:
+        """Read-only mapping of server keys to gRPC channels."""
+        if self._channels is None:
+            self._channels = {
+                key: transport_options.create_channel(
+                    grpc_options=[("grpc.max_receive_message_length", _GRPC_MAX_MESSAGE_LENGTH)]
+                )
+                for key, transport_options in self._transport_options.items()
+            }
+        return self._channels
+
+    @property
+    def stopped(self) -> bool:
+        """Flag indicating if the product instance is stopped. Always ``False``."""
+        return False
+
+    def check(self, timeout: float | None = None) -> bool:
+        """Check if all gRPC servers are responding to requests.
+
+        The generic servers cannot be checked, since the launcher is only
+        available in the worker which launched the product.
+
+        Parameters
+        ----------
+        timeout : float, default: None
+            Time in seconds to wait for the servers to respond.
+        """
+        return all(
+            check_grpc_health(channel, timeout=timeout) for channel in self.channels.values()
+        )
+
+    def close(self) -> None:
+        """Close the gRPC channels."""
+        for channel in (self._channels or {}).values():
+            channel.close()
+        self._channels = None
+
+
+class ProductInstancePool:
+    """Launches product instances on demand, and keeps them until the pool is closed.
+
+    Parameters
+    ----------
+    coordination_dir :
+        Directory shared between all processes which can share instances.
+        If ``None``, instances are never shared with other processes.
+    timeout :
+        Default time in seconds to wait for a launched product to become ready.
+    release_timeout :
+        Time in seconds to wait for other processes to release a shared
+        instance launched by this process when the pool is closed. Once it
+        expires, the instance is stopped regardless.
+    """
+
+    def __init__(
+        self,
+        *,
+        coordination_dir: pathlib.Path | None = None,
+        timeout: float = 60.0,
+        release_timeout: float = 300.0,
+    ):
+        self._coordination_dir = coordination_dir
+        self._timeout = timeout
+        self._release_timeout = release_timeout
+        self._instances: dict[str, ProductInstance | SharedProductInstance] = {}
+        # Keys of shared instances this pool uses, mapped to the paths
+        # of the lock and state files.
+        self._shared_keys: dict[str, tuple[FileLock, pathlib.Path]] = {}
+        # Other processes consider this pool alive while it holds its user
+        # lock. Unlike a PID, the random ID is never reused.
+        self._user_id = uuid.uuid4().hex
+        self._user_lock: FileLock | None = None
+
+    def get(
+        self,
+        product_name: str,
+        *,
+        launch_mode: str | None = None,
+        config: Any = None,
+        shared: bool = False,
+        timeout: float | None = None,
+    ) -> ProductInstance | SharedProductInstance:
+        """Get a ready instance of the product, launching it if needed.
+
+        Parameters
+        ----------
+        product_name :
+            Name of the product.
+        launch_mode :
+            Launch mode to use. If ``None``, the configured default is used.
+        config :
+            Configuration to launch the product with. If ``None``, the
+            configured default is used.
+        shared :
+            Whether the instance can be shared with other processes using the
+            same coordination directory. This should only be used for products
+            which are stateless, since tests in different processes run
+            concurrently on the same instance.
+        timeout :
+            Time in seconds to wait for the product to become ready. Defaults
+            to the timeout of the pool.
+
+        Returns
+        -------
+        :
+            A :class:`.ProductInstance` if the instance was launched by this
+            process, or a :class:`SharedProductInstance` if it was launched by
+            another process.
+        """
+        key = _get_key(product_name, launch_mode, config, shared)
+        if key not in self._instances:
+            timeout = self._timeout if timeout is None else timeout
+
+            def launch() -> ProductInstance:
+                instance = launch_product(product_name, launch_mode=launch_mode, config=config)
+                try:
+                    instance.wait(timeout=timeout)
+                except BaseException:
+                    instance.stop()
+                    raise
+                return instance
+
+            if shared and self._coordination_dir is not None:
+                self._instances[key] = self._get_shared(key, launch)
+            else:
+                self._instances[key] = launch()
+        return self._instances[key]
+
+    def close(self) -> None:
+        """Release all instances, stopping those launched by this process.
+
+        Shared instances launched by this process are only stopped once all
+        other processes have released them, or the release timeout expires.
+        """
+        # Instances launched by other processes are released first, so that
+        # processes waiting on each other's instances cannot deadlock.
+        for key, instance in self._instances.items():
+            if key in self._shared_keys and isinstance(instance, SharedProductInstance):
+                self._release_shared(key, instance)
+        for key, instance in self._instances.items():
+            if key in self._shared_keys:
+                if isinstance(instance, ProductInstance):
+                    self._release_shared(key, instance)
+            elif isinstance(instance, ProductInstance) and not instance.stopped:
+                instance.stop()
+        self._instances.clear()
+        self._shared_keys.clear()
+        if self._user_lock is not None:
+            self._user_lock.release()
+            self._user_lock.path.unlink(missing_ok=True)
+            self._user_lock = None
+
+    def _get_shared(
+        self, key: str, launch: Callable[[], ProductInstance]
+    ) -> ProductInstance | SharedProductInstance:
+        assert self._coordination_dir is not None
+        if self._user_lock is None:
+            user_lock = FileLock(self._get_user_lock_path(self._user_id))
+            user_lock.acquire()
+            self._user_lock = user_lock
+        lock = FileLock(self._coordination_dir / f"{key}.lock")
+        state_path = self._coordination_dir / f"{key}.json"
+        with lock:
+            state = _read_state(state_path)
+            instance: ProductInstance | SharedProductInstance
+            if state is None or not self._is_user_alive(state["owner"]):
+                instance = launch()
+                state = {
+                    "owner": self._user_id,
+                    "users": [self._user_id],
+                    "urls": instance.urls,
+                    "transport_options": {
+                        server_key: transport_options_to_dict(transport_options)
+                        for server_key, transport_options in instance.transport_options.items()
+                    },
+                }
+            else:
+                instance = SharedProductInstance(
+                    urls=state["urls"],
+                    transport_options={
+                        server_key: transport_options_from_dict(transport_options)
+                        for server_key, transport_options in state["transport_options"].items()
+                    },
+                )
+                state["users"].append(self._user_id)
+            _write_state(state_path, state)
+        self._shared_keys[key] = (lock, state_path)
+        return instance
+
+    def _release_shared(self, key: str, instance: ProductInstance | SharedProductInstance) -> None:
+        lock, state_path = self._shared_keys[key]
+        if isinstance(instance, SharedProductInstance):
+            with lock:
+                state = _read_state(state_path)
+                if state is not None and self._user_id in state["users"]:
+                    state["users"].remove(self._user_id)
+                    _write_state(state_path, state)
+            instance.close()
+            return
+        # The instance was launched by this process. Wait until the other
+        # processes have released it, or exited, before stopping it.
+        deadline = time.monotonic() + self._release_timeout
+        while True:
+            with lock:
+                state = _read_state(state_path)
+                if state is not None and state["owner"] != self._user_id:
+                    # Another process has taken over the key, and uses its own instance.
+                    other_users = []
+                    break
+                other_users = [
+                    user_id
+                    for user_id in (state["users"] if state is not None else [])
+                    if user_id != self._user_id and self._is_user_alive(user_id)
+                ]
+                if not other_users or time.monotonic() >= deadline:
+                    state_path.unlink(missing_ok=True)
+                    break
+            time.sleep(_POLL_INTERVAL)
+        if other_users:
+            _LOGGER.warning(
+                "Stopping the shared instance '%s' while it is still used by %d other process(es).",
+                key,
+                len(other_users),
+            )
+        if not instance.stopped:
+            instance.stop()
+
+    def _get_user_lock_path(self, user_id: str) -> pathlib.Path:
+        assert self._coordination_dir is not None
+        return self._coordination_dir / f"user-{user_id}.lock"
+
+    def _is_user_alive(self, user_id: str) -> bool:
+        return user_id == self._user_id or _is_locked(self._get_user_lock_path(user_id))
+
+
+def _get_key(product_name: str, launch_mode: str | None, config: Any, shared: bool) -> str:
+    # The key is used as a file name, so the configuration is hashed.
+    config_hash = hashlib.sha256(repr(config).encode()).hexdigest()[:16]
+    return (
+        f"{product_name}-{launch_mode or 'default'}-{config_hash}-{'shared' if shared else 'local'}"
+    )
+
+
+def _read_state(path: pathlib.Path) -> dict[str, Any] | None:
+    try:
+        return json.loads(path.read_text())  # type: ignore[no-any-return]
+    except FileNotFoundError:
+        return None
+
+
+def _write_state(path: pathlib.Path, state: dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(state))
+    os.replace(tmp_path, path)
+
+
+@pytest.fixture(scope="session")
+def product_instance_pool(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Iterator[ProductInstancePool]:
+    """Pool of product instances, shared by all tests in the session.
+
+    When running with ``pytest-xdist``, instances requested with ``shared=True``
+    are shared between the workers.
+    """
+    coordination_dir = None
+    if hasattr(request.config, "workerinput"):
+        # The parent of the base temporary directory is common to all workers.
+        coordination_dir = tmp_path_factory.getbasetemp().parent
+    pool = ProductInstancePool(coordination_dir=coordination_dir)
+    yield pool
+    pool.close()
+
+
+def product_instance_fixture(
+    product_name: str,
+    *,
+    launch_mode: str | None = None,
+    config: Any = None,
+    shared: bool = False,
+    timeout: float = 60.0,
+) -> Any:
+    """Define a session-scoped fixture providing a ready product instance.
+
+    The fixture is named after the variable it is assigned to.
+
+    Parameters
+    ----------
+    product_name :
+        Name of the product.
+    launch_mode :
+        Launch mode to use. If ``None``, the configured default is used.
+    config :
+        Configuration to launch the product with. If ``None``, the
+        configured default is used.
+    shared :
+        Whether to share the instance between pytest-xdist workers. See
+        :meth:`ProductInstancePool.get`.
+    timeout :
+        Time in seconds to wait for the product to become ready.
+    """
+
+    @pytest.fixture(scope="session")
+    def _product_instance(
+        product_instance_pool: ProductInstancePool,
+    ) -> ProductInstance | SharedProductInstance:
+        return product_instance_pool.get(
+            product_name, launch_mode=launch_mode, config=config, shared=shared, timeout=timeout
+        )
+
+    return _product_instance
@@ -0,0 +1,394 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Sampling of the resource usage of product instances.
+
+When resource sampling is enabled with :func:`enable_resource_sampling`, the
+RSS, CPU time, thread count and number of open file descriptors of each
+product's process tree are periodically read from ``/proc``. A single
+background thread samples all instances, and the samples are kept in a
+bounded buffer per instance.
+
+Sampling requires the launcher to implement the :class:`.SupportsProcessId`
+interface, and is only available on Linux.
+"""
+
+import collections
+from collections.abc import Iterable
+import dataclasses
+import os
+import pathlib
+import sys
+import threading
+import time
+
+__all__ = [
+    "ResourceSample",
+    "ResourceSummary",
+    "ResourceTracker",
+    "ResourceSampler",
+    "enable_resource_sampling",
+    "disable_resource_sampling",
+    "get_resource_sampler",
+    "set_resource_sampler",
+]
+
+_PROC = pathlib.Path("/proc")
+
+
+@dataclasses.dataclass(frozen=True)
+class ResourceSample:
+    """Resource usage of a process tree at one point in time."""
+
+    monotonic: float
+    """Time of the sample, as returned by :func:`time.monotonic`."""
+    rss_bytes: int
+    """Total resident set size of the processes, in bytes."""
+    cpu_seconds: float
+    """Total user and system CPU time of the processes, including reaped children."""
+    num_threads: int
+    """Total number of threads of the processes."""
+    num_fds: int
+    """Total number of open file descriptors of the processes."""
+    num_processes: int
+    """Number of processes in the tree."""
+
+
+@dataclasses.dataclass(frozen=True)
+class ResourceSummary:
+    """Summary of the resource usage of a process tree over its lifetime."""
+
+    num_samples: int
+    """Number of samples taken."""
+    peak_rss_bytes: int
+    """Highest sampled total resident set size, in bytes."""
+    cpu_seconds: float
+    """Total user and system CPU time used by the process tree, as of the last sample.
+
+    For stopped product instances, the last sample is taken right before the
+    product is stopped, so the CPU time used while shutting down is not included.
+    """
+    peak_num_threads: int
+    """Highest sampled total number of threads."""
+    peak_num_fds: int
+    """Highest sampled total number of open file descriptors."""
+
+
+class ResourceTracker:
+    """Holds the samples of a single process tree.
+
+    Instances of this class are created with :meth:`ResourceSampler.track`.
+    """
+
+    def __init__(self, pid: int, *, maxlen: int):
+        self._pid = pid
+        self._samples: collections.deque[ResourceSample] = collections.deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._num_samples = 0
+        self._peak_rss_bytes = 0
+        self._peak_num_threads = 0
+        self._peak_num_fds = 0
+        self._cpu_seconds = 0.0
+
+    @property
+    def pid(self) -> int:
+        """Process ID of the root of the process tree."""
+        return self._pid
+
+    @property
+    def samples(self) -> list[ResourceSample]:
+        """Most recent samples, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def sample(self) -> ResourceSample | None:
+        """Take a sample of the process tree now.
+
+        Returns
+        -------
+        :
+            The sample, or ``None`` if the process no longer exists.
+        """
+        sample = _sample_process_tree(self._pid)
+        if sample is not None:
+            with self._lock:
+                self._samples.append(sample)
+                self._num_samples += 1
+                self._peak_rss_bytes = max(self._peak_rss_bytes, sample.rss_bytes)
+                self._peak_num_threads = max(self._peak_num_threads, sample.num_threads)
+                self._peak_num_fds = max(self._peak_num_fds, sample.num_fds)
+                self._cpu_seconds = max(self._cpu_seconds, sample.cpu_seconds)
+        return sample
+
+    def summary(self) -> ResourceSummary:
+        """Summarize the samples taken so far."""
+        with self._lock:
+            return ResourceSummary(
+                num_samples=self._num_samples,
+                peak_rss_bytes=self._peak_rss_bytes,
+                cpu_seconds=self._cpu_seconds,
+                peak_num_threads=self._peak_num_threads,
+                peak_num_fds=self._peak_num_fds,
+            )
+
+
+class ResourceSampler:
+    """Periodically samples the resource usage of process trees.
+
+    A single background thread samples all tracked process trees. It is
+    started when the first process tree is tracked, and exits when no
+    process trees are tracked.
+
+    Parameters
+    ----------
+    interval :
+        Time in seconds between samples.
+    maxlen :
+        Maximum number of samples kept per process tree.
+    """
+
+    def __init__(self, *, interval: float = 1.0, maxlen: int = 3600):
+        if sys.platform != "linux":
+            raise RuntimeError("Resource sampling is only available on Linux.")
+        self._interval = interval
+        self._maxlen = maxlen
+        self._trackers: set[ResourceTracker] = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval(self) -> float:
+        """Time in seconds between samples."""
+        return self._interval
+
+    def track(self, pid: int) -> ResourceTracker:
+        """Start sampling a process tree.
+
+        Parameters
+        ----------
+        pid :
+            Process ID of the root of the process tree.
+        """
+        tracker = ResourceTracker(pid, maxlen=self._maxlen)
+        tracker.sample()
+        with self._lock:
+            self._trackers.add(tracker)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ResourceSampler", daemon=True
+                )
+                self._thread.start()
+        return tracker
+
+    def untrack(self, tracker: ResourceTracker) -> None:
+        """Stop sampling a process tree."""
+        with self._lock:
+            self._trackers.discard(tracker)
+            self._wakeup.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                self._wakeup.wait(timeout=self._interval)
+                if not self._trackers:
+                    self._thread = None
+                    return
+                trackers = list(self._trackers)
+            for tracker in trackers:
+                tracker.sample()
+
+
+_SAMPLER: ResourceSampler | None = None
+
+
+def enable_resource_sampling(*, interval: float = 1.0, maxlen: int = 3600) -> ResourceSampler:
+    """Enable sampling the resource usage of product instances started from now on.
+
+    Parameters
+    ----------
+    interval :
+        Time in seconds between samples.
+    maxlen :
+        Maximum number of samples kept per instance.
+
+    Raises
+    ------
+    RuntimeError
+        If not running on Linux.
+    """
+    global _SAMPLER
+    _SAMPLER = ResourceSampler(interval=interval, maxlen=maxlen)
+    return _SAMPLER
+
+
+def disable_resource_sampling() -> None:
+    """Disable sampling the resource usage of product instances started from now on."""
+    global _SAMPLER
+    _SAMPLER = None
+
+
+def get_resource_sampler() -> ResourceSampler | None:
+    """Get the resource sampler, or ``None`` if sampling is disabled."""
+    return _SAMPLER
+
+
+def set_resource_sampler(sampler: ResourceSampler | None) -> None:
+    """Set the resource sampler used for product instances started from now on.
+
+    This can be used to restore the sampler returned by an earlier call to
+    :func:`get_resource_sampler`.
+
+    Parameters
+    ----------
+    sampler :
+        Resource sampler to use, or ``None`` to disable sampling.
+    """
+    global _SAMPLER
+    _SAMPLER = sampler
+
+
+def _sample_process_tree(pid: int) -> ResourceSample | None:
+    timestamp = time.monotonic()
+    root_stat = _read_stat(pid)
+    if root_stat is None:
+        return None
+    rss_bytes = 0
+    cpu_seconds = 0.0
+    num_threads = 0
+    num_fds = 0
+    num_processes = 0
+    for index, current_pid in enumerate(_iter_process_tree(pid)):
+        stat = root_stat if index == 0 else _read_stat(current_pid)
+        if stat is None:
+            continue
+        num_processes += 1
+        rss_bytes += stat.rss_pages * _PAGE_SIZE
+        # The root process includes the CPU time of its reaped children,
+        # such that short-lived helper processes are accounted for.
+        cpu_ticks = stat.utime + stat.stime
+        if index == 0:
+            cpu_ticks += stat.cutime + stat.cstime
+        cpu_seconds += cpu_ticks / _CLOCK_TICKS
+        num_threads += stat.num_threads
+        num_fds += _count_fds(current_pid)
+    return ResourceSample(
+        monotonic=timestamp,
+        rss_bytes=rss_bytes,
+        cpu_seconds=cpu_seconds,
+        num_threads=num_threads,
+        num_fds=num_fds,
+        num_processes=num_processes,
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class _Stat:
+    utime: int
+    stime: int
+    cutime: int
+    cstime: int
+    num_threads: int
+    rss_pages: int
+
+
+def _read_stat(pid: int) -> _Stat | None:
+    try:
+        content = (_PROC / str(pid) / "stat").read_text()
+    except OSError:
+        return None
+    # The process name is enclosed in parentheses and may contain spaces,
+    # so the remaining fields are split after the last closing parenthesis.
+    # The first field after it is the state, which is field 3 in proc(5).
+    fields = content[content.rindex(")") + 2 :].split()
+    if fields[0] == "Z":
+        return None
+    return _Stat(
+        utime=int(fields[11]),
+        stime=int(fields[12]),
+        cutime=int(fields[13]),
+        cstime=int(fields[14]),
+        num_threads=int(fields[17]),
+        rss_pages=int(fields[21]),
+    )
+
+
+def _count_fds(pid: int) -> int:
+    try:
+        return len(os.listdir(_PROC / str(pid) / "fd"))
+    except OSError:
+        return 0
+
+
+def _iter_process_tree(pid: int) -> Iterable[int]:
+    """Iterate over the process and all its descendants."""
+    if (_PROC / str(pid) / "task" / str(pid) / "children").exists():
+        get_children = _get_children
+    else:
+        # The 'children' files are not available if the kernel is built
+        # without CONFIG_PROC_CHILDREN. Fall back to scanning all processes.
+        children_map = _get_children_map()
+        get_children = lambda current_pid: children_map.get(current_pid, [])  # noqa: E731
+    pending = [pid]
+    seen = set()
+    while pending:
+        current_pid = pending.pop()
+        if current_pid in seen:
+            continue
+        seen.add(current_pid)
+        yield current_pid
+        pending.extend(get_children(current_pid))
+
+
+def _get_children(pid: int) -> list[int]:
+    task_dir = _PROC / str(pid) / "task"
+    try:
+        tids = os.listdir(task_dir)
+    except OSError:
+        return []
+    children = []
+    for tid in tids:
+        try:
+            children.extend(
+                int(child) for child in (task_dir / tid / "children").read_text().split()
+            )
+        except OSError:
+            continue
+    return children
+
+
+def _get_children_map() -> dict[int, list[int]]:
+    children_map: dict[int, list[int]] = collections.defaultdict(list)
+    for entry in os.listdir(_PROC):
+        if not entry.isdigit():
+            continue
+        try:
+            content = (_PROC / entry / "stat").read_text()
+        except OSError:
+            continue
+        ppid = int(content[content.rindex(")") + 2 :].split()[1])
+        children_map[ppid].append(int(entry))
+    return children_map
+
+
+if sys.platform == "linux":
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+    _CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
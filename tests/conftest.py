@@ -20,14 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from functools import partial
-import importlib.metadata
-from unittest.mock import Mock
+from dataclasses import dataclass
+import time
 
 import pytest
 
-from ansys.tools.local_product_launcher import _plugins, config
-from ansys.tools.local_product_launcher.interface import LAUNCHER_CONFIG_T, LauncherProtocol
+from ansys.tools.local_product_launcher import config
+from ansys.tools.local_product_launcher.interface import LauncherProtocol, ServerType
+from ansys.tools.local_product_launcher.product_instance import ProductInstance
+from mock_plugins import monkeypatch_entrypoints_from_plugins  # noqa: F401
 
 
 @pytest.fixture(autouse=True)
@@ -36,32 +37,54 @@ def reset_config():
     config._reset_config()
 
 
-def get_mock_entrypoints_from_plugins(
-    target_plugins: dict[str, dict[str, LauncherProtocol[LAUNCHER_CONFIG_T]]],
-):
-    res = []
-    for product_name, launchers in target_plugins.items():
-        for launch_mode, launcher_kls in launchers.items():
-            mock_entrypoint = Mock(spec=importlib.metadata.EntryPoint)
-            mock_entrypoint.name = f"{product_name}.{launch_mode}"
-            mock_entrypoint.load = Mock(return_value=launcher_kls)
-            res.append(mock_entrypoint)
-    return res
+@dataclass
+class CountingConfig:
+    pass
+
+
+class CountingLauncher(LauncherProtocol[CountingConfig]):
+    """Launcher without a process, which records the time of each health check."""
+
+    CONFIG_MODEL = CountingConfig
+    SERVER_SPEC = {"main": ServerType.GENERIC}
+
+    def __init__(self, *, config: CountingConfig):
+        self.healthy = True
+        self.check_times: list[float] = []
+
+    def start(self) -> None:
+        pass
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        pass
+
+    def check(self, *, timeout: float | None = None) -> bool:
+        self.check_times.append(time.monotonic())
+        return self.healthy
+
+    @property
+    def num_checks(self) -> int:
+        return len(self.check_times)
+
+    @property
+    def urls(self) -> dict[str, str]:
+        return {"main": "localhost:0"}
+
+    @property
+    def transport_options(self):
+        return {}
 
 
 @pytest.fixture
-def monkeypatch_entrypoints_from_plugins(monkeypatch):
-    def inner(target_plugins):
-        # Patch both the local _plugins module and the actual module from ansys-tools-common
-        mock_fn = partial(get_mock_entrypoints_from_plugins, target_plugins=target_plugins)
-        monkeypatch.setattr(_plugins, "_get_entry_points", mock_fn)
-        # Also patch the underlying module that _plugins imports from
-        try:
-            import ansys.tools.common.launcher._plugins as common_plugins
-
-            monkeypatch.setattr(common_plugins, "_get_entry_points", mock_fn)
-        except ImportError:
-            # If ansys-tools-common is not installed, the local patch should be sufficient
-            pass
+def make_counting_instance():
+    """Create product instances whose launcher counts the health checks made."""
+
+    def inner(policy=None):
+        return ProductInstance(
+            launcher=CountingLauncher(config=CountingConfig()),
+            product_name="CountingProduct",
+            launch_mode="direct",
+            health_check_policy=policy,
+        )
 
     return inner
@@ -0,0 +1,195 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""Launcher for a fake product, for load testing without an Ansys installation.
+
+The fake product is a gRPC server (see ``fake_server.py``) whose startup
+delay, crash probability, memory footprint, and RPC latency can be tuned
+with the :class:`FakeProductConfig`. It is registered as the ``direct``
+launch mode of the ``fake_product`` product, so it can be used with
+:func:`.launch_product`, instance groups, and the command-line interface.
+
+With the default configuration the server starts without delay, such that
+launch benchmarks (``ansys-launcher bench fake_product``) mostly measure
+the overhead of the launcher itself. Otherwise, the configured
+``startup_delay`` is the part of the launch time spent by the product.
+"""
+
+from dataclasses import dataclass, field
+import itertools
+import pathlib
+import subprocess
+import sys
+import tempfile
+import uuid
+
+import grpc
+
+from ansys.tools.local_product_launcher import events
+from ansys.tools.local_product_launcher.grpc_transport import UDSOptions
+from ansys.tools.local_product_launcher.helpers.grpc import check_grpc_health
+from ansys.tools.local_product_launcher.helpers.notify import NotifySocket
+from ansys.tools.local_product_launcher.interface import (
+    METADATA_KEY_DOC,
+    LauncherProtocol,
+    ServerType,
+)
+
+__all__ = ["FakeProductConfig", "FakeProductLauncher"]
+
+SERVER_KEY = "main"
+
+
+@dataclass
+class FakeProductConfig:
+    """Configuration of the fake product."""
+
+    startup_delay: float = field(
+        default=0.0,
+        metadata={METADATA_KEY_DOC: "Time in seconds before the server starts listening."},
+    )
+    crash_probability: float = field(
+        default=0.0,
+        metadata={METADATA_KEY_DOC: "Probability that the server exits during startup."},
+    )
+    memory_mb: int = field(
+        default=0,
+        metadata={METADATA_KEY_DOC: "Memory in MB allocated by the server."},
+    )
+    rpc_latency: float = field(
+        default=0.0,
+        metadata={METADATA_KEY_DOC: "Time in seconds the server takes to answer each RPC."},
+    )
+    max_workers: int = field(
+        default=32,
+        metadata={METADATA_KEY_DOC: "Number of threads handling RPCs in the server."},
+    )
+    notify_ready: bool = field(
+        default=False,
+        metadata={
+            METADATA_KEY_DOC: "Whether the server notifies the launcher when it is ready, "
+            "instead of being polled."
+        },
+    )
+    seed: int | None = field(
+        default=None,
+        metadata={
+            METADATA_KEY_DOC: "Seed for deciding whether the server crashes. Each launcher "
+            "adds its index in order of creation, so that the instances of a load test "
+            "make different, but reproducible, decisions."
+        },
+    )
+
+
+class FakeProductLauncher(LauncherProtocol[FakeProductConfig]):
+    """Launcher for the fake product.
+
+    Each instance listens on its own UDS file, so that many instances can
+    run at the same time.
+    """
+
+    CONFIG_MODEL = FakeProductConfig
+    SERVER_SPEC = {SERVER_KEY: ServerType.GRPC}
+
+    _instance_counter = itertools.count()
+
+    def __init__(self, *, config: FakeProductConfig):
+        self._config = config
+        self._index = next(self._instance_counter)
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._transport_options = UDSOptions(
+            uds_service="fake_product", uds_dir=self._tmp_dir.name, uds_id=uuid.uuid4().hex[:8]
+        )
+        self._uds_file = (
+            pathlib.Path(self._tmp_dir.name) / f"fake_product-{self._transport_options.uds_id}.sock"
+        )
+        self._process: subprocess.Popen[bytes]
+        self._channel: grpc.Channel | None = None
+        self._notify_socket: NotifySocket | None = None
+
+    def start(self) -> None:
+        config = self._config
+        env = events.child_environment()
+        if config.notify_ready:
+            self._notify_socket = NotifySocket()
+            env |= self._notify_socket.env
+        args = [
+            sys.executable,
+            "-m",
+            "pkg_with_entrypoint.fake_server",
+            str(self._uds_file),
+            f"--startup-delay={config.startup_delay}",
+            f"--crash-probability={config.crash_probability}",
+            f"--memory-mb={config.memory_mb}",
+            f"--rpc-latency={config.rpc_latency}",
+            f"--max-workers={config.max_workers}",
+        ]
+        if config.seed is not None:
+            args.append(f"--seed={config.seed + self._index}")
+        self._process = subprocess.Popen(
+            args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env
+        )
+        # The channel is reused by all health checks, so that they measure
+        # the latency of the server instead of the connection setup.
+        self._channel = self._transport_options.create_channel()
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            events.emit("kill-escalation", timeout=timeout)
+            self._process.kill()
+            self._process.wait()
+        if self._channel is not None:
+            self._channel.close()
+            self._channel = None
+        if self._notify_socket is not None:
+            self._notify_socket.close()
+            self._notify_socket = None
+        self._uds_file.unlink(missing_ok=True)
+
+    def check(self, *, timeout: float | None = None) -> bool:
+        if self._channel is None or self._process.poll() is not None:
+            return False
+        return check_grpc_health(self._channel, timeout=timeout)
+
+    def wait_ready(self, *, timeout: float) -> bool | None:
+        if self._notify_socket is None:
+            return None
+        return self._notify_socket.wait_ready(timeout, process=self._process)
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid
+
+    @property
+    def returncode(self) -> int | None:
+        """Exit code of the server process, or ``None`` if it is running."""
+        return self._process.poll()
+
+    @property
+    def urls(self) -> dict[str, str]:
+        return {}
+
+    @property
+    def transport_options(self):
+        return {SERVER_KEY: self._transport_options}
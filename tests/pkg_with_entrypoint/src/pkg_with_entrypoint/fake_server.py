@@ -0,0 +1,99 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""gRPC server standing in for a product, started by the fake product launcher.
+
+The server only implements the gRPC health checking service. Its startup
+delay, crash probability, memory footprint, and RPC latency are set with
+command-line arguments. Run ``python -m pkg_with_entrypoint.fake_server --help``
+for details.
+"""
+
+import argparse
+from concurrent import futures
+import random
+import signal
+import sys
+import time
+
+import grpc
+from grpc_health.v1 import health, health_pb2_grpc
+
+from ansys.tools.local_product_launcher.helpers.notify import notify
+
+CRASH_EXIT_CODE = 3
+
+_PAGE_SIZE = 4096
+
+
+class SlowHealthServicer(health.HealthServicer):
+    """Health servicer which waits for a fixed time before each response."""
+
+    def __init__(self, *, rpc_latency: float):
+        super().__init__()
+        self._rpc_latency = rpc_latency
+
+    def Check(self, request, context):  # noqa: N802
+        time.sleep(self._rpc_latency)
+        return super().Check(request, context)
+
+
+def allocate_memory(memory_mb: int) -> bytearray:
+    """Allocate memory, and touch each page so that it counts towards the RSS."""
+    memory = bytearray(memory_mb * 1024**2)
+    for offset in range(0, len(memory), _PAGE_SIZE):
+        memory[offset] = 1
+    return memory
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the server until it receives ``SIGTERM``."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("uds_file", help="Path of the UDS file to listen on.")
+    parser.add_argument("--startup-delay", type=float, default=0.0)
+    parser.add_argument("--crash-probability", type=float, default=0.0)
+    parser.add_argument("--memory-mb", type=int, default=0)
+    parser.add_argument("--rpc-latency", type=float, default=0.0)
+    parser.add_argument("--max-workers", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # The memory is kept referenced until the server exits.
+    memory = allocate_memory(args.memory_mb)  # noqa: F841
+    time.sleep(args.startup_delay)
+    if random.Random(args.seed).random() < args.crash_probability:
+        print("Crashing during startup, as requested.", file=sys.stderr)
+        sys.exit(CRASH_EXIT_CODE)
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=args.max_workers))
+    health_pb2_grpc.add_HealthServicer_to_server(
+        SlowHealthServicer(rpc_latency=args.rpc_latency), server
+    )
+    server.add_insecure_port(f"unix:{args.uds_file}")
+    signal.signal(signal.SIGTERM, lambda *_: server.stop(grace=None))
+    server.start()
+    # Report readiness if the launcher requested it.
+    notify("READY=1")
+    server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    main()
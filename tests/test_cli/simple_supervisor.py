@@ -0,0 +1,46 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Runs the supervisor with the simple test launcher registered as a plugin."""
+
+import importlib.metadata
+import pathlib
+import sys
+from unittest.mock import Mock
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+
+import ansys.tools.common.launcher._plugins as common_plugins  # noqa: E402
+
+from ansys.tools.local_product_launcher import _plugins, _supervisor  # noqa: E402
+from test_integration.simple_test_launcher import SimpleLauncher  # noqa: E402
+
+PRODUCT_NAME = "detached_product"
+LAUNCH_MODE = "direct"
+
+if __name__ == "__main__":
+    entry_point = Mock(spec=importlib.metadata.EntryPoint)
+    entry_point.name = f"{PRODUCT_NAME}.{LAUNCH_MODE}"
+    entry_point.load = Mock(return_value=SimpleLauncher)
+    for module in (_plugins, common_plugins):
+        setattr(module, "_get_entry_points", lambda: [entry_point])
+    _supervisor.main()
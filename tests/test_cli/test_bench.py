@@ -0,0 +1,84 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+from click.testing import CliRunner
+
+from ansys.tools.local_product_launcher import _cli, resources
+from test_integration.simple_test_launcher import SimpleLauncher
+
+TEST_PRODUCT = "bench_product"
+TEST_LAUNCH_MODE = "direct"
+
+
+def test_bench_json(monkeypatch_entrypoints_from_plugins, temp_config_file):
+    plugins = {TEST_PRODUCT: {TEST_LAUNCH_MODE: SimpleLauncher}}
+    monkeypatch_entrypoints_from_plugins(plugins)
+    command = _cli.build_cli(plugins)
+    runner = CliRunner()
+    result = runner.invoke(
+        command,
+        [
+            "bench",
+            TEST_PRODUCT,
+            "--launch-mode",
+            TEST_LAUNCH_MODE,
+            "--cold",
+            "2",
+            "--warm",
+            "1",
+            "--format",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    output = json.loads(result.output)
+    assert output["launch_mode"] == TEST_LAUNCH_MODE
+    assert output["cold"]["runs"] == 2
+    assert output["warm"]["runs"] == 1
+    for phase in ("start", "first_healthy", "stop"):
+        stats = output["cold"][phase]
+        assert 0 < stats["p50"] <= stats["p95"] <= stats["max"]
+    assert output["cold"]["first_healthy"]["p50"] >= output["cold"]["start"]["p50"]
+    # The resource sampling enabled for the benchmark is disabled again.
+    assert resources.get_resource_sampler() is None
+
+
+def test_bench_text(monkeypatch_entrypoints_from_plugins, temp_config_file):
+    plugins = {TEST_PRODUCT: {TEST_LAUNCH_MODE: SimpleLauncher}}
+    monkeypatch_entrypoints_from_plugins(plugins)
+    command = _cli.build_cli(plugins)
+    runner = CliRunner()
+    result = runner.invoke(
+        command, ["bench", TEST_PRODUCT, "--launch-mode", TEST_LAUNCH_MODE, "--cold", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Cold launches: 1" in result.output
+    assert "first healthy" in result.output
+    assert "Warm relaunches" not in result.output
+
+
+def test_bench_unknown_product():
+    command = _cli.build_cli({TEST_PRODUCT: {TEST_LAUNCH_MODE: SimpleLauncher}})
+    result = CliRunner().invoke(command, ["bench", "other_product"])
+    assert result.exit_code != 0
@@ -0,0 +1,194 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from dataclasses import dataclass
+import json
+
+from click.testing import CliRunner
+import pytest
+
+from ansys.tools.local_product_launcher import _cli, config, interface
+
+TEST_PRODUCT = "my_product"
+OTHER_PRODUCT = "other_product"
+
+
+@dataclass
+class MockConfig:
+    int_field: int
+    float_field: float = 1.5
+    json_field: dict[str, str] | None = None
+    optional_field: str | None = None
+
+
+class MockLauncher(interface.LauncherProtocol[MockConfig]):
+    CONFIG_MODEL = MockConfig
+
+
+CONFIG = {
+    TEST_PRODUCT: {
+        "launch_mode": "direct",
+        "configs": {
+            "direct": {
+                "int_field": 1,
+                "float_field": 2.0,
+                "json_field": {"a": "b", "key with space": 'quoted "value"'},
+                "optional_field": None,
+            },
+            "other": {
+                "int_field": 2,
+                "float_field": 1.5,
+                "json_field": None,
+                "optional_field": "value",
+            },
+        },
+    },
+    OTHER_PRODUCT: {
+        "launch_mode": "direct",
+        "configs": {
+            "direct": {
+                "int_field": 3,
+                "float_field": 1.5,
+                "json_field": None,
+                "optional_field": None,
+            }
+        },
+    },
+}
+
+
+@pytest.fixture
+def command(temp_config_file):
+    return _cli.build_cli(
+        {
+            TEST_PRODUCT: {"direct": MockLauncher, "other": MockLauncher},
+            OTHER_PRODUCT: {"direct": MockLauncher},
+        }
+    )
+
+
+def write_config_file(path, data):
+    path.write_text(json.dumps(data))
+    # Building the CLI loads the configuration, so it needs to be reloaded.
+    config._reset_config()
+
+
+def test_json_roundtrip(command, temp_config_file, tmp_path):
+    input_path = tmp_path / "fleet.json"
+    input_path.write_text(json.dumps(CONFIG))
+    result = CliRunner().invoke(command, ["config", "import", str(input_path)])
+    assert result.exit_code == 0, result.output
+    assert json.loads(temp_config_file.read_text()) == CONFIG
+
+    result = CliRunner().invoke(command, ["config", "export"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == CONFIG
+
+
+def test_toml_roundtrip(command, temp_config_file, tmp_path):
+    write_config_file(temp_config_file, CONFIG)
+    output_path = tmp_path / "fleet.toml"
+    result = CliRunner().invoke(command, ["config", "export", "--output", str(output_path)])
+    assert result.exit_code == 0, result.output
+    assert "[my_product.configs.direct]" in output_path.read_text()
+
+    result = CliRunner().invoke(command, ["config", "import", str(output_path), "--replace"])
+    assert result.exit_code == 0, result.output
+    # Options which are 'None' are omitted from TOML, and are set to their
+    # default value on import.
+    imported = json.loads(temp_config_file.read_text())
+    assert imported[TEST_PRODUCT]["configs"]["direct"] == {
+        "int_field": 1,
+        "float_field": 2.0,
+        "json_field": {"a": "b", "key with space": 'quoted "value"'},
+        "optional_field": None,
+    }
+    assert imported[OTHER_PRODUCT] == CONFIG[OTHER_PRODUCT]
+
+
+def test_import_from_stdin_merges(command, temp_config_file):
+    write_config_file(temp_config_file, {OTHER_PRODUCT: CONFIG[OTHER_PRODUCT]})
+    data = {TEST_PRODUCT: {"launch_mode": "other", "configs": {"other": {"int_field": 5}}}}
+    result = CliRunner().invoke(command, ["config", "import", "-"], input=json.dumps(data))
+    assert result.exit_code == 0, result.output
+    imported = json.loads(temp_config_file.read_text())
+    assert imported[OTHER_PRODUCT] == CONFIG[OTHER_PRODUCT]
+    assert imported[TEST_PRODUCT]["launch_mode"] == "other"
+    assert imported[TEST_PRODUCT]["configs"]["other"]["int_field"] == 5
+
+
+def test_import_replace(command, temp_config_file):
+    write_config_file(temp_config_file, CONFIG)
+    data = {OTHER_PRODUCT: {"launch_mode": "direct", "configs": {"direct": {"int_field": 5}}}}
+    result = CliRunner().invoke(
+        command, ["config", "import", "-", "--replace"], input=json.dumps(data)
+    )
+    assert result.exit_code == 0, result.output
+    assert list(json.loads(temp_config_file.read_text())) == [OTHER_PRODUCT]
+
+
+def test_import_invalid_reports_all_errors(command, temp_config_file):
+    write_config_file(temp_config_file, CONFIG)
+    data = {
+        "unknown_product": {"launch_mode": "direct", "configs": {}},
+        TEST_PRODUCT: {
+            "launch_mode": "direct",
+            "configs": {
+                "direct": {"int_field": "1"},
+                "unknown_mode": {"int_field": 1},
+                "other": {"int_field": 1, "unknown_field": 2},
+            },
+        },
+        OTHER_PRODUCT: {"launch_mode": "direct", "configs": {"direct": {}}},
+    }
+    result = CliRunner().invoke(command, ["config", "import", "-"], input=json.dumps(data))
+    assert result.exit_code == 1
+    assert "'unknown_product': no plugin is installed" in result.output
+    assert "'my_product.direct': option 'int_field' must be of type 'int'" in result.output
+    assert "'my_product.unknown_mode': no plugin is installed" in result.output
+    assert "'my_product.other': " in result.output and "unknown_field" in result.output
+    assert "'other_product.direct': " in result.output and "int_field" in result.output
+    # The configuration file is left unchanged.
+    assert json.loads(temp_config_file.read_text()) == CONFIG
+
+
+def test_import_invalid_product_structure(command, temp_config_file):
+    write_config_file(temp_config_file, CONFIG)
+    data = {
+        TEST_PRODUCT: {"launch_mode": ["direct"], "configs": []},
+        OTHER_PRODUCT: {"launch_mode": "direct", "configs": "direct"},
+    }
+    result = CliRunner().invoke(command, ["config", "import", "-"], input=json.dumps(data))
+    assert result.exit_code == 1
+    assert "Invalid configuration" in result.output
+    assert "'my_product': the default launch mode must be a string." in result.output
+    assert "'my_product': 'configs' must be a mapping of launch modes." in result.output
+    assert "'other_product': 'configs' must be a mapping of launch modes." in result.output
+    assert json.loads(temp_config_file.read_text()) == CONFIG
+
+
+def test_import_malformed(command, temp_config_file):
+    result = CliRunner().invoke(
+        command, ["config", "import", "-", "--format", "toml"], input="not = [valid"
+    )
+    assert result.exit_code == 1
+    assert not temp_config_file.exists()
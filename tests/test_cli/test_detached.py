@@ -0,0 +1,162 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import pathlib
+import signal
+import subprocess
+import sys
+import time
+
+from click.testing import CliRunner
+import pytest
+
+from ansys.tools.local_product_launcher import _cli, _detached
+from test_integration.simple_test_launcher import SimpleLauncher
+
+from .simple_supervisor import LAUNCH_MODE, PRODUCT_NAME
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Uses the UDS transport.")
+
+
+@pytest.fixture
+def command(monkeypatch, tmp_path):
+    monkeypatch.setenv(_detached.STATE_DIR_ENV_VAR, str(tmp_path / "instances"))
+    monkeypatch.setattr(
+        _detached,
+        "_SUPERVISOR_COMMAND",
+        [sys.executable, str(pathlib.Path(__file__).parent / "simple_supervisor.py")],
+    )
+    command = _cli.build_cli({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    yield command
+    CliRunner().invoke(command, ["stop", "--all"])
+
+
+def _invoke(command, args):
+    result = CliRunner().invoke(command, args)
+    return result.exit_code, json.loads(result.output)
+
+
+def test_launch_status_stop(command):
+    exit_code, launched = _invoke(
+        command, ["launch", PRODUCT_NAME, "--launch-mode", LAUNCH_MODE, "--count", "2"]
+    )
+    assert exit_code == 0, launched
+    assert len(launched) == 2
+    for state in launched:
+        assert state["status"] == "running"
+        assert state["launch_mode"] == LAUNCH_MODE
+        assert state["transport_options"]["main"]["mode"] == "uds"
+        assert state["timings"]["ready_seconds"] >= state["timings"]["start_seconds"]
+        os.kill(state["pid"], 0)
+    assert len({state["transport_options"]["main"]["uds_dir"] for state in launched}) == 2
+
+    exit_code, status = _invoke(command, ["status", "--check"])
+    assert exit_code == 0
+    assert sorted(state["id"] for state in status) == sorted(state["id"] for state in launched)
+    assert all(state["healthy"] for state in status)
+
+    exit_code, stopped = _invoke(command, ["stop", launched[0]["id"]])
+    assert exit_code == 0
+    assert stopped[0]["status"] == "stopped"
+    with pytest.raises(ProcessLookupError):
+        os.kill(launched[0]["pid"], 0)
+
+    exit_code, status = _invoke(command, ["status"])
+    assert [state["id"] for state in status] == [launched[1]["id"]]
+
+
+def test_launch_failure(command):
+    exit_code, launched = _invoke(command, ["launch", PRODUCT_NAME, "--launch-mode", "other"])
+    assert exit_code == 1
+    assert launched[0]["status"] == "failed"
+    assert "other" in launched[0]["error"]
+    _, status = _invoke(command, ["status"])
+    assert status == []
+
+
+def test_status_unknown_instance(command):
+    _, status = _invoke(command, ["status", "unknown_id"])
+    assert status == [{"id": "unknown_id", "status": "unknown", "error": status[0]["error"]}]
+
+
+def test_stop_requires_ids(command):
+    result = CliRunner().invoke(command, ["stop"])
+    assert result.exit_code == 2
+
+
+def _is_running(pid):
+    try:
+        stat = pathlib.Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        return False
+    # Zombie processes have exited, but may not be reaped by the init process.
+    return stat.rpartition(")")[2].split()[0] != "Z"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="Requires procfs.")
+def test_dead_supervisor(command):
+    _, launched = _invoke(command, ["launch", PRODUCT_NAME, "--launch-mode", LAUNCH_MODE])
+    (state,) = launched
+    os.kill(state["supervisor_pid"], signal.SIGKILL)
+    instance_dir = _detached.get_instances_dir() / state["id"]
+    while _detached._supervisor_alive(instance_dir):
+        time.sleep(0.05)
+
+    _, status = _invoke(command, ["status"])
+    assert status[0]["status"] == "dead"
+    assert _is_running(state["pid"])
+
+    exit_code, stopped = _invoke(command, ["stop", "--all", "--timeout", "5"])
+    assert exit_code == 0
+    assert stopped[0]["status"] == "dead"
+    assert not _is_running(state["pid"])
+    assert not instance_dir.exists()
+
+
+def test_reused_pids_are_not_signalled(command):
+    # The state of an instance whose supervisor died, for example before a
+    # reboot, and whose PIDs now belong to an unrelated process.
+    unrelated = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        instance_dir = _detached.get_instances_dir() / "stale"
+        instance_dir.mkdir(parents=True)
+        _detached.write_state(
+            instance_dir,
+            {
+                "id": "stale",
+                "status": "running",
+                "supervisor_pid": unrelated.pid,
+                "pid": unrelated.pid,
+            },
+        )
+        _, status = _invoke(command, ["status"])
+        assert status[0]["status"] == "dead"
+
+        exit_code, stopped = _invoke(command, ["stop", "--all", "--timeout", "1"])
+        assert exit_code == 0
+        assert unrelated.poll() is None
+        assert not instance_dir.exists()
+    finally:
+        unrelated.kill()
+        unrelated.wait()
@@ -0,0 +1,97 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import importlib.metadata
+import json
+import sys
+from unittest.mock import Mock
+
+from click.testing import CliRunner
+import pytest
+
+from ansys.tools.local_product_launcher import _cli, _doctor, _plugins
+from test_integration.simple_test_launcher import SimpleLauncher
+
+
+def test_doctor_json(temp_config_file):
+    command = _cli.build_cli({})
+    result = CliRunner().invoke(command, ["doctor", "--format", "json"])
+    assert result.exit_code == 0, result.output
+    output = json.loads(result.output)
+    assert output["transport"]["grpc_version"]
+    assert isinstance(output["transport"]["abstract_sockets_supported"], bool)
+    assert output["filesystems"]["config_dir"]["path"] == str(temp_config_file.parent)
+    assert output["filesystems"]["config_dir"]["latency"]["write_seconds"]["p50"] > 0
+    for name in ("find_free_ports", "reserve_ports"):
+        assert output["ports"][name]["seconds"]["max"] > 0
+    assert output["ports"]["reserve_ports"]["collisions"] == 0
+    assert output["package_import"]["seconds"] > 0
+    assert output["plugins"]["discovery_seconds"] >= 0
+    assert isinstance(output["findings"], list)
+
+
+def test_doctor_text(temp_config_file):
+    command = _cli.build_cli({})
+    result = CliRunner().invoke(command, ["doctor"])
+    assert result.exit_code == 0, result.output
+    for section in ("Transport:", "Filesystems:", "Port allocation:", "Imports:", "Findings:"):
+        assert section in result.output
+    assert "abstract sockets:" in result.output
+
+
+def test_abstract_sockets_supported():
+    assert _doctor._abstract_sockets_supported() == sys.platform.startswith("linux")
+
+
+def test_abstract_sockets_unsupported(monkeypatch):
+    monkeypatch.setattr(_doctor.sys, "platform", "darwin")
+    assert not _doctor._abstract_sockets_supported()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Reads '/proc/self/mountinfo'.")
+def test_filesystem_type(tmp_path):
+    assert _doctor.get_filesystem_type(tmp_path) is not None
+
+
+def test_network_filesystem_finding(monkeypatch, temp_config_file):
+    monkeypatch.setattr(_doctor, "get_filesystem_type", lambda path: "nfs4")
+    result = _doctor.run_diagnostics(num_iterations=1, num_ports=1)
+    assert "The configuration directory is on a network filesystem (nfs4)." in result["findings"]
+
+
+def test_measure_plugin_imports(monkeypatch_entrypoints_from_plugins, monkeypatch):
+    monkeypatch_entrypoints_from_plugins({"product": {"direct": SimpleLauncher}})
+    broken_entry_point = Mock(spec=importlib.metadata.EntryPoint)
+    broken_entry_point.name = "product.broken"
+    broken_entry_point.value = "broken_module:Launcher"
+    broken_entry_point.load = Mock(side_effect=ImportError("No module named 'broken_module'"))
+    entry_points = _plugins._get_entry_points()
+    entry_points[0].value = "test_integration.simple_test_launcher:SimpleLauncher"
+    monkeypatch.setattr(_plugins, "_get_entry_points", lambda: [*entry_points, broken_entry_point])
+
+    result = _doctor._measure_plugin_imports()
+    assert [plugin["name"] for plugin in result["entry_points"]] == [
+        "product.direct",
+        "product.broken",
+    ]
+    assert "error" not in result["entry_points"][0]
+    assert result["entry_points"][1]["error"] == "ImportError: No module named 'broken_module'"
@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'events' module."""
+
+import io
+import json
+
+import pytest
+
+from ansys.tools.local_product_launcher import events, launch_product
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+PRODUCT_NAME = "EventsTestProduct"
+LAUNCH_MODE = "direct"
+
+
+@pytest.fixture
+def event_log_path(tmp_path):
+    path = tmp_path / "events.jsonl"
+    events.set_event_log(path)
+    yield path
+    events.set_event_log(None)
+
+
+def _read_events(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_lifecycle_events(monkeypatch_entrypoints_from_plugins, event_log_path):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    server.wait(timeout=10)
+    server.stop()
+
+    records = _read_events(event_log_path)
+    assert [record["event"] for record in records] == ["spawn", "first-check", "ready", "stop"]
+    assert all(record["instance_id"] == server.instance_id for record in records)
+    assert all(record["trace_id"] in server.traceparent for record in records)
+    assert records[0]["product"] == PRODUCT_NAME
+    timestamps = [record["monotonic"] for record in records]
+    assert timestamps == sorted(timestamps)
+
+
+def test_unhealthy_event(monkeypatch_entrypoints_from_plugins, event_log_path):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    server.wait(timeout=10)
+    server._launcher._process.kill()
+    server._launcher._process.wait()
+    assert not server.check(timeout=1)
+    assert not server.check(timeout=1)
+    server.stop()
+
+    events_list = [record["event"] for record in _read_events(event_log_path)]
+    assert events_list.count("unhealthy") == 1
+
+
+def test_no_event_log():
+    assert events.get_event_log() is None
+    events.emit("ignored")
+
+
+def test_emit_to_file_object():
+    buffer = io.StringIO()
+    events.set_event_log(buffer)
+    try:
+        events.emit("custom", value=1)
+    finally:
+        events.set_event_log(None)
+    record = json.loads(buffer.getvalue())
+    assert record["event"] == "custom"
+    assert record["value"] == 1
+    assert "instance_id" not in record
+
+
+def test_trace_context_inherits_trace_id(monkeypatch):
+    trace_id = "0af7651916cd43dd8448eb211c80319c"
+    monkeypatch.setenv(events.TRACEPARENT_ENV_VAR, f"00-{trace_id}-b7ad6b7169203331-01")
+    trace_context = events.TraceContext.new()
+    assert trace_context.trace_id == trace_id
+    assert trace_context.traceparent.startswith(f"00-{trace_id}-")
+    assert trace_context.span_id != "b7ad6b7169203331"
+
+
+def test_child_environment():
+    trace_context = events.TraceContext.new()
+    assert events.TRACEPARENT_ENV_VAR not in events.child_environment({})
+    with events._use_trace_context(trace_context):
+        env = events.child_environment({"FOO": "bar"})
+    assert env == {"FOO": "bar", events.TRACEPARENT_ENV_VAR: trace_context.traceparent}
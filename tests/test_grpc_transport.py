@@ -0,0 +1,194 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'grpc_transport' module."""
+
+import asyncio
+import dataclasses
+import json
+import pathlib
+import subprocess
+import sys
+from typing import Any
+
+import grpc
+from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse
+from grpc_health.v1.health_pb2_grpc import HealthStub
+import pytest
+
+from ansys.tools.local_product_launcher import grpc_transport, launch_product
+from ansys.tools.local_product_launcher.grpc_transport import (
+    InsecureOptions,
+    MTLSOptions,
+    TransportCapabilities,
+    TransportMode,
+    UDSOptions,
+    WNUAOptions,
+    resolve_transport_mode,
+    select_transport_options,
+    transport_options_from_dict,
+    transport_options_to_dict,
+)
+from ansys.tools.local_product_launcher.product_instance import ProductInstance
+from test_integration.simple_test_launcher import SCRIPT_PATH, SimpleLauncher
+
+
+@pytest.fixture
+def uds_server(tmp_path):
+    process = subprocess.Popen(
+        [sys.executable, str(SCRIPT_PATH), str(tmp_path)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    yield UDSOptions(uds_service="simple_test_service", uds_dir=tmp_path)
+    process.terminate()
+    process.wait()
+
+
+def test_aio_channel_uds(uds_server):
+    async def check() -> int:
+        async with uds_server.create_aio_channel() as channel:
+            await asyncio.wait_for(channel.channel_ready(), timeout=10)
+            res = await HealthStub(channel).Check(HealthCheckRequest(), timeout=10)
+            return res.status
+
+    assert asyncio.run(check()) == HealthCheckResponse.ServingStatus.SERVING
+
+
+def test_aio_channel_type():
+    async def create() -> grpc.aio.Channel:
+        channel = InsecureOptions(port=50051).create_aio_channel()
+        await channel.close()
+        return channel
+
+    with pytest.warns(UserWarning, match="INSECURE"):
+        assert isinstance(asyncio.run(create()), grpc.aio.Channel)
+
+
+def test_aio_channel_remote_host_raises():
+    with pytest.raises(ValueError, match="allow_remote_host"):
+        InsecureOptions(host="example.com", port=50051).create_aio_channel()
+
+
+def _capabilities(**overrides) -> TransportCapabilities:
+    kwargs: dict[str, Any] = dict(
+        grpc_version="1.70.0",
+        uds_supported=True,
+        uds_dir_writable=True,
+        wnua_supported=False,
+    )
+    kwargs.update(overrides)
+    return TransportCapabilities(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "supported_modes,capabilities,expected",
+    [
+        (["insecure", "uds", "mtls"], _capabilities(), TransportMode.UDS),
+        (["insecure", "uds"], _capabilities(uds_dir_writable=False), TransportMode.INSECURE),
+        (["mtls", "insecure", "auto"], _capabilities(), TransportMode.MTLS),
+        (["insecure", "auto"], _capabilities(), TransportMode.INSECURE),
+        (["mtls", "wnua"], _capabilities(wnua_supported=True), TransportMode.WNUA),
+    ],
+)
+def test_resolve_transport_mode(supported_modes, capabilities, expected):
+    assert resolve_transport_mode(supported_modes, capabilities=capabilities) == expected
+
+
+def test_resolve_transport_mode_none_usable():
+    with pytest.raises(ValueError):
+        resolve_transport_mode(["uds"], capabilities=_capabilities(uds_supported=False))
+
+
+def test_select_transport_options():
+    uds_options = UDSOptions(uds_service="service")
+    selected = select_transport_options(
+        [InsecureOptions(port=50051), uds_options], capabilities=_capabilities()
+    )
+    assert selected is uds_options
+
+
+@pytest.mark.parametrize(
+    "transport_options",
+    [
+        UDSOptions(uds_service="service", uds_dir=pathlib.Path("/tmp/dir"), uds_id="id"),
+        WNUAOptions(port=50051),
+        MTLSOptions(port=50051, certs_dir=pathlib.Path("certs")),
+        InsecureOptions(port=50051, host="127.0.0.1"),
+    ],
+)
+def test_transport_options_dict_roundtrip(transport_options):
+    data = transport_options_to_dict(transport_options)
+    assert json.loads(json.dumps(data)) == data
+    restored = transport_options_from_dict(data)
+    assert restored.mode == transport_options.mode
+    assert restored._to_cyberchannel_kwargs() == {
+        key: str(value) if isinstance(value, pathlib.Path) else value
+        for key, value in transport_options._to_cyberchannel_kwargs().items()
+    }
+
+
+def test_capabilities_disk_cache(monkeypatch, tmp_path):
+    cache_path = tmp_path / "cache" / "transport_capabilities.json"
+    monkeypatch.setattr(grpc_transport, "_get_capabilities_cache_path", lambda: cache_path)
+    probe_results = [_capabilities(), _capabilities(uds_supported=False)]
+    monkeypatch.setattr(
+        grpc_transport, "_probe_transport_capabilities", lambda: probe_results.pop(0)
+    )
+
+    grpc_transport._get_transport_capabilities_cached.cache_clear()
+    try:
+        first = grpc_transport.get_transport_capabilities()
+        assert cache_path.exists()
+        # Simulate a new process: the in-memory cache is empty, but the
+        # disk cache is still valid.
+        grpc_transport._get_transport_capabilities_cached.cache_clear()
+        assert grpc_transport.get_transport_capabilities() == first
+        assert len(probe_results) == 1
+    finally:
+        grpc_transport._get_transport_capabilities_cached.cache_clear()
+
+
+@dataclasses.dataclass
+class AutoModeConfig:
+    transport_mode: TransportMode = TransportMode.AUTO
+    fallback_mode: str = "auto"
+
+
+class AutoModeLauncher(SimpleLauncher):
+    CONFIG_MODEL = AutoModeConfig  # type: ignore[assignment]
+    TRANSPORT_MODES = (TransportMode.MTLS, TransportMode.INSECURE)
+
+    def __init__(self, *, config):
+        self.config = config
+
+
+def test_launch_resolves_auto_transport_mode(monkeypatch, monkeypatch_entrypoints_from_plugins):
+    monkeypatch_entrypoints_from_plugins({"AutoProduct": {"direct": AutoModeLauncher}})
+    monkeypatch.setattr(grpc_transport, "get_transport_capabilities", lambda: _capabilities())
+    monkeypatch.setattr(ProductInstance, "start", lambda self: None)
+    config = AutoModeConfig()
+    instance = launch_product("AutoProduct", launch_mode="direct", config=config)
+    assert instance._launcher.config.transport_mode is TransportMode.MTLS
+    # Fields which are not annotated as transport modes are left unchanged.
+    assert instance._launcher.config.fallback_mode == "auto"
+    assert config.transport_mode is TransportMode.AUTO
@@ -0,0 +1,217 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'health_monitor' module."""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product
+from ansys.tools.local_product_launcher.grpc_transport import UDSOptions
+from ansys.tools.local_product_launcher.health_monitor import HealthMonitor
+from ansys.tools.local_product_launcher.interface import ServerType
+from ansys.tools.local_product_launcher.product_instance import HealthCheckPolicy
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+PRODUCT_NAME = "HealthMonitorTestProduct"
+LAUNCH_MODE = "direct"
+
+
+class BrokenChannel:
+    """Channel on which no calls can be made."""
+
+    def unary_unary(self, *args, **kwargs):
+        raise RuntimeError("The channel is broken.")
+
+
+def wait_for_changes(changes, count, timeout=10):
+    res = []
+    for _ in range(count):
+        res.append(changes.get(timeout=timeout))
+    return res
+
+
+def test_callbacks_on_state_change(make_counting_instance):
+    changes = queue.Queue()
+    instance = make_counting_instance()
+    with HealthMonitor(interval=0.05) as monitor:
+        monitor.add_callback(lambda inst, healthy: changes.put((inst, healthy)))
+        monitor.register(instance)
+        assert wait_for_changes(changes, 1) == [(instance, True)]
+        assert monitor.get_health(instance) is True
+        num_checks = len(instance._launcher.check_times)
+        time.sleep(0.2)
+        # Repeated checks with the same result do not invoke the callbacks.
+        assert len(instance._launcher.check_times) > num_checks
+        assert changes.empty()
+
+        instance._launcher.healthy = False
+        assert wait_for_changes(changes, 1) == [(instance, False)]
+        assert monitor.get_health(instance) is False
+
+
+def test_checks_are_staggered(make_counting_instance):
+    interval = 100.0
+    start_time = time.monotonic()
+    with HealthMonitor(interval=interval) as monitor:
+        for _ in range(10):
+            monitor.register(make_counting_instance())
+        with monitor._lock:
+            due_times = [due_time for due_time, _, _ in monitor._schedule]
+    # Compare the position of each check within the interval, since the
+    # first check may already have been made and scheduled again.
+    offsets = sorted(((due_time - start_time) % interval) / interval for due_time in due_times)
+    assert len(offsets) == 10
+    assert offsets[-1] - offsets[0] > 0.5
+    for earlier, later in zip(offsets, offsets[1:]):
+        assert later - earlier > 0.05
+
+
+def test_failed_check_is_recorded_once(make_counting_instance):
+    instance = make_counting_instance(HealthCheckPolicy(failure_threshold=2))
+    instance._launcher.healthy = False
+    changes = queue.Queue()
+    with HealthMonitor(interval=100) as monitor:
+        monitor.add_callback(lambda inst, healthy: changes.put(healthy))
+        monitor.register(instance)
+        assert wait_for_changes(changes, 1) == [False]
+    assert instance._launcher.num_checks == 1
+    assert instance._consecutive_failures == 1
+    assert not instance.circuit_open
+
+
+def make_grpc_instance(make_counting_instance, channels):
+    instance = make_counting_instance()
+    instance._launcher.SERVER_SPEC = {"main": ServerType.GRPC}
+    instance._channels = channels
+    return instance
+
+
+def test_check_errors_are_reported_as_unhealthy(make_counting_instance):
+    broken = make_grpc_instance(make_counting_instance, {"main": BrokenChannel()})
+    healthy = make_counting_instance()
+    changes = queue.Queue()
+    with HealthMonitor(interval=0.05) as monitor:
+        monitor.add_callback(lambda inst, healthy: changes.put((inst, healthy)))
+        monitor.register(broken)
+        monitor.register(healthy)
+        assert dict(wait_for_changes(changes, 2)) == {broken: False, healthy: True}
+        # The monitor keeps checking the instances.
+        num_checks = healthy._launcher.num_checks
+        deadline = time.monotonic() + 10
+        while healthy._launcher.num_checks == num_checks and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert healthy._launcher.num_checks > num_checks
+        assert monitor.get_health(broken) is False
+
+
+def test_grpc_instance_without_channels(make_counting_instance):
+    # Without channels, the instance is checked through its launcher.
+    instance = make_grpc_instance(make_counting_instance, {})
+    changes = queue.Queue()
+    with HealthMonitor(interval=0.05) as monitor:
+        monitor.add_callback(lambda inst, healthy: changes.put(healthy))
+        monitor.register(instance)
+        assert wait_for_changes(changes, 1) == [True]
+    assert instance._launcher.num_checks >= 1
+
+
+def test_results_are_cached_in_instance(make_counting_instance):
+    instance = make_counting_instance(HealthCheckPolicy(cache_ttl=10))
+    changes = queue.Queue()
+    with HealthMonitor(interval=0.05) as monitor:
+        monitor.add_callback(lambda inst, healthy: changes.put(healthy))
+        monitor.register(instance)
+        wait_for_changes(changes, 1)
+        monitor.unregister(instance)
+        num_checks = len(instance._launcher.check_times)
+        assert instance.check()
+        assert len(instance._launcher.check_times) == num_checks
+
+
+def test_failing_callback_does_not_stop_monitor(make_counting_instance):
+    changes = queue.Queue()
+
+    def failing_callback(instance, healthy):
+        raise RuntimeError("Callback failed.")
+
+    with HealthMonitor(interval=0.05) as monitor:
+        monitor.add_callback(failing_callback)
+        monitor.add_callback(lambda inst, healthy: changes.put(healthy))
+        monitor.register(make_counting_instance())
+        assert wait_for_changes(changes, 1) == [True]
+
+
+def test_thread_exits_when_empty(make_counting_instance):
+    with HealthMonitor(interval=0.05) as monitor:
+        instance = make_counting_instance()
+        monitor.register(instance)
+        assert monitor.instances == (instance,)
+        monitor.unregister(instance)
+        assert monitor.instances == ()
+        deadline = time.monotonic() + 5
+        while monitor._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert monitor._thread is None
+        assert not any(thread.name == "HealthMonitor" for thread in threading.enumerate())
+
+
+def test_register_after_close_raises(make_counting_instance):
+    monitor = HealthMonitor()
+    monitor.close()
+    with pytest.raises(RuntimeError):
+        monitor.register(make_counting_instance())
+
+
+def test_grpc_instances(monkeypatch_entrypoints_from_plugins, tmp_path):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    servers = []
+    for i in range(2):
+        config = SimpleLauncherConfig()
+        # Use a separate UDS directory for each instance, instead of the
+        # one shared through the class attribute.
+        config.transport_options = UDSOptions(
+            uds_service="simple_test_service", uds_dir=tmp_path / str(i)
+        )
+        (tmp_path / str(i)).mkdir()
+        servers.append(launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config))
+    changes = queue.Queue()
+    try:
+        for server in servers:
+            server.wait(timeout=10)
+        with HealthMonitor(interval=0.1, timeout=1) as monitor:
+            monitor.add_callback(lambda inst, healthy: changes.put((inst, healthy)))
+            for server in servers:
+                monitor.register(server)
+            assert sorted(wait_for_changes(changes, 2), key=lambda item: id(item[0])) == sorted(
+                [(server, True) for server in servers], key=lambda item: id(item[0])
+            )
+
+            servers[0]._launcher._process.kill()
+            servers[0]._launcher._process.wait()
+            assert wait_for_changes(changes, 1) == [(servers[0], False)]
+    finally:
+        for server in servers:
+            server.stop()
@@ -0,0 +1,204 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'helpers.http' module."""
+
+import http.server
+import socketserver
+import sys
+import threading
+
+import pytest
+
+from ansys.tools.local_product_launcher.helpers import http as http_helpers
+from ansys.tools.local_product_launcher.helpers.http import (
+    check_http_health,
+    close_http_connections,
+)
+
+
+class HealthHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.num_connections += 1
+
+    def do_GET(self):
+        status = 200 if self.path == "/health" else 503
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TCPServer(http.server.ThreadingHTTPServer):
+    num_connections = 0
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    num_connections = 0
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture(autouse=True)
+def close_connections():
+    yield
+    close_http_connections()
+
+
+@pytest.fixture
+def server():
+    server = _serve(TCPServer(("127.0.0.1", 0), HealthHandler))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_connection_is_reused(server):
+    url = f"127.0.0.1:{server.server_port}"
+    for _ in range(5):
+        assert check_http_health(url, "/health", timeout=5)
+    assert server.num_connections == 1
+
+
+def test_expected_status(server):
+    url = f"http://127.0.0.1:{server.server_port}"
+    assert not check_http_health(url, "/other", timeout=5)
+    assert check_http_health(url, "/other", timeout=5, expected_status=503)
+    assert check_http_health(url, "/other", timeout=5, expected_status={200, 503})
+    assert not check_http_health(url, "/health", timeout=5, expected_status=204)
+
+
+class ClosingHealthHandler(HealthHandler):
+    """Closes the connection after each response, without announcing it to the client."""
+
+    def do_GET(self):
+        super().do_GET()
+        self.close_connection = True
+
+
+def test_stale_connection_is_replaced():
+    server = _serve(TCPServer(("127.0.0.1", 0), ClosingHealthHandler))
+    try:
+        url = f"127.0.0.1:{server.server_port}"
+        for _ in range(3):
+            assert check_http_health(url, "/health", timeout=5)
+        assert server.num_connections == 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_no_server():
+    with socketserver.TCPServer(("127.0.0.1", 0), HealthHandler) as unused:
+        port = unused.server_address[1]
+    assert not check_http_health(f"127.0.0.1:{port}", "/health", timeout=1)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not used on Windows.")
+def test_unix_domain_socket(tmp_path):
+    uds_path = tmp_path / "http.sock"
+    server = _serve(UnixServer(str(uds_path), HealthHandler))
+    try:
+        for _ in range(3):
+            assert check_http_health("localhost", "/health", timeout=5, uds_path=uds_path)
+        assert server.num_connections == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_uds_requires_http():
+    with pytest.raises(ValueError):
+        check_http_health("https://localhost", uds_path="/tmp/http.sock")
+
+
+def num_idle_connections():
+    return sum(len(connections) for connections in http_helpers._POOL._idle.values())
+
+
+def test_close_connections_of_stopped_server(server):
+    other_server = _serve(TCPServer(("127.0.0.1", 0), HealthHandler))
+    try:
+        url = f"127.0.0.1:{server.server_port}"
+        other_url = f"127.0.0.1:{other_server.server_port}"
+        assert check_http_health(url, "/health", timeout=5)
+        assert check_http_health(other_url, "/health", timeout=5)
+        assert num_idle_connections() == 2
+
+        close_http_connections(f"http://{url}")
+        assert num_idle_connections() == 1
+        assert check_http_health(other_url, "/health", timeout=5)
+        assert other_server.num_connections == 1
+    finally:
+        other_server.shutdown()
+        other_server.server_close()
+
+
+def test_idle_connections_expire(server, monkeypatch):
+    url = f"127.0.0.1:{server.server_port}"
+    assert check_http_health(url, "/health", timeout=5)
+    assert num_idle_connections() == 1
+    monkeypatch.setattr(http_helpers, "_IDLE_TIMEOUT", 0.0)
+    assert check_http_health(url, "/health", timeout=5)
+    assert server.num_connections == 2
+
+
+def test_idle_connections_are_capped(monkeypatch):
+    monkeypatch.setattr(http_helpers, "_MAX_IDLE_CONNECTIONS", 2)
+    servers = [_serve(TCPServer(("127.0.0.1", 0), HealthHandler)) for _ in range(3)]
+    try:
+        for server in servers:
+            assert check_http_health(f"127.0.0.1:{server.server_port}", "/health", timeout=5)
+        assert num_idle_connections() == 2
+        # The connection to the least recently used server was closed.
+        for server in reversed(servers):
+            assert check_http_health(f"127.0.0.1:{server.server_port}", "/health", timeout=5)
+        assert [server.num_connections for server in servers] == [2, 1, 1]
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets are not used on Windows.")
+def test_close_connections_by_uds_path(tmp_path):
+    uds_path = tmp_path / "http.sock"
+    server = _serve(UnixServer(str(uds_path), HealthHandler))
+    try:
+        assert check_http_health("localhost", "/health", timeout=5, uds_path=uds_path)
+        close_http_connections(uds_path=uds_path)
+        assert num_idle_connections() == 0
+    finally:
+        server.shutdown()
+        server.server_close()
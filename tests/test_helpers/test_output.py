@@ -0,0 +1,141 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'helpers.output' module."""
+
+import gzip
+import subprocess
+import sys
+
+import pytest
+
+from ansys.tools.local_product_launcher.helpers.output import OutputCapture, OutputLine
+
+
+def _start_python(code: str, *, text: bool = True) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-u", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=text,
+    )
+
+
+@pytest.mark.parametrize("text", [True, False])
+def test_ring_buffer_is_bounded(text):
+    capture = OutputCapture(max_lines=10)
+    process = _start_python("for i in range(10000): print(i)", text=text)
+    capture.attach(process)
+    process.wait(timeout=10)
+    capture.close()
+
+    assert capture.lines == [OutputLine(stream="stdout", text=str(i)) for i in range(9990, 10000)]
+    assert capture.tail(2) == "[stdout] 9998\n[stdout] 9999"
+
+
+def test_stderr():
+    capture = OutputCapture()
+    process = _start_python("import sys\nprint('output')\nprint('error', file=sys.stderr)")
+    capture.attach(process)
+    process.wait(timeout=10)
+    capture.close()
+    assert sorted(capture.lines, key=lambda line: line.stream) == [
+        OutputLine(stream="stderr", text="error"),
+        OutputLine(stream="stdout", text="output"),
+    ]
+
+
+def test_long_lines_are_split():
+    capture = OutputCapture(max_line_length=10)
+    process = _start_python("print('x' * 25)")
+    capture.attach(process)
+    process.wait(timeout=10)
+    capture.close()
+    assert [line.text for line in capture.lines] == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_wait_ready():
+    capture = OutputCapture(ready_pattern=r"^ready on port \d+$")
+    process = _start_python(
+        "import time\nprint('starting')\nprint('ready on port 1234')\ntime.sleep(30)"
+    )
+    capture.attach(process)
+    try:
+        assert capture.wait_ready(timeout=10)
+        assert capture.ready
+    finally:
+        process.kill()
+        process.wait()
+        capture.close()
+
+
+def test_wait_ready_process_exited():
+    capture = OutputCapture(ready_pattern="ready")
+    process = _start_python("print('failed')")
+    capture.attach(process)
+    with pytest.raises(RuntimeError, match="closed its output"):
+        capture.wait_ready(timeout=10)
+    process.wait()
+    capture.close()
+
+
+def test_wait_ready_timeout():
+    capture = OutputCapture(ready_pattern="ready")
+    process = _start_python("import time\ntime.sleep(30)")
+    capture.attach(process)
+    try:
+        assert capture.wait_ready(timeout=0.2) is False
+    finally:
+        process.kill()
+        process.wait()
+        capture.close()
+
+
+def test_wait_ready_without_pattern():
+    assert OutputCapture().wait_ready(timeout=0) is None
+
+
+def test_attach_requires_pipes():
+    process = subprocess.Popen([sys.executable, "-c", "pass"], stdout=subprocess.PIPE)
+    try:
+        with pytest.raises(ValueError):
+            OutputCapture().attach(process)
+    finally:
+        process.communicate()
+
+
+def test_rotated_log_files(tmp_path):
+    log_file = tmp_path / "product.log"
+    capture = OutputCapture(log_file=log_file, max_log_bytes=1000, log_backup_count=2)
+    process = _start_python("for i in range(1000): print(f'line {i}')")
+    capture.attach(process)
+    process.wait(timeout=10)
+    capture.close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "product.log",
+        "product.log.1.gz",
+        "product.log.2.gz",
+    ]
+    assert log_file.read_text().splitlines()[-1].endswith("[stdout] line 999")
+    with gzip.open(tmp_path / "product.log.1.gz", "rt") as in_f:
+        assert "[stdout] line" in in_f.read()
@@ -0,0 +1,115 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'helpers.ports' module."""
+
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from ansys.tools.local_product_launcher.helpers import ports
+
+
+@pytest.fixture(autouse=True)
+def registry_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(ports, "_get_registry_dir", lambda: tmp_path / ports._REGISTRY_DIR_NAME)
+    return tmp_path / ports._REGISTRY_DIR_NAME
+
+
+def test_reserve_ports_unique():
+    with ports.reserve_ports(5) as first, ports.reserve_ports(5) as second:
+        assert len(set(first.ports) | set(second.ports)) == 10
+
+
+def test_reserve_no_ports():
+    with ports.reserve_ports(0) as reservation:
+        assert reservation.ports == []
+
+
+def test_reserve_negative_ports():
+    with pytest.raises(ValueError):
+        ports.reserve_ports(-1)
+
+
+def test_reserve_ports_skips_registered(registry_dir, monkeypatch):
+    with ports.reserve_ports(1) as reservation:
+        (port,) = reservation.ports
+        reservation.handoff()
+        # After the handoff, the OS may assign the same port again. Force
+        # this to check that the registry prevents the duplicate.
+        real_socket = socket.socket
+
+        class ReusingSocket(real_socket):
+            def bind(self, address):
+                if not getattr(ReusingSocket, "done", False):
+                    ReusingSocket.done = True
+                    address = (address[0], port)
+                super().bind(address)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(ports.socket, "socket", ReusingSocket)
+            with ports.reserve_ports(1) as other:
+                assert other.ports != [port]
+        assert not ports.FileLock(registry_dir / f"{port}.lock").try_acquire()
+    lock = ports.FileLock(registry_dir / f"{port}.lock")
+    assert lock.try_acquire()
+    lock.release()
+
+
+def test_handoff_frees_port():
+    with ports.reserve_ports(1) as reservation:
+        (port,) = reservation.ports
+        with socket.socket() as sock, pytest.raises(OSError):
+            sock.bind(("", port))
+        reservation.handoff()
+        with socket.socket() as sock:
+            sock.bind(("", port))
+
+
+def test_registration_of_exited_process_is_reused(registry_dir):
+    lock_path = registry_dir / "1234.lock"
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from ansys.tools.local_product_launcher._file_lock import FileLock; "
+            f"lock = FileLock({str(lock_path)!r}); "
+            "assert lock.try_acquire(); print('locked', flush=True); sys.stdin.read()",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout is not None
+        assert holder.stdout.readline().strip() == "locked"
+        lock = ports.FileLock(lock_path)
+        # The lock of a running process is never taken over.
+        assert not lock.try_acquire()
+    finally:
+        holder.communicate(input="")
+    # The operating system releases the lock when the process exits.
+    assert lock_path.exists()
+    assert lock.try_acquire()
+    lock.release()
@@ -0,0 +1,102 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'helpers.servers' module."""
+
+import threading
+import time
+
+import pytest
+
+from ansys.tools.local_product_launcher.helpers.servers import start_servers
+
+
+class FakeServers:
+    """Servers which respond to requests a fixed time after being started."""
+
+    def __init__(self, startup_durations):
+        self._startup_durations = startup_durations
+        self._lock = threading.Lock()
+        self.start_times = {}
+
+    def start_functions(self):
+        return {key: (lambda key=key: self._start(key)) for key in self._startup_durations}
+
+    def _start(self, key):
+        with self._lock:
+            self.start_times[key] = time.monotonic()
+
+    def check(self, key):
+        with self._lock:
+            start_time = self.start_times.get(key)
+        return start_time is not None and (
+            time.monotonic() - start_time >= self._startup_durations[key]
+        )
+
+
+def test_independent_servers_start_concurrently():
+    servers = FakeServers({"a": 0.2, "b": 0.2, "c": 0.2})
+    start_servers(servers.start_functions(), check=servers.check, timeout=5)
+    start_times = servers.start_times.values()
+    # Servers which others do not depend on are not waited for.
+    assert max(start_times) - min(start_times) < 0.1
+
+
+def test_dependencies_are_ready_before_start():
+    servers = FakeServers({"compute": 0.2, "files": 0.0, "gui": 0.0})
+    start_servers(
+        servers.start_functions(),
+        check=servers.check,
+        timeout=5,
+        dependencies={"gui": ["compute", "files"]},
+    )
+    start_times = servers.start_times
+    assert abs(start_times["compute"] - start_times["files"]) < 0.1
+    assert start_times["gui"] - start_times["compute"] >= 0.2
+
+
+def test_dependency_timeout_raises():
+    servers = FakeServers({"compute": 10, "files": 0})
+    with pytest.raises(TimeoutError, match="compute"):
+        start_servers(
+            servers.start_functions(),
+            check=servers.check,
+            timeout=0.2,
+            dependencies={"files": ["compute"]},
+        )
+    assert "files" not in servers.start_times
+
+
+@pytest.mark.parametrize(
+    "dependencies",
+    [{"a": ["unknown"]}, {"unknown": ["a"]}, {"a": ["b"], "b": ["a"]}],
+)
+def test_invalid_dependencies_raise(dependencies):
+    servers = FakeServers({"a": 0, "b": 0})
+    with pytest.raises(ValueError):
+        start_servers(
+            servers.start_functions(),
+            check=servers.check,
+            timeout=1,
+            dependencies=dependencies,
+        )
+    assert not servers.start_times
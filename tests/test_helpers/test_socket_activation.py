@@ -0,0 +1,121 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'helpers.socket_activation' module."""
+
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from ansys.tools.local_product_launcher.helpers import socket_activation
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Socket activation requires POSIX.")
+
+CHILD_SCRIPT = textwrap.dedent("""
+    import os
+    from ansys.tools.local_product_launcher.helpers.socket_activation import listen_fds
+
+    sockets = listen_fds()
+    for name, sock in sorted(sockets.items()):
+        conn, _ = sock.accept()
+        with conn:
+            conn.sendall(f"{name}:{os.environ.get('EXTRA_VAR')}:{os.getpid()}".encode())
+    """)
+
+
+def test_start_with_sockets(tmp_path):
+    tcp_sock = socket_activation.bind_tcp_socket()
+    uds_path = tmp_path / "test.sock"
+    uds_sock = socket_activation.bind_uds_socket(uds_path)
+    # Connect before the child is started: the connections are queued
+    # by the kernel until the child accepts them.
+    tcp_client = socket.create_connection(tcp_sock.getsockname())
+    uds_client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    uds_client.connect(str(uds_path))
+
+    process = socket_activation.start_with_sockets(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        {"a_tcp": tcp_sock, "b_uds": uds_sock},
+        env=os.environ | {"EXTRA_VAR": "value"},
+    )
+    tcp_sock.close()
+    uds_sock.close()
+    try:
+        with tcp_client, uds_client:
+            tcp_client.settimeout(30)
+            uds_client.settimeout(30)
+            # The PID of the returned process is the PID of the command.
+            assert tcp_client.recv(100) == f"a_tcp:value:{process.pid}".encode()
+            assert uds_client.recv(100) == f"b_uds:value:{process.pid}".encode()
+        assert process.wait(timeout=30) == 0
+    finally:
+        process.kill()
+
+
+def test_start_with_many_sockets():
+    # Enough sockets that their file descriptors are above 9, and overlap
+    # with the target range in reverse order.
+    sockets = [socket_activation.bind_tcp_socket() for _ in range(10)]
+    sockets.reverse()
+    expected_ports = [sock.getsockname()[1] for sock in sockets]
+    script = textwrap.dedent("""
+        import os
+        from ansys.tools.local_product_launcher.helpers.socket_activation import listen_fds
+
+        sockets = listen_fds()
+        ports = [sockets[f"unknown{i}"].getsockname()[1] for i in range(len(sockets))]
+        print(",".join(map(str, ports)))
+        print(",".join(sorted(os.listdir("/proc/self/fd"), key=int)))
+        """)
+    try:
+        process = socket_activation.start_with_sockets(
+            [sys.executable, "-c", script], sockets, stdout=subprocess.PIPE, text=True
+        )
+        stdout, _ = process.communicate(timeout=30)
+    finally:
+        for sock in sockets:
+            sock.close()
+    assert process.returncode == 0
+    ports_line, fds_line = stdout.splitlines()
+    assert ports_line == ",".join(map(str, expected_ports))
+    if sys.platform.startswith("linux"):
+        # Only the standard streams, the sockets (now owned by the socket
+        # objects), and the descriptor used by 'listdir' are open.
+        assert set(map(int, fds_line.split(","))) <= set(range(3 + len(sockets) + 1))
+
+
+def test_start_with_sockets_command_not_found():
+    with socket_activation.bind_tcp_socket() as sock:
+        process = socket_activation.start_with_sockets(
+            ["this-command-does-not-exist"], [sock], stderr=subprocess.DEVNULL
+        )
+    assert process.wait(timeout=30) == 127
+
+
+def test_listen_fds_other_pid(monkeypatch):
+    monkeypatch.setenv("LISTEN_PID", str(os.getpid() + 1))
+    monkeypatch.setenv("LISTEN_FDS", "1")
+    assert socket_activation.listen_fds() == {}
@@ -26,6 +26,7 @@ import subprocess
 import sys
 import tempfile
 
+from ansys.tools.local_product_launcher import events
 from ansys.tools.local_product_launcher.grpc_transport import UDSOptions
 from ansys.tools.local_product_launcher.helpers.grpc import check_grpc_health
 from ansys.tools.local_product_launcher.interface import (
@@ -78,6 +79,7 @@ class SimpleLauncher(LauncherProtocol[SimpleLauncherConfig]):
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             text=True,
+            env=events.child_environment(),
         )
 
     def stop(self, *, timeout=None):
@@ -85,6 +87,7 @@ class SimpleLauncher(LauncherProtocol[SimpleLauncherConfig]):
         try:
             self._process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
+            events.emit("kill-escalation", timeout=timeout)
             self._process.kill()
             self._process.wait()
         # If the server failed to so, remove the UDS file. Graceful
@@ -95,6 +98,10 @@ class SimpleLauncher(LauncherProtocol[SimpleLauncherConfig]):
         channel = self._transport_options.create_channel()
         return check_grpc_health(channel, timeout=timeout)
 
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid
+
     @property
     def transport_options(self):
         return {SERVER_KEY: self._transport_options}
@@ -27,6 +27,8 @@ import sys
 import grpc
 from grpc_health.v1 import health, health_pb2_grpc
 
+from ansys.tools.local_product_launcher.helpers.notify import notify
+
 
 def main(uds_dir: str):
     uds_file = pathlib.Path(uds_dir) / "simple_test_service.sock"
@@ -39,6 +41,8 @@ def main(uds_dir: str):
     print(f"Starting gRPC server with UDS file {uds_file}...")
     try:
         server.start()
+        # Report readiness if the launcher requested it.
+        notify("READY=1")
         server.wait_for_termination()
     finally:
         print("Shutting down gRPC server...")
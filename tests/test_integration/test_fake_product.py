@@ -0,0 +1,120 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the fake product launcher registered by the test package."""
+
+import os
+import time
+
+from ansys.tools.common.exceptions import ProductInstanceError
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product
+from ansys.tools.local_product_launcher._plugins import get_launcher
+from ansys.tools.local_product_launcher.helpers.grpc import check_grpc_health
+from pkg_with_entrypoint.fake_product import FakeProductConfig, FakeProductLauncher
+from pkg_with_entrypoint.fake_server import CRASH_EXIT_CODE
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="The fake product uses UDS.")
+
+PRODUCT_NAME = "fake_product"
+LAUNCH_MODE = "direct"
+
+
+def test_registered_entry_point():
+    assert get_launcher(product_name=PRODUCT_NAME, launch_mode=LAUNCH_MODE) is FakeProductLauncher
+
+
+def test_many_instances():
+    instances = [
+        launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=FakeProductConfig())
+        for _ in range(4)
+    ]
+    try:
+        for instance in instances:
+            instance.wait(timeout=10)
+        assert len({str(instance.transport_options["main"]) for instance in instances}) == 4
+    finally:
+        for instance in instances:
+            instance.stop()
+
+
+def test_startup_delay_and_rpc_latency():
+    config = FakeProductConfig(startup_delay=0.3, rpc_latency=0.2)
+    start_time = time.monotonic()
+    with launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config) as instance:
+        instance.wait(timeout=10)
+        assert time.monotonic() - start_time >= 0.3
+        check_start_time = time.monotonic()
+        assert check_grpc_health(instance.channels["main"], timeout=5)
+        assert time.monotonic() - check_start_time >= 0.2
+
+
+def test_notify_ready():
+    config = FakeProductConfig(notify_ready=True)
+    with launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config) as instance:
+        instance.wait(timeout=10)
+        assert instance._launcher._notify_socket.ready
+
+
+def test_crash():
+    config = FakeProductConfig(crash_probability=1.0)
+    instance = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config)
+    try:
+        with pytest.raises(ProductInstanceError):
+            instance.wait(timeout=2)
+        assert instance._launcher.returncode == CRASH_EXIT_CODE
+    finally:
+        instance.stop()
+
+
+def test_crash_reason_is_reported():
+    config = FakeProductConfig(crash_probability=1.0, notify_ready=True)
+    instance = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config)
+    try:
+        with pytest.raises(ProductInstanceError, match=f"exited with code {CRASH_EXIT_CODE}"):
+            instance.wait(timeout=10)
+    finally:
+        instance.stop()
+
+
+def test_seed_differs_per_instance():
+    config = FakeProductConfig(seed=42)
+    launchers = [FakeProductLauncher(config=config) for _ in range(2)]
+    try:
+        for launcher in launchers:
+            launcher.start()
+        seeds = {arg for launcher in launchers for arg in launcher._process.args if "--seed" in arg}
+        assert len(seeds) == 2
+    finally:
+        for launcher in launchers:
+            launcher.stop()
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="Requires procfs.")
+def test_memory_footprint():
+    config = FakeProductConfig(memory_mb=64)
+    with launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config) as instance:
+        instance.wait(timeout=10)
+        with open(f"/proc/{instance._launcher.pid}/status") as status_file:
+            (rss_line,) = (line for line in status_file if line.startswith("VmRSS:"))
+        assert int(rss_line.split()[1]) >= 64 * 1024
@@ -0,0 +1,86 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from grpc_health.v1.health_pb2 import HealthCheckRequest, HealthCheckResponse
+from grpc_health.v1.health_pb2_grpc import HealthStub
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product
+from ansys.tools.local_product_launcher.grpc_transport import UDSOptions
+from ansys.tools.local_product_launcher.instance_group import ProductInstanceGroup
+
+from .simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+PRODUCT_NAME = "TestProduct"
+LAUNCH_MODE = "direct"
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+
+
+@pytest.fixture
+def instances(tmp_path):
+    res = []
+    for i in range(2):
+        config = SimpleLauncherConfig()
+        # Use a separate UDS directory for each instance, instead of the
+        # one shared through the class attribute.
+        config.transport_options = UDSOptions(
+            uds_service="simple_test_service", uds_dir=tmp_path / str(i)
+        )
+        (tmp_path / str(i)).mkdir()
+        res.append(launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=config))
+    for instance in res:
+        instance.wait(timeout=10)
+    yield res
+    for instance in res:
+        if not instance.stopped:
+            instance.stop()
+
+
+def check_serving(group):
+    res = HealthStub(group.channel).Check(HealthCheckRequest(), timeout=10, wait_for_ready=True)
+    assert res.status == HealthCheckResponse.ServingStatus.SERVING
+
+
+def test_round_robin_channel(instances):
+    with ProductInstanceGroup(instances) as group:
+        for _ in range(4):
+            check_serving(group)
+
+
+def test_remove_instance(instances):
+    with ProductInstanceGroup(instances) as group:
+        check_serving(group)
+        old_channel = group.channel
+        group.remove(instances[0])
+        instances[0].stop()
+        assert group.channel is not old_channel
+        for _ in range(4):
+            check_serving(group)
+
+
+def test_empty_group_raises():
+    with pytest.raises(ValueError):
+        ProductInstanceGroup().channel
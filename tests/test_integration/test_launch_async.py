@@ -0,0 +1,131 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the non-blocking and lazy launch of products."""
+
+from ansys.tools.common.exceptions import ProductInstanceError
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product, launch_product_async
+from ansys.tools.local_product_launcher.helpers.grpc import check_grpc_health
+
+from .simple_test_launcher import SERVER_KEY, SimpleLauncher, SimpleLauncherConfig
+
+PRODUCT_NAME = "TestProduct"
+LAUNCH_MODE = "direct"
+UNHEALTHY_LAUNCH_MODE = "unhealthy"
+
+
+class UnhealthyLauncher(SimpleLauncher):
+    instances: list["UnhealthyLauncher"] = []
+
+    def __init__(self, *, config: SimpleLauncherConfig):
+        super().__init__(config=config)
+        self.instances.append(self)
+
+    def check(self, *, timeout=None):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    monkeypatch_entrypoints_from_plugins(
+        {PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher, UNHEALTHY_LAUNCH_MODE: UnhealthyLauncher}}
+    )
+
+
+def test_launch_async():
+    future = launch_product_async(
+        PRODUCT_NAME,
+        launch_mode=LAUNCH_MODE,
+        config=SimpleLauncherConfig(),
+        timeout=10,
+        connect_channels=True,
+    )
+    instance = future.result(timeout=20)
+    try:
+        assert not instance.stopped
+        assert check_grpc_health(instance.channels[SERVER_KEY], timeout=5)
+    finally:
+        instance.stop()
+
+
+def test_launch_async_failure_stops_instance(monkeypatch):
+    monkeypatch.setattr(UnhealthyLauncher, "instances", [])
+    future = launch_product_async(
+        PRODUCT_NAME,
+        launch_mode=UNHEALTHY_LAUNCH_MODE,
+        config=SimpleLauncherConfig(),
+        timeout=0.5,
+    )
+    with pytest.raises(ProductInstanceError):
+        future.result(timeout=20)
+    (launcher,) = UnhealthyLauncher.instances
+    assert launcher._process.poll() is not None
+
+
+def test_launch_async_invalid_config_raises_immediately():
+    with pytest.raises(TypeError):
+        launch_product_async(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=object())
+
+
+def test_lazy_launch():
+    instance = launch_product(
+        PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig(), lazy=True
+    )
+    assert instance.stopped
+    assert not hasattr(instance._launcher, "_process")
+
+    channel = instance.channels[SERVER_KEY]
+    assert not instance.stopped
+    instance.wait(timeout=10)
+    assert check_grpc_health(channel, timeout=5)
+    instance.stop()
+    assert instance.stopped
+
+
+def test_lazy_launch_unused():
+    with launch_product(
+        PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig(), lazy=True
+    ) as instance:
+        pass
+    assert instance.stopped
+    assert not hasattr(instance._launcher, "_process")
+
+
+def test_lazy_launch_cancelled():
+    instance = launch_product(
+        PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig(), lazy=True
+    )
+    instance.stop()
+    with pytest.raises(ProductInstanceError):
+        instance.channels
+    with pytest.raises(ProductInstanceError):
+        instance.check()
+    assert not hasattr(instance._launcher, "_process")
+
+    instance.start()
+    try:
+        instance.wait(timeout=10)
+        assert check_grpc_health(instance.channels[SERVER_KEY], timeout=5)
+    finally:
+        instance.stop()
@@ -0,0 +1,92 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product
+from ansys.tools.local_product_launcher.helpers.notify import NotifySocket, notify
+from ansys.tools.local_product_launcher.interface import SupportsReadinessNotification
+
+from .simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Readiness notification requires POSIX.")
+
+PRODUCT_NAME = "TestProduct"
+LAUNCH_MODE = "notify"
+
+
+class NotifyingLauncher(SimpleLauncher):
+    def start(self):
+        self._notify_socket = NotifySocket()
+        self._process = subprocess.Popen(
+            [sys.executable, self._script_path, str(self._uds_dir)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=os.environ | self._notify_socket.env,
+        )
+
+    def stop(self, *, timeout=None):
+        super().stop(timeout=timeout)
+        self._notify_socket.close()
+
+    def check(self, *, timeout=None):
+        raise AssertionError("The health check should not be called.")
+
+    def wait_ready(self, *, timeout):
+        return self._notify_socket.wait_ready(timeout, process=self._process)
+
+
+@pytest.fixture(autouse=True)
+def monkeypatch_entrypoints(monkeypatch_entrypoints_from_plugins):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: NotifyingLauncher}})
+
+
+def test_wait_uses_notification():
+    assert isinstance(
+        NotifyingLauncher(config=SimpleLauncherConfig()), SupportsReadinessNotification
+    )
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    try:
+        server.wait(timeout=10)
+        assert server._launcher._notify_socket.ready
+    finally:
+        server.stop()
+
+
+def test_notify_socket_status(monkeypatch):
+    with NotifySocket() as notify_socket:
+        monkeypatch.setenv("NOTIFY_SOCKET", str(notify_socket.path))
+        assert not notify_socket.wait_ready(timeout=0.01)
+        assert notify("STATUS=loading\nERRNO=2")
+        with pytest.raises(RuntimeError, match="error 2 .* with status 'loading'"):
+            notify_socket.wait_ready(timeout=1)
+        assert notify_socket.status == "loading"
+        assert notify_socket.errno == 2
+
+
+def test_notify_without_socket(monkeypatch):
+    monkeypatch.delenv("NOTIFY_SOCKET", raising=False)
+    assert not notify()
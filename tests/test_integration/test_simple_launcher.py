@@ -23,9 +23,11 @@
 from dataclasses import dataclass
 import pathlib
 
+import grpc
 import pytest
 
 from ansys.tools.local_product_launcher import config, launch_product
+from ansys.tools.local_product_launcher.product_instance import ProductInstance
 
 from .simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
 
@@ -70,6 +72,27 @@ def test_explicit_config():
     check_uds_file_removed(server)
 
 
+def get_connectivity_state(channel):
+    # Unlike 'grpc.channel_ready_future', this does not connect the channel.
+    state = channel._channel.check_connectivity_state(False)
+    return next(
+        connectivity for connectivity in grpc.ChannelConnectivity if connectivity.value[0] == state
+    )
+
+
+@pytest.mark.parametrize(
+    "connect_channels,expected_state",
+    [(True, grpc.ChannelConnectivity.READY), (False, grpc.ChannelConnectivity.IDLE)],
+)
+def test_wait_connect_channels(connect_channels, expected_state):
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    assert isinstance(server, ProductInstance)
+    server.wait(timeout=10, connect_channels=connect_channels)
+    assert get_connectivity_state(server.channels["main"]) == expected_state
+    server.stop()
+    check_uds_file_removed(server)
+
+
 def test_stop_with_timeout():
     server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
     server.wait(timeout=10)
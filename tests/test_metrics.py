@@ -0,0 +1,103 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'metrics' module."""
+
+import urllib.request
+
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product, metrics
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+PRODUCT_NAME = "MetricsTestProduct"
+LAUNCH_MODE = "direct"
+LABELS = {"product": PRODUCT_NAME, "launch_mode": LAUNCH_MODE}
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.MetricsRegistry()
+    counter = registry.counter("test_total", "A counter.", ("name",))
+    counter.inc(name='a"b')
+    counter.inc(2, name="c")
+    histogram = registry.histogram("test_seconds", "A histogram.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+    return registry
+
+
+def test_text_format(registry):
+    assert metrics.generate_text(registry) == (
+        "# HELP test_total A counter.\n"
+        "# TYPE test_total counter\n"
+        'test_total{name="a\\"b"} 1.0\n'
+        'test_total{name="c"} 2.0\n'
+        "# HELP test_seconds A histogram.\n"
+        "# TYPE test_seconds histogram\n"
+        'test_seconds_bucket{le="0.1"} 1\n'
+        'test_seconds_bucket{le="1.0"} 2\n'
+        'test_seconds_bucket{le="+Inf"} 3\n'
+        "test_seconds_sum 5.55\n"
+        "test_seconds_count 3\n"
+    )
+
+
+def test_invalid_labels_raise(registry):
+    with pytest.raises(ValueError):
+        metrics.Counter("other_total", "", ("name",)).inc(other="a")
+
+
+def test_write_text_file(registry, tmp_path):
+    path = tmp_path / "metrics.prom"
+    metrics.write_text_file(path, registry)
+    assert path.read_text() == metrics.generate_text(registry)
+
+
+def test_http_server(registry):
+    server = metrics.start_http_server(registry=registry)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as res:
+            assert res.read().decode() == metrics.generate_text(registry)
+    finally:
+        server.shutdown()
+
+
+def test_lifecycle_metrics(monkeypatch_entrypoints_from_plugins):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    started = metrics.LAUNCHES_STARTED.get(**LABELS)
+    succeeded = metrics.LAUNCHES_SUCCEEDED.get(**LABELS)
+    ready_count = metrics.LAUNCH_READY_SECONDS.get_count(**LABELS)
+    stop_count = metrics.STOP_SECONDS.get_count(**LABELS)
+
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    assert metrics.LIVE_INSTANCES.get(**LABELS) == 1
+    server.wait(timeout=10)
+    server.stop()
+
+    assert metrics.LAUNCHES_STARTED.get(**LABELS) == started + 1
+    assert metrics.LAUNCHES_SUCCEEDED.get(**LABELS) == succeeded + 1
+    assert metrics.LAUNCH_READY_SECONDS.get_count(**LABELS) == ready_count + 1
+    assert metrics.STOP_SECONDS.get_count(**LABELS) == stop_count + 1
+    assert metrics.LIVE_INSTANCES.get(**LABELS) == 0
+    assert metrics.HEALTH_CHECK_SECONDS.get_count(result="serving") >= 1
@@ -0,0 +1,205 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the health checks of the 'ProductInstance' class."""
+
+from dataclasses import dataclass
+import functools
+import json
+import threading
+import time
+
+import pytest
+
+from ansys.tools.local_product_launcher import events, metrics
+from ansys.tools.local_product_launcher.helpers.servers import start_servers
+from ansys.tools.local_product_launcher.interface import LauncherProtocol, ServerType
+from ansys.tools.local_product_launcher.product_instance import (
+    HealthCheckPolicy,
+    ProductInstance,
+)
+
+
+def test_default_policy_always_checks(make_counting_instance):
+    instance = make_counting_instance()
+    for _ in range(3):
+        assert instance.check()
+    assert instance._launcher.num_checks == 3
+
+
+def test_cached_result_is_reused(make_counting_instance):
+    instance = make_counting_instance(HealthCheckPolicy(cache_ttl=0.2))
+    skipped = metrics.HEALTH_CHECKS_SKIPPED.get(
+        product="CountingProduct", launch_mode="direct", reason="cached"
+    )
+    assert instance.check()
+    instance._launcher.healthy = False
+    assert instance.check()
+    assert instance._launcher.num_checks == 1
+    assert (
+        metrics.HEALTH_CHECKS_SKIPPED.get(
+            product="CountingProduct", launch_mode="direct", reason="cached"
+        )
+        == skipped + 1
+    )
+
+    assert not instance.check(force=True)
+    assert instance._launcher.num_checks == 2
+
+    time.sleep(0.2)
+    assert not instance.check()
+    assert instance._launcher.num_checks == 3
+
+
+def test_wait_bypasses_and_seeds_cache(make_counting_instance):
+    instance = make_counting_instance(HealthCheckPolicy(cache_ttl=10))
+    instance._launcher.healthy = False
+    assert not instance.check()
+    instance._launcher.healthy = True
+    instance.wait(timeout=1)
+    num_checks = instance._launcher.num_checks
+    assert instance.check()
+    assert instance._launcher.num_checks == num_checks
+
+
+def test_circuit_breaker(make_counting_instance):
+    instance = make_counting_instance(HealthCheckPolicy(failure_threshold=2, reset_timeout=0.2))
+    instance._launcher.healthy = False
+    assert not instance.check()
+    assert not instance.circuit_open
+    assert not instance.check()
+    assert instance.circuit_open
+
+    # While the circuit breaker is open, no checks are made.
+    assert not instance.check()
+    assert instance._launcher.num_checks == 2
+
+    # After the reset timeout, a failed trial check opens the circuit breaker again.
+    time.sleep(0.2)
+    assert not instance.check()
+    assert instance._launcher.num_checks == 3
+    assert not instance.check()
+    assert instance._launcher.num_checks == 3
+
+    # A successful trial check closes it.
+    instance._launcher.healthy = True
+    time.sleep(0.2)
+    assert instance.check()
+    assert not instance.circuit_open
+    assert instance.check()
+    assert instance._launcher.num_checks == 5
+
+
+def test_restart_resets_circuit_breaker(make_counting_instance):
+    instance = make_counting_instance(HealthCheckPolicy(failure_threshold=1, reset_timeout=10))
+    instance._launcher.healthy = False
+    assert not instance.check()
+    assert instance.circuit_open
+    instance.restart()
+    assert not instance.circuit_open
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"cache_ttl": -1}, {"failure_threshold": 0}, {"reset_timeout": -1}]
+)
+def test_invalid_policy_raises(kwargs):
+    with pytest.raises(ValueError):
+        HealthCheckPolicy(**kwargs)
+
+
+@dataclass
+class MultiServerConfig:
+    pass
+
+
+class MultiServerLauncher(LauncherProtocol[MultiServerConfig]):
+    """Launcher without a process, whose file server depends on its compute server."""
+
+    CONFIG_MODEL = MultiServerConfig
+    SERVER_SPEC = {"compute": ServerType.GENERIC, "files": ServerType.GENERIC}
+    CHECK_DURATION = 0.2
+
+    def __init__(self, *, config: MultiServerConfig):
+        self.healthy = {"compute": True, "files": True}
+        self.started: list[str] = []
+        self.check_threads: set[str] = set()
+
+    def start(self) -> None:
+        self.started = []
+        start_servers(
+            {key: functools.partial(self.started.append, key) for key in self.SERVER_SPEC},
+            check=lambda key: self.check_server(key, timeout=1),
+            dependencies={"files": ["compute"]},
+            timeout=1,
+        )
+
+    def stop(self, *, timeout: float | None = None) -> None:
+        pass
+
+    def check(self, *, timeout: float | None = None) -> bool:
+        raise AssertionError("The servers should be checked separately.")
+
+    def check_server(self, key: str, *, timeout: float | None = None) -> bool:
+        self.check_threads.add(threading.current_thread().name)
+        time.sleep(self.CHECK_DURATION)
+        return key in self.started and self.healthy[key]
+
+    @property
+    def urls(self) -> dict[str, str]:
+        return {"compute": "localhost:0", "files": "localhost:1"}
+
+    @property
+    def transport_options(self):
+        return {}
+
+
+def test_servers_are_checked_concurrently(tmp_path):
+    event_log_path = tmp_path / "events.jsonl"
+    events.set_event_log(event_log_path)
+    try:
+        instance = ProductInstance(launcher=MultiServerLauncher(config=MultiServerConfig()))
+        assert instance._launcher.started == ["compute", "files"]
+        instance._launcher.check_threads.clear()
+        start_time = time.monotonic()
+        instance.wait(timeout=5)
+        assert time.monotonic() - start_time < 2 * MultiServerLauncher.CHECK_DURATION
+        assert len(instance._launcher.check_threads) == 2
+
+        instance._launcher.healthy["files"] = False
+        assert instance.check_servers() == {"compute": True, "files": False}
+        assert not instance.check()
+        instance.stop()
+    finally:
+        events.set_event_log(None)
+
+    records = [json.loads(line) for line in event_log_path.read_text().splitlines()]
+    assert sorted(record["server"] for record in records if record["event"] == "server-ready") == [
+        "compute",
+        "files",
+    ]
+
+
+def test_check_servers_without_server_checks(make_counting_instance):
+    instance = make_counting_instance()
+    assert instance.check_servers() == {"main": True}
+    instance._launcher.healthy = False
+    assert instance.check_servers() == {"main": False}
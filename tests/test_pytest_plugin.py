@@ -0,0 +1,222 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the pytest plugin."""
+
+import json
+import logging
+import pathlib
+import threading
+import time
+
+import pytest
+
+from ansys.tools.local_product_launcher.grpc_transport import UDSOptions
+from ansys.tools.local_product_launcher.product_instance import ProductInstance
+from ansys.tools.local_product_launcher.pytest_plugin import (
+    ProductInstancePool,
+    SharedProductInstance,
+)
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+pytest_plugins = ["pytester"]
+
+TESTS_DIR = pathlib.Path(__file__).parent
+
+CONFTEST = """
+import importlib.metadata
+from unittest.mock import Mock
+
+import ansys.tools.common.launcher._plugins as common_plugins
+from ansys.tools.local_product_launcher import _plugins
+from ansys.tools.local_product_launcher.pytest_plugin import product_instance_fixture
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+pytest_plugins = ["ansys.tools.local_product_launcher.pytest_plugin"]
+
+entry_point = Mock(spec=importlib.metadata.EntryPoint)
+entry_point.name = "PluginTestProduct.direct"
+entry_point.load = Mock(return_value=SimpleLauncher)
+_plugins._get_entry_points = common_plugins._get_entry_points = lambda: [entry_point]
+
+server = product_instance_fixture(
+    "PluginTestProduct", launch_mode="direct", config=SimpleLauncherConfig(), shared={shared}
+)
+"""
+
+TESTS = """
+import json
+import os
+import pathlib
+
+import pytest
+
+@pytest.mark.parametrize("index", range(4))
+def test_server(server, index):
+    assert server.check(timeout=5)
+    record = {{
+        "pid": os.getpid(),
+        "instance": id(server),
+        "uds_dir": str(server.transport_options["main"].uds_dir),
+    }}
+    with open({output_path!r}, "a") as out_f:
+        out_f.write(json.dumps(record) + "\\n")
+"""
+
+
+@pytest.fixture
+def run_tests(pytester, monkeypatch, tmp_path):
+    monkeypatch.setenv("PYTHONPATH", str(TESTS_DIR))
+    output_path = tmp_path / "output.jsonl"
+
+    def inner(*args, shared):
+        pytester.makeconftest(CONFTEST.format(shared=shared))
+        pytester.makepyfile(TESTS.format(output_path=str(output_path)))
+        result = pytester.runpytest_subprocess(*args)
+        records = [json.loads(line) for line in output_path.read_text().splitlines()]
+        return result, records
+
+    return inner
+
+
+def test_session_instance_reused(run_tests):
+    result, records = run_tests(shared=False)
+    result.assert_outcomes(passed=4)
+    assert len({record["instance"] for record in records}) == 1
+
+
+def test_instance_per_worker(run_tests):
+    pytest.importorskip("xdist")
+    result, records = run_tests("-n", "2", "-p", "xdist", shared=False)
+    result.assert_outcomes(passed=4)
+    pids = {record["pid"] for record in records}
+    uds_dirs = {record["uds_dir"] for record in records}
+    assert len(uds_dirs) == len(pids)
+
+
+def test_instance_shared_between_workers(run_tests):
+    pytest.importorskip("xdist")
+    result, records = run_tests("-n", "2", "-p", "xdist", shared=True)
+    result.assert_outcomes(passed=4)
+    assert len({record["uds_dir"] for record in records}) == 1
+
+
+@pytest.fixture
+def make_pool(monkeypatch_entrypoints_from_plugins, tmp_path):
+    monkeypatch_entrypoints_from_plugins(
+        {"PoolTestProduct": {"first": SimpleLauncher, "second": SimpleLauncher}}
+    )
+    coordination_dir = tmp_path / "coordination"
+    pools = []
+
+    def inner(**kwargs):
+        pool = ProductInstancePool(coordination_dir=coordination_dir, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield inner
+    for pool in pools:
+        pool.close()
+
+
+@pytest.fixture
+def get_shared(tmp_path):
+    def inner(pool, launch_mode):
+        config = SimpleLauncherConfig()
+        # Use a separate UDS directory for each launch, instead of the
+        # one shared through the class attribute.
+        uds_dir = tmp_path / launch_mode
+        uds_dir.mkdir(exist_ok=True)
+        config.transport_options = UDSOptions(uds_service="simple_test_service", uds_dir=uds_dir)
+        return pool.get(
+            "PoolTestProduct", launch_mode=launch_mode, config=config, shared=True, timeout=10
+        )
+
+    return inner
+
+
+def close_concurrently(*pools):
+    threads = [threading.Thread(target=pool.close, daemon=True) for pool in pools]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=20)
+    return not any(thread.is_alive() for thread in threads)
+
+
+def test_pool_shares_instance(make_pool, get_shared):
+    pool_a, pool_b = make_pool(), make_pool()
+    instance = get_shared(pool_a, "first")
+    shared_instance = get_shared(pool_b, "first")
+    assert isinstance(instance, ProductInstance)
+    assert isinstance(shared_instance, SharedProductInstance)
+    assert shared_instance.check(timeout=5)
+
+    assert close_concurrently(pool_a, pool_b)
+    assert instance.stopped
+
+
+def test_pool_crossed_release_does_not_deadlock(make_pool, get_shared):
+    pool_a, pool_b = make_pool(), make_pool()
+    first = get_shared(pool_a, "first")
+    second = get_shared(pool_b, "second")
+    get_shared(pool_a, "second")
+    get_shared(pool_b, "first")
+
+    assert close_concurrently(pool_a, pool_b)
+    assert first.stopped
+    assert second.stopped
+
+
+def test_pool_ignores_exited_users(make_pool, get_shared):
+    pool_a, pool_b = make_pool(release_timeout=60), make_pool()
+    instance = get_shared(pool_a, "first")
+    get_shared(pool_b, "first")
+    # Releasing the user lock has the same effect as the process exiting.
+    pool_b._user_lock.release()
+
+    start_time = time.monotonic()
+    pool_a.close()
+    assert time.monotonic() - start_time < 10
+    assert instance.stopped
+
+
+def test_pool_takes_over_from_exited_owner(make_pool, get_shared):
+    pool_a, pool_b = make_pool(), make_pool()
+    instance = get_shared(pool_a, "first")
+    pool_a._user_lock.release()
+    instance.stop()
+
+    new_instance = get_shared(pool_b, "first")
+    assert isinstance(new_instance, ProductInstance)
+    assert new_instance.check(timeout=5)
+
+
+def test_pool_release_timeout(make_pool, get_shared, caplog):
+    pool_a, pool_b = make_pool(release_timeout=0.5), make_pool()
+    instance = get_shared(pool_a, "first")
+    get_shared(pool_b, "first")
+
+    with caplog.at_level(logging.WARNING):
+        pool_a.close()
+    assert instance.stopped
+    assert "still used by 1 other process" in caplog.text
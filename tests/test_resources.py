@@ -0,0 +1,114 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for the 'resources' module."""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from ansys.tools.local_product_launcher import launch_product, resources
+from ansys.tools.local_product_launcher.interface import SupportsProcessId
+from test_integration.simple_test_launcher import SimpleLauncher, SimpleLauncherConfig
+
+pytestmark = pytest.mark.skipif(sys.platform != "linux", reason="Requires /proc.")
+
+PRODUCT_NAME = "ResourcesTestProduct"
+LAUNCH_MODE = "direct"
+
+_CHILD_SCRIPT = (
+    "import subprocess, sys, time; "
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+    "time.sleep(30)"
+)
+
+
+@pytest.fixture
+def sampler():
+    sampler = resources.enable_resource_sampling(interval=0.05, maxlen=5)
+    yield sampler
+    resources.disable_resource_sampling()
+
+
+def test_sample_process_tree():
+    process = subprocess.Popen([sys.executable, "-c", _CHILD_SCRIPT])
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            sample = resources._sample_process_tree(process.pid)
+            assert sample is not None
+            if sample.num_processes == 2 or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        assert sample.num_processes == 2
+        assert sample.rss_bytes > 0
+        assert sample.num_threads >= 2
+        assert sample.num_fds >= 6
+    finally:
+        children = resources._get_children_map().get(process.pid, [])
+        process.kill()
+        process.wait()
+        for child in children:
+            os.kill(child, signal.SIGKILL)
+    assert resources._sample_process_tree(process.pid) is None
+
+
+def test_ring_buffer_is_bounded(sampler):
+    tracker = sampler.track(os.getpid())
+    try:
+        time.sleep(0.5)
+    finally:
+        sampler.untrack(tracker)
+    assert len(tracker.samples) == 5
+    summary = tracker.summary()
+    assert summary.num_samples > 5
+    assert summary.peak_rss_bytes >= max(sample.rss_bytes for sample in tracker.samples)
+
+
+def test_product_instance_summary(monkeypatch_entrypoints_from_plugins, sampler):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    assert isinstance(server._launcher, SupportsProcessId)
+    server.wait(timeout=10)
+    time.sleep(0.2)
+    assert server.resource_samples
+    assert server.resource_summary is None
+    server.stop()
+
+    summary = server.resource_summary
+    assert summary is not None
+    assert summary.peak_rss_bytes > 0
+    assert summary.cpu_seconds > 0
+    # The CPU time is read from the last sample, taken right before stopping.
+    assert summary.cpu_seconds == server.resource_samples[-1].cpu_seconds
+
+
+def test_sampling_disabled(monkeypatch_entrypoints_from_plugins):
+    monkeypatch_entrypoints_from_plugins({PRODUCT_NAME: {LAUNCH_MODE: SimpleLauncher}})
+    server = launch_product(PRODUCT_NAME, launch_mode=LAUNCH_MODE, config=SimpleLauncherConfig())
+    server.stop()
+    assert server.resource_samples == []
+    assert server.resource_summary is None
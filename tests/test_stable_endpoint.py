@@ -0,0 +1,160 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tests for stable endpoints of the 'ProductInstance' class."""
+
+import os
+import pathlib
+import tempfile
+
+import pytest
+
+from ansys.tools.local_product_launcher import metrics, product_instance
+from ansys.tools.local_product_launcher.grpc_transport import UDSOptions
+from ansys.tools.local_product_launcher.helpers.grpc import check_grpc_health
+from ansys.tools.local_product_launcher.product_instance import ProductInstance
+from test_integration.simple_test_launcher import (
+    SERVER_KEY,
+    SimpleLauncher,
+    SimpleLauncherConfig,
+)
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Stable endpoints require POSIX.")
+
+
+class MovingLauncher(SimpleLauncher):
+    """Launcher which uses a new UDS directory each time it is started."""
+
+    def __init__(self, *, config: SimpleLauncherConfig, base_dir):
+        super().__init__(config=config)
+        self._base_dir = base_dir
+
+    def start(self):
+        self._uds_dir = tempfile.mkdtemp(dir=self._base_dir)
+        self._transport_options = UDSOptions(
+            uds_service="simple_test_service", uds_dir=self._uds_dir
+        )
+        self._uds_file = pathlib.Path(self._uds_dir) / "simple_test_service.sock"
+        super().start()
+
+
+@pytest.fixture
+def stable_dir():
+    # The path of a socket is limited to about 100 characters, which the
+    # pytest temporary directories may exceed.
+    with tempfile.TemporaryDirectory() as stable_dir:
+        yield pathlib.Path(stable_dir)
+
+
+@pytest.fixture
+def instance(tmp_path, stable_dir):
+    config = SimpleLauncherConfig()
+    config.transport_options = UDSOptions(
+        uds_service="simple_test_service", uds_dir=tmp_path / "initial"
+    )
+    (tmp_path / "initial").mkdir()
+    (tmp_path / "servers").mkdir()
+    instance = ProductInstance(
+        launcher=MovingLauncher(config=config, base_dir=tmp_path / "servers"),
+        product_name="StableProduct",
+        launch_mode="direct",
+        stable_endpoint_dir=stable_dir,
+    )
+    yield instance
+    if not instance.stopped:
+        instance.stop()
+
+
+def test_channel_survives_restart(instance, stable_dir):
+    instance.wait(timeout=10, connect_channels=True)
+    channel = instance.channels[SERVER_KEY]
+    stable_options = instance.transport_options[SERVER_KEY]
+    assert stable_options.uds_dir == stable_dir
+    (stable_path,) = stable_dir.iterdir()
+    first_target = os.readlink(stable_path)
+    assert check_grpc_health(channel, timeout=5)
+
+    instance.restart()
+    instance.wait(timeout=10, connect_channels=True)
+    assert instance.channels[SERVER_KEY] is channel
+    assert instance.transport_options[SERVER_KEY] == stable_options
+    assert os.readlink(stable_path) != first_target
+    assert check_grpc_health(channel, timeout=5)
+
+    instance.stop()
+    assert not stable_path.exists() and not stable_path.is_symlink()
+    # The channel is closed once the instance is stopped.
+    with pytest.raises(ValueError, match="closed channel"):
+        channel.unary_unary("/test/Method")(b"", timeout=5)
+
+
+def test_without_stable_endpoint_dir(tmp_path):
+    config = SimpleLauncherConfig()
+    config.transport_options = UDSOptions(uds_service="simple_test_service", uds_dir=tmp_path)
+    instance = ProductInstance(launcher=SimpleLauncher(config=config))
+    try:
+        assert instance.transport_options[SERVER_KEY] is config.transport_options
+        instance.wait(timeout=10)
+    finally:
+        instance.stop()
+
+
+def test_relative_server_dir(tmp_path, stable_dir, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pathlib.Path("servers").mkdir()
+    config = SimpleLauncherConfig()
+    config.transport_options = UDSOptions(uds_service="simple_test_service", uds_dir=tmp_path)
+    instance = ProductInstance(
+        launcher=MovingLauncher(config=config, base_dir="servers"),
+        stable_endpoint_dir=stable_dir,
+    )
+    try:
+        (stable_path,) = stable_dir.iterdir()
+        assert os.path.isabs(os.readlink(stable_path))
+        instance.wait(timeout=10)
+        assert check_grpc_health(instance.channels[SERVER_KEY], timeout=5)
+    finally:
+        instance.stop()
+
+
+def test_stable_endpoint_failure_stops_launcher(tmp_path, stable_dir, monkeypatch):
+    def fail(path, *, target):
+        raise OSError("Cannot create the link.")
+
+    monkeypatch.setattr(product_instance, "_swap_symlink", fail)
+    config = SimpleLauncherConfig()
+    config.transport_options = UDSOptions(uds_service="simple_test_service", uds_dir=tmp_path)
+    launcher = SimpleLauncher(config=config)
+    labels = {"product": "StableProduct", "launch_mode": "direct"}
+    live_instances = metrics.LIVE_INSTANCES.get(**labels)
+    instance = ProductInstance(
+        launcher=launcher,
+        product_name="StableProduct",
+        launch_mode="direct",
+        stable_endpoint_dir=stable_dir,
+        lazy=True,
+    )
+    with pytest.raises(OSError):
+        instance.start()
+    assert instance.stopped
+    assert launcher._process.poll() is not None
+    assert metrics.LIVE_INSTANCES.get(**labels) == live_instances